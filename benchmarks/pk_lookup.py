@@ -0,0 +1,90 @@
+"""Microbenchmark for primary-key lookups.
+
+Compares the previous ``session.query(...).filter(pk == id).first()`` lookup
+with BaseRepository.get(), which reuses a pre-built SELECT and consults the
+identity map first. Runs against an in-memory SQLite database:
+
+    python benchmarks/pk_lookup.py [--rows N] [--lookups N]
+"""
+
+import argparse
+import os
+import time
+from typing import Callable
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from applepy.db import Base  # noqa: E402
+from applepy.domains.offices.models import Office  # noqa: E402
+from applepy.domains.offices.repository import OfficeRepository  # noqa: E402
+
+
+def _timed(label: str, lookups: int, fn: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<44} {elapsed * 1e6 / lookups:8.1f} us/lookup")
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print per-lookup timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Office.__table__])  # type: ignore[list-item]
+    codes = [f"B{i:05d}" for i in range(args.rows)]
+    with Session(engine) as session:
+        session.add_all(Office(office_code=code, city="Bench") for code in codes)
+        session.commit()
+
+    keys = [codes[i % len(codes)] for i in range(args.lookups)]
+
+    # Warm up the connection pool and SQLAlchemy's compiled cache
+    with Session(engine) as session:
+        session.query(Office).filter(Office.office_code == codes[0]).first()
+        OfficeRepository(session).get(codes[0])
+
+    def query_first_fresh() -> None:
+        for code in keys:
+            with Session(engine) as session:
+                session.query(Office).filter(Office.office_code == code).first()
+
+    def repo_get_fresh() -> None:
+        for code in keys:
+            with Session(engine) as session:
+                OfficeRepository(session).get(code)
+
+    def query_first_same_session() -> None:
+        with Session(engine) as session:
+            for code in keys:
+                session.query(Office).filter(Office.office_code == code).first()
+
+    def repo_get_same_session() -> None:
+        with Session(engine) as session:
+            repo = OfficeRepository(session)
+            for code in keys:
+                repo.get(code)
+
+    print(f"{args.lookups} lookups over {args.rows} rows\n")
+    print("New session per lookup (one GET request each):")
+    before = _timed("  query().filter().first()", args.lookups, query_first_fresh)
+    after = _timed("  BaseRepository.get()", args.lookups, repo_get_fresh)
+    print(f"  speedup: {before / after:.2f}x\n")
+
+    print("Repeated lookups in one session (identity map):")
+    before = _timed(
+        "  query().filter().first()", args.lookups, query_first_same_session
+    )
+    after = _timed("  BaseRepository.get()", args.lookups, repo_get_same_session)
+    print(f"  speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
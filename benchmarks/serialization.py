@@ -0,0 +1,134 @@
+"""Benchmark the CPU cost of serializing large listings.
+
+Loads 10,000 orders and 10,000 payments into an in-memory SQLite database and
+times turning the loaded entities into a JSON response body, the work a
+``GET /orders`` or ``GET /payments`` request does after its query:
+
+- before: ``model_validate`` per row, ``ApiResponse(...).model_dump()`` and
+  Flask's JSON encoder (``jsonify`` of dumped dicts for payments)
+- after: one TypeAdapter validation of the whole list and pydantic-core
+  encoding the envelope straight to bytes (applepy.serialization)
+
+Times are CPU time per request:
+
+    python benchmarks/serialization.py [--rows N] [--requests N]
+"""
+
+import argparse
+import os
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from flask import Flask  # noqa: E402
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from applepy.db import Base  # noqa: E402
+
+# Mapped classes referenced by Order's relationships
+from applepy.domains.customers.models import Customer  # noqa: E402, F401
+from applepy.domains.employees.models import Employee  # noqa: E402, F401
+from applepy.domains.offices.models import Office  # noqa: E402, F401
+from applepy.domains.order_details.models import OrderDetail  # noqa: E402, F401
+from applepy.domains.order_totals.models import OrderTotal  # noqa: E402, F401
+from applepy.domains.orders.models import Order  # noqa: E402
+from applepy.domains.orders.schemas import OrderRecord  # noqa: E402
+from applepy.domains.payments.models import Payment  # noqa: E402
+from applepy.domains.payments.schemas import PaymentRecord  # noqa: E402
+from applepy.domains.product_lines.models import ProductLine  # noqa: E402, F401
+from applepy.domains.products.models import Product  # noqa: E402, F401
+from applepy.responses import ApiResponse, ListResponse  # noqa: E402
+from applepy.serialization import list_json, records_json, validate_all  # noqa: E402
+
+
+def _timed(label: str, requests: int, fn: Callable[[], Any]) -> float:
+    fn()  # warm up schema and serializer caches
+    start = time.process_time()
+    for _ in range(requests):
+        fn()
+    elapsed = (time.process_time() - start) / requests
+    print(f"{label:<44} {elapsed * 1e3:8.1f} ms CPU/request")
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print per-request CPU times."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine,
+        tables=[Order.__table__, Payment.__table__],  # type: ignore[list-item]
+    )
+    start = date(2003, 1, 6)
+    with Session(engine) as session:
+        session.add_all(
+            Order(
+                order_number=10100 + i,
+                order_date=start + timedelta(days=i % 900),
+                required_date=start + timedelta(days=i % 900 + 7),
+                shipped_date=start + timedelta(days=i % 900 + 2),
+                status="Shipped",
+                comments="Check on availability." if i % 3 == 0 else None,
+                customer_number=103 + i % 120,
+            )
+            for i in range(args.rows)
+        )
+        session.add_all(
+            Payment(
+                customer_number=103 + i % 120,
+                check_number=f"HQ{i:08d}",
+                payment_date=start + timedelta(days=i % 900),
+                amount=Decimal("6066.78") + i,
+            )
+            for i in range(args.rows)
+        )
+        session.commit()
+
+    app = Flask(__name__)
+    app.json.sort_keys = True  # type: ignore[attr-defined]
+
+    with Session(engine) as session, app.app_context():
+        orders = session.scalars(select(Order)).all()
+        payments = session.scalars(select(Payment)).all()
+
+        def orders_before() -> bytes:
+            records = [OrderRecord.model_validate(entity) for entity in orders]
+            response = ApiResponse(data=ListResponse(items=records, count=len(records)))
+            return app.json.dumps(response.model_dump()).encode()
+
+        def orders_after() -> bytes:
+            return list_json(validate_all(OrderRecord, orders))
+
+        def payments_before() -> bytes:
+            records = [PaymentRecord.model_validate(entity) for entity in payments]
+            return app.json.dumps([r.model_dump() for r in records]).encode()
+
+        def payments_after() -> bytes:
+            return records_json(PaymentRecord, validate_all(PaymentRecord, payments))
+
+        print(f"{args.rows} rows, {args.requests} requests each\n")
+        print("GET /orders (CrudRoutes envelope):")
+        before = _timed(
+            "  model_validate + model_dump + Flask JSON", args.requests, orders_before
+        )
+        after = _timed("  TypeAdapter + dump_json", args.requests, orders_after)
+        print(f"  speedup: {before / after:.2f}x\n")
+
+        print("GET /payments (composite routes, bare array):")
+        before = _timed(
+            "  model_validate + model_dump + jsonify", args.requests, payments_before
+        )
+        after = _timed("  TypeAdapter + dump_json", args.requests, payments_after)
+        print(f"  speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
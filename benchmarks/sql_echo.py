@@ -0,0 +1,69 @@
+"""Benchmark the cost of SQLALCHEMY_ECHO on a GET-by-id workload.
+
+Runs the same primary-key lookups on two in-memory SQLite engines, one created
+with ``echo=True`` (the development profile) and one without (production).
+Echo output goes to /dev/null, so the numbers show formatting and logging
+overhead only, not terminal I/O:
+
+    python benchmarks/sql_echo.py [--lookups N]
+"""
+
+import argparse
+import contextlib
+import os
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import Engine, create_engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from applepy.db import Base  # noqa: E402
+from applepy.domains.offices.models import Office  # noqa: E402
+from applepy.domains.offices.repository import OfficeRepository  # noqa: E402
+
+ROWS = 100
+
+
+def _engine(echo: bool) -> Engine:
+    engine = create_engine("sqlite://", echo=echo)
+    Base.metadata.create_all(engine, tables=[Office.__table__])  # type: ignore[list-item]
+    with Session(engine) as session:
+        session.add_all(
+            Office(office_code=f"E{i:03d}", city="Bench") for i in range(ROWS)
+        )
+        session.commit()
+    return engine
+
+
+def _run(engine: Engine, lookups: int) -> float:
+    start = time.perf_counter()
+    for i in range(lookups):
+        with Session(engine) as session:
+            OfficeRepository(session).get(f"E{i % ROWS:03d}")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print per-request timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lookups", type=int, default=5000)
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        # The echo handler binds sys.stdout when the engine is created
+        echo_engine = _engine(echo=True)
+        quiet_engine = _engine(echo=False)
+        _run(echo_engine, 100)
+        _run(quiet_engine, 100)
+        echo = _run(echo_engine, args.lookups)
+        quiet = _run(quiet_engine, args.lookups)
+
+    print(f"{args.lookups} GET-by-id lookups, one session each\n")
+    print(f"{'echo on  (development)':<28} {echo * 1e6 / args.lookups:8.1f} us/lookup")
+    print(f"{'echo off (production)':<28} {quiet * 1e6 / args.lookups:8.1f} us/lookup")
+    print(f"echo overhead: {(echo - quiet) / quiet:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,19 @@
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
 
-from applepy.db import Base
+from applepy.db import Base, engines
+from applepy.domains.customer_ledgers.models import CustomerLedger  # noqa: F401
 from applepy.domains.customers.models import Customer  # noqa: F401
 from applepy.domains.employees.models import Employee  # noqa: F401
 from applepy.domains.offices.models import Office  # noqa: F401
+from applepy.domains.order_totals.models import OrderTotal  # noqa: F401
+from applepy.domains.sales_rollups.models import (  # noqa: F401
+    SalesRollup,
+    StaleSalesMonth,
+)
 from applepy.env import DATABASE_URL
+from applepy.table_versions import TableVersion  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -60,15 +66,12 @@ def run_migrations_offline() -> None:
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode.
 
-    In this scenario we need to create an Engine
-    and associate a connection with the context.
+    In this scenario we use the shared engine from the applepy engine
+    registry (configured from the active APPLEPY_CONFIG profile) and
+    associate a connection with the context.
 
     """
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    connectable = engines.get()
 
     with connectable.connect() as connection:
         context.configure(connection=connection, target_metadata=target_metadata)
@@ -0,0 +1,33 @@
+"""create table_versions table
+
+Revision ID: 1a8b9c0d1e2f
+Revises: 0f7a8b9c0d1e
+Create Date: 2025-11-21 00:06:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1a8b9c0d1e2f"
+down_revision: Union[str, Sequence[str], None] = "0f7a8b9c0d1e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "table_versions",
+        sa.Column("table_name", sa.String(64), nullable=False),
+        sa.Column("version", sa.BigInteger, nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("table_versions")
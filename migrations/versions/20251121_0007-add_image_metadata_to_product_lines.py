@@ -0,0 +1,74 @@
+"""add image metadata to product_lines
+
+Revision ID: 2b9c0d1e2f3a
+Revises: 1a8b9c0d1e2f
+Create Date: 2025-11-21 00:07:00.000000+00:00
+
+"""
+
+import hashlib
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2b9c0d1e2f3a"
+down_revision: Union[str, Sequence[str], None] = "1a8b9c0d1e2f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 16 MiB - 1: MEDIUMBLOB on MySQL/MariaDB (BLOB holds only 64 KiB)
+MAX_IMAGE_BYTES = 16 * 1024 * 1024 - 1
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("product_lines") as batch_op:
+        batch_op.alter_column(
+            "image",
+            existing_type=sa.LargeBinary,
+            type_=sa.LargeBinary(MAX_IMAGE_BYTES),
+            existing_nullable=True,
+        )
+        batch_op.add_column(
+            sa.Column("image_content_type", sa.String(100), nullable=True)
+        )
+        batch_op.add_column(sa.Column("image_hash", sa.String(64), nullable=True))
+
+    # Backfill the hashes of images already stored; they are served as ETags.
+    # One image is loaded at a time.
+    product_lines = sa.table(
+        "product_lines",
+        sa.column("product_line", sa.String),
+        sa.column("image", sa.LargeBinary),
+        sa.column("image_hash", sa.String),
+    )
+    connection = op.get_bind()
+    names = connection.scalars(
+        sa.select(product_lines.c.product_line).where(
+            product_lines.c.image.is_not(None)
+        )
+    ).all()
+    for name in names:
+        image = connection.execute(
+            sa.select(product_lines.c.image).where(product_lines.c.product_line == name)
+        ).scalar_one()
+        connection.execute(
+            sa.update(product_lines)
+            .where(product_lines.c.product_line == name)
+            .values(image_hash=hashlib.sha256(image).hexdigest())
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("product_lines") as batch_op:
+        batch_op.drop_column("image_hash")
+        batch_op.drop_column("image_content_type")
+        batch_op.alter_column(
+            "image",
+            existing_type=sa.LargeBinary(MAX_IMAGE_BYTES),
+            type_=sa.LargeBinary,
+            existing_nullable=True,
+        )
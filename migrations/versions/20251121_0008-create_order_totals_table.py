@@ -0,0 +1,51 @@
+"""create order_totals table
+
+Revision ID: 3c0d1e2f3a4b
+Revises: 2b9c0d1e2f3a
+Create Date: 2025-11-21 00:08:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c0d1e2f3a4b"
+down_revision: Union[str, Sequence[str], None] = "2b9c0d1e2f3a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "order_totals",
+        sa.Column("order_number", sa.Integer, nullable=False),
+        sa.Column("line_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("item_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column(
+            "total_amount", sa.Numeric(12, 2), nullable=False, server_default="0"
+        ),
+        sa.PrimaryKeyConstraint("order_number"),
+        sa.ForeignKeyConstraint(
+            ["order_number"],
+            ["orders.order_number"],
+            name="fk_order_totals_order_number",
+            ondelete="CASCADE",
+        ),
+    )
+    # Backfill from the lines already stored
+    op.execute(
+        "INSERT INTO order_totals"
+        " (order_number, line_count, item_count, total_amount)"
+        " SELECT order_number, COUNT(*), SUM(quantity_ordered),"
+        " SUM(quantity_ordered * price_each)"
+        " FROM order_details GROUP BY order_number"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("order_totals")
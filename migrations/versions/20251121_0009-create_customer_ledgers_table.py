@@ -0,0 +1,58 @@
+"""create customer_ledgers table
+
+Revision ID: 4d1e2f3a4b5c
+Revises: 3c0d1e2f3a4b
+Create Date: 2025-11-21 00:09:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4d1e2f3a4b5c"
+down_revision: Union[str, Sequence[str], None] = "3c0d1e2f3a4b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "customer_ledgers",
+        sa.Column("customer_number", sa.Integer, nullable=False),
+        sa.Column(
+            "total_ordered", sa.Numeric(14, 2), nullable=False, server_default="0"
+        ),
+        sa.Column("total_paid", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("customer_number"),
+        sa.ForeignKeyConstraint(
+            ["customer_number"],
+            ["customers.customer_number"],
+            name="fk_customer_ledgers_customer_number",
+            ondelete="CASCADE",
+        ),
+    )
+    # Backfill from the orders and payments already stored
+    op.execute(
+        "INSERT INTO customer_ledgers"
+        " (customer_number, total_ordered, total_paid)"
+        " SELECT c.customer_number, COALESCE(o.amount, 0), COALESCE(p.amount, 0)"
+        " FROM customers c"
+        " LEFT JOIN (SELECT orders.customer_number,"
+        " SUM(order_details.quantity_ordered * order_details.price_each) AS amount"
+        " FROM orders JOIN order_details"
+        " ON order_details.order_number = orders.order_number"
+        " GROUP BY orders.customer_number) o"
+        " ON o.customer_number = c.customer_number"
+        " LEFT JOIN (SELECT customer_number, SUM(amount) AS amount"
+        " FROM payments GROUP BY customer_number) p"
+        " ON p.customer_number = c.customer_number"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("customer_ledgers")
@@ -0,0 +1,67 @@
+"""create sales_rollups tables
+
+Revision ID: 5e2f3a4b5c6d
+Revises: 4d1e2f3a4b5c
+Create Date: 2025-11-21 00:10:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2f3a4b5c6d"
+down_revision: Union[str, Sequence[str], None] = "4d1e2f3a4b5c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "sales_rollups",
+        sa.Column("id", sa.Integer, nullable=False, autoincrement=True),
+        sa.Column("year", sa.SmallInteger, nullable=False),
+        sa.Column("month", sa.SmallInteger, nullable=False),
+        sa.Column("product_line", sa.String(50), nullable=False),
+        sa.Column("product_vendor", sa.String(50), nullable=False),
+        sa.Column("country", sa.String(50), nullable=False),
+        sa.Column("office_code", sa.String(10), nullable=True),
+        sa.Column("revenue", sa.Numeric(14, 2), nullable=False),
+        sa.Column("units", sa.Integer, nullable=False),
+        sa.Column("order_count", sa.Integer, nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_sales_rollups_year_month", "sales_rollups", ["year", "month"])
+    op.create_table(
+        "sales_rollup_stale_months",
+        sa.Column("year", sa.SmallInteger, nullable=False),
+        sa.Column("month", sa.SmallInteger, nullable=False),
+        sa.PrimaryKeyConstraint("year", "month"),
+    )
+    # Backfill from the lines already stored
+    op.execute(
+        "INSERT INTO sales_rollups"
+        " (year, month, product_line, product_vendor, country, office_code,"
+        " revenue, units, order_count)"
+        " SELECT EXTRACT(YEAR FROM o.order_date), EXTRACT(MONTH FROM o.order_date),"
+        " p.product_line, p.product_vendor, c.country, e.office_code,"
+        " SUM(d.quantity_ordered * d.price_each), SUM(d.quantity_ordered),"
+        " COUNT(DISTINCT o.order_number)"
+        " FROM order_details d"
+        " JOIN orders o ON o.order_number = d.order_number"
+        " JOIN products p ON p.product_code = d.product_code"
+        " JOIN customers c ON c.customer_number = o.customer_number"
+        " LEFT JOIN employees e ON e.employee_number = c.sales_rep_employee_number"
+        " GROUP BY EXTRACT(YEAR FROM o.order_date), EXTRACT(MONTH FROM o.order_date),"
+        " p.product_line, p.product_vendor, c.country, e.office_code"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("sales_rollup_stale_months")
+    op.drop_index("ix_sales_rollups_year_month", table_name="sales_rollups")
+    op.drop_table("sales_rollups")
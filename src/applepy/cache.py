@@ -0,0 +1,187 @@
+"""Pluggable cache backends for read-through service caching.
+
+Services cache the serialized records they return (see
+applepy.services.cached). The backend is process-wide and chosen by the
+CACHE_BACKEND setting:
+
+- ``lru``: in-process LRU cache with a TTL per entry (the default)
+- ``null``: caches nothing (used when testing)
+
+The ``lru`` backend is per process: invalidations are only seen by the worker
+that made the write, and other workers keep serving their entries until
+CACHE_TTL expires (which is why the production profile keeps it short). No
+shared backend ships with applepy; one (e.g., Redis or Memcached) plugs in by
+implementing CacheBackend and passing an instance to set_cache(), so every
+worker sees the same entries and the same invalidations.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+from flask import Flask
+
+
+class CacheBackend(ABC):
+    """Key/value store for cached records.
+
+    Values are plain Python data (dicts and lists of JSON-compatible values,
+    dates and decimals); backends that store them outside the process must
+    serialize them.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value or counter stored under key, or None if absent."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, expiring after ttl seconds (None: backend default)."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Atomically increment an integer counter (starting at 0) and return it.
+
+        Counters are read with get() and never expire or get evicted; they are
+        used as generation numbers to invalidate every entry derived from them
+        at once.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+
+class NullCache(CacheBackend):
+    """Backend that stores nothing, so every read goes to the database."""
+
+    def get(self, key: str) -> Optional[Any]:
+        """Always miss."""
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Discard the value."""
+
+    def delete(self, key: str) -> None:
+        """Nothing to delete."""
+
+    def incr(self, key: str) -> int:
+        """Counters are not kept; always 0."""
+        return 0
+
+    def clear(self) -> None:
+        """Nothing to clear."""
+
+
+class LRUCache(CacheBackend):
+    """In-process cache evicting the least recently used entry when full.
+
+    Each process keeps its own entries, so invalidations are only seen by the
+    process that made them; the TTL bounds how stale other workers can be.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: Optional[float] = 300.0) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries (counters are not counted)
+            ttl: Default time to live in seconds (None: entries never expire)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (expiry time on the monotonic clock or None, value)
+        self._entries: OrderedDict[str, tuple[Optional[float], Any]] = OrderedDict()
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of entries, expired ones included."""
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a counter, or a live entry and mark it recently used."""
+        with self._lock:
+            if key in self._counters:
+                return self._counters[key]
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        """Increment a counter kept outside the LRU so it is never evicted."""
+        with self._lock:
+            value = self._counters.get(key, 0) + 1
+            self._counters[key] = value
+            return value
+
+    def clear(self) -> None:
+        """Remove every entry and counter."""
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+
+# Backends selectable with the CACHE_BACKEND setting
+BACKENDS = ("lru", "null")
+
+_backend: CacheBackend = NullCache()
+
+
+def get_cache() -> CacheBackend:
+    """Return the process-wide cache backend."""
+    return _backend
+
+
+def set_cache(backend: CacheBackend) -> None:
+    """Replace the process-wide cache backend (e.g., with a shared cache)."""
+    global _backend
+    _backend = backend
+
+
+def init_app(app: Flask) -> None:
+    """Create the cache backend named by the app config.
+
+    Reads CACHE_BACKEND, CACHE_TTL and CACHE_MAX_ENTRIES.
+
+    Args:
+        app: Flask application
+
+    Raises:
+        ValueError: If CACHE_BACKEND is not a known backend
+    """
+    name = app.config["CACHE_BACKEND"]
+    if name == "lru":
+        set_cache(LRUCache(app.config["CACHE_MAX_ENTRIES"], app.config["CACHE_TTL"]))
+    elif name == "null":
+        set_cache(NullCache())
+    else:
+        raise ValueError(
+            f"Unknown cache backend {name!r}. Choose one of: {', '.join(BACKENDS)}"
+        )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Sequence
 
 # Load environment variables from .env file if it exists
 try:
@@ -30,10 +31,16 @@ def make_parser() -> argparse.ArgumentParser:
     )
 
     # flask command
-    subparsers.add_parser(
+    flask_parser = subparsers.add_parser(
         "flask",
         help="Run as a Flask application.",
     )
+    flask_parser.add_argument(
+        "--config",
+        choices=["development", "testing", "production"],
+        default=None,
+        help="Configuration profile (defaults to $APPLEPY_CONFIG or development).",
+    )
 
     # db:migrate command
     subparsers.add_parser(
@@ -47,6 +54,29 @@ def make_parser() -> argparse.ArgumentParser:
         help="Refresh the database.",
     )
 
+    # db:rebuild-order-totals command
+    subparsers.add_parser(
+        "db:rebuild-order-totals",
+        help="Recompute the order_totals summary table from order_details.",
+    )
+
+    # db:rebuild-customer-ledgers command
+    subparsers.add_parser(
+        "db:rebuild-customer-ledgers",
+        help="Recompute the customer_ledgers table from order_details and payments.",
+    )
+
+    # db:refresh-sales-rollups command
+    refresh_rollups = subparsers.add_parser(
+        "db:refresh-sales-rollups",
+        help="Recompute sales_rollups for months changed since the last refresh.",
+    )
+    refresh_rollups.add_argument(
+        "--full",
+        action="store_true",
+        help="Recompute every month, e.g. after customers or products changed.",
+    )
+
     # migration:create
     migration_create = subparsers.add_parser(
         "migration:create",
@@ -62,6 +92,10 @@ def make_parser() -> argparse.ArgumentParser:
 
 def run_command(args: argparse.Namespace) -> int:
     if args.command == "flask":
+        if getattr(args, "config", None):
+            # Must be set before applepy.flask creates the app on import
+            os.environ["APPLEPY_CONFIG"] = args.config
+
         from applepy.flask import app
 
         app.run()
@@ -86,10 +120,43 @@ def run_command(args: argparse.Namespace) -> int:
         subprocess.run(["alembic", "upgrade", "head"])
         return 0
 
+    if args.command == "db:rebuild-order-totals":
+        from applepy.domains.order_totals.service import OrderTotalService
+
+        count = _rebuild(OrderTotalService)
+        print(f"Rebuilt totals for {count} orders")
+        return 0
+
+    if args.command == "db:rebuild-customer-ledgers":
+        from applepy.domains.customer_ledgers.service import CustomerLedgerService
+
+        count = _rebuild(CustomerLedgerService)
+        print(f"Rebuilt ledgers for {count} customers")
+        return 0
+
+    if args.command == "db:refresh-sales-rollups":
+        from applepy.domains.sales_rollups.service import SalesRollupService
+
+        count = _rebuild(SalesRollupService, "rebuild" if args.full else "refresh")
+        print(f"Wrote {count} sales rollup rows")
+        return 0
+
     # This should not happen because parser requires a command
     raise RuntimeError(f"Unknown command: {args.command!r}")
 
 
+def _rebuild(service_class: Any, method: str = "rebuild") -> int:
+    """Run a summary service method in its own committed transaction."""
+    # Importing the app maps every model the query's mappers refer to
+    from applepy.flask import app
+    from applepy.session import get_session
+
+    with app.app_context(), get_session() as session:
+        count: int = getattr(service_class(session), method)()
+        session.commit()
+    return count
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     parser = make_parser()
     args = parser.parse_args(list(argv) if argv is not None else None)
@@ -0,0 +1,148 @@
+"""Configuration profiles for the Flask application.
+
+Each profile is a class whose upper-case attributes are loaded into
+``app.config`` by create_app(). The profile is chosen by name: explicitly, via
+the APPLEPY_CONFIG environment variable, or by default ('testing' when TESTING
+is set, otherwise 'development').
+"""
+
+import os
+from typing import Any
+
+from applepy.env import DATABASE_REPLICA_URLS, DATABASE_URL
+
+# Environment variable naming the profile to use
+CONFIG_ENV_VAR = "APPLEPY_CONFIG"
+
+
+class Config:
+    """Settings shared by every profile."""
+
+    DEBUG = False
+    TESTING = False
+
+    SQLALCHEMY_DATABASE_URI = DATABASE_URL
+    SQLALCHEMY_ECHO = False
+    SQLALCHEMY_ENGINE_OPTIONS: dict[str, Any] = {
+        # Ping connections idle for more than this many seconds on checkout
+        # (important for MySQL timeouts, without a round trip per request)
+        "pre_ping_interval": 10.0,
+        "pool_recycle": 3600,  # avoids stale pooled connections
+    }
+
+    # Read replicas for read-only sessions, chosen round_robin or
+    # least_connections (see applepy.replicas)
+    DATABASE_REPLICA_URLS: list[str] = DATABASE_REPLICA_URLS
+    REPLICA_ROUTING = "round_robin"
+
+    # Log statements slower than this (None disables the slow-query log) and
+    # warn when one statement runs this many times in a request (0 disables
+    # the N+1 check); see applepy.query_stats
+    SLOW_QUERY_MS: float | None = 200.0
+    N_PLUS_ONE_THRESHOLD = 5
+
+    # Read-through cache for offices, product lines and products:
+    # 'lru' (in-process) or 'null' (see applepy.cache). The cache is per
+    # process: a write only invalidates the entries of the worker that handled
+    # it, so other workers may serve reads up to CACHE_TTL seconds stale
+    CACHE_BACKEND = "lru"
+    CACHE_TTL = 300.0  # seconds
+    CACHE_MAX_ENTRIES = 10_000
+
+    # Applied to app.json.sort_keys (Flask no longer reads it from config)
+    JSON_SORT_KEYS = True
+
+
+class DevelopmentConfig(Config):
+    """Local development: debugger on and every SQL statement logged."""
+
+    DEBUG = True
+    SQLALCHEMY_ECHO = True
+
+
+class TestingConfig(Config):
+    """Test runs: Flask testing mode, quiet SQL, no caching."""
+
+    TESTING = True
+    CACHE_BACKEND = "null"
+
+
+class ProductionConfig(Config):
+    """Production: no debug or SQL logging, a sized pool, a short cache TTL.
+
+    Each worker keeps up to pool_size connections open and may open
+    max_overflow more under bursts; pool_timeout bounds how long a request
+    waits for a free connection. Recycling below MySQL's wait_timeout avoids
+    handing out connections the server has already closed.
+    """
+
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pre_ping_interval": 10.0,
+    }
+
+    # Several workers each keep their own cache, so keep entries briefly to
+    # bound how long a worker serves reads older than another worker's write
+    CACHE_TTL = 5.0  # seconds
+
+    # Serialize responses in field order instead of sorting every dict
+    JSON_SORT_KEYS = False
+
+
+CONFIGS: dict[str, type[Config]] = {
+    "development": DevelopmentConfig,
+    "testing": TestingConfig,
+    "production": ProductionConfig,
+}
+
+
+def engine_options(config: type[Config]) -> dict[str, Any]:
+    """Build the engine arguments (including ``url``) for a profile.
+
+    Mirrors how Flask-SQLAlchemy combines SQLALCHEMY_DATABASE_URI,
+    SQLALCHEMY_ECHO and SQLALCHEMY_ENGINE_OPTIONS, so code running without an
+    app (CLI, migrations) configures the engine the same way the app does.
+
+    Args:
+        config: Profile class
+
+    Returns:
+        Keyword arguments for EngineRegistry.configure()
+    """
+    return {
+        **config.SQLALCHEMY_ENGINE_OPTIONS,
+        "url": config.SQLALCHEMY_DATABASE_URI,
+        "echo": config.SQLALCHEMY_ECHO,
+        "echo_pool": config.SQLALCHEMY_ECHO,
+    }
+
+
+def get_config(name: str | None = None) -> type[Config]:
+    """Resolve a configuration profile by name.
+
+    Args:
+        name: Profile name ('development', 'testing', 'production'). Falls back
+            to the APPLEPY_CONFIG environment variable, then to 'testing' if
+            TESTING is set, otherwise 'development'.
+
+    Returns:
+        The profile class
+
+    Raises:
+        ValueError: If the name is not a known profile
+    """
+    if name is None:
+        name = os.getenv(CONFIG_ENV_VAR)
+    if not name:
+        is_testing = os.getenv("TESTING", "").lower() in ("true", "1", "yes")
+        name = "testing" if is_testing else "development"
+
+    try:
+        return CONFIGS[name.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown configuration {name!r}. Choose one of: {', '.join(CONFIGS)}"
+        ) from None
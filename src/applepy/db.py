@@ -1,25 +1,352 @@
+"""Database engine registry, declarative base and session factory.
+
+All database access in a process goes through one EngineRegistry, so the
+Flask-SQLAlchemy extension, get_session() and migrations share the same
+engine and connection pool per database instead of each creating their own.
+"""
+
+import threading
+import time
+from typing import Any, Optional, cast
+
+from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event, make_url
+from sqlalchemy.engine.default import DefaultDialect
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection, QueuePool
 
-from applepy.env import DATABASE_URL
+from applepy.config import engine_options, get_config
+from applepy.metrics import metrics
+from applepy.query_stats import monitor
+
+# Name of the engine for the primary database
+DEFAULT_ENGINE = "default"
+
+# Keys in a pooled connection's info dict holding when it was last returned,
+# when it was opened and when it was last checked out
+_LAST_USED = "applepy_last_used"
+_OPENED_AT = "applepy_opened_at"
+_CHECKED_OUT_AT = "applepy_checked_out_at"
+
+# Pool metrics, labelled by engine name (see instrument_pool())
+POOL_CHECKOUT_WAIT = metrics.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection on checkout",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0),
+)
+POOL_CHECKOUT_TIMEOUTS = metrics.counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout with the pool exhausted",
+    ["engine"],
+)
+POOL_CHECKOUTS = metrics.counter(
+    "db_pool_checkouts_total", "Connections checked out of the pool", ["engine"]
+)
+POOL_CONNECTIONS_OPENED = metrics.counter(
+    "db_pool_connections_opened_total",
+    "New database connections opened by the pool",
+    ["engine"],
+)
+POOL_INVALIDATIONS = metrics.counter(
+    "db_pool_invalidations_total", "Pooled connections invalidated", ["engine"]
+)
+POOL_PRE_PING_FAILURES = metrics.counter(
+    "db_pool_pre_ping_failures_total",
+    "Connections discarded on checkout because the pre-ping failed",
+    ["engine"],
+)
+POOL_CONNECTION_HELD = metrics.histogram(
+    "db_pool_connection_held_seconds",
+    "Time a connection stayed checked out before being returned",
+    ["engine"],
+)
+POOL_CONNECTION_LIFETIME = metrics.histogram(
+    "db_pool_connection_lifetime_seconds",
+    "Time from opening a connection to closing it",
+    ["engine"],
+    buckets=(1.0, 10.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 7200.0, 14400.0),
+)
+POOL_SIZE = metrics.gauge(
+    "db_pool_size", "Configured pool_size (persistent connections)", ["engine"]
+)
+POOL_IN_USE = metrics.gauge(
+    "db_pool_in_use", "Connections currently checked out", ["engine"]
+)
+POOL_IN_USE_PEAK = metrics.gauge(
+    "db_pool_in_use_peak", "Most connections checked out at once", ["engine"]
+)
+POOL_IDLE = metrics.gauge(
+    "db_pool_idle", "Connections open and waiting in the pool", ["engine"]
+)
+POOL_OVERFLOW = metrics.gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size (counts toward max_overflow)",
+    ["engine"],
+)
 
 
 class Base(DeclarativeBase):
     pass
 
 
-db = SQLAlchemy(model_class=Base)
+class EngineRegistry:
+    """Process-wide registry of named, lazily created engines.
 
-engine = create_engine(
-    DATABASE_URL,  # type: ignore[arg-type]
-    echo=False,
-    pool_pre_ping=True,  # important for MySQL timeouts
-    pool_recycle=3600,  # avoids stale pooled connections
-)
+    Each name maps to engine options (``url`` plus create_engine() keyword
+    arguments such as pool_size, max_overflow, pool_timeout and
+    pool_pre_ping). The extra ``pre_ping_interval`` option (seconds) enables
+    an amortized pre-ping instead; see install_pre_ping(). The engine is
+    created on first use and then shared by every caller. Reconfiguring a
+    name with different options disposes the old engine's pool; configuring
+    it with the same options is a no-op. Every engine's pool reports metrics
+    labelled with its name (see instrument_pool()) and its statements are
+    timed per request (see applepy.query_stats).
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._options: dict[str, dict[str, Any]] = {}
+        self._engines: dict[str, Engine] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, name: str = DEFAULT_ENGINE, **options: Any) -> None:
+        """Set the options for a named engine.
+
+        Args:
+            name: Engine name
+            **options: ``url`` and keyword arguments for create_engine()
+
+        Raises:
+            ValueError: If no url is given
+        """
+        if "url" not in options:
+            raise ValueError(f"Engine {name!r} needs a url")
+
+        with self._lock:
+            if self._options.get(name) == options:
+                return
+            self._options[name] = options
+            engine = self._engines.pop(name, None)
+
+        if engine is not None:
+            engine.dispose()
+
+    def options(self, name: str = DEFAULT_ENGINE) -> dict[str, Any]:
+        """Return a copy of the options a named engine is configured with."""
+        return dict(self._options[name])
+
+    def names(self) -> list[str]:
+        """Return the names of all configured engines."""
+        return list(self._options)
+
+    def get(self, name: str = DEFAULT_ENGINE) -> Engine:
+        """Return the engine for a name, creating it on first use.
+
+        Args:
+            name: Engine name
+
+        Returns:
+            The shared engine
+
+        Raises:
+            KeyError: If the name has not been configured
+        """
+        engine = self._engines.get(name)
+        if engine is not None:
+            return engine
+
+        with self._lock:
+            engine = self._engines.get(name)
+            if engine is None:
+                if name not in self._options:
+                    raise KeyError(f"No engine configured as {name!r}")
+                options = dict(self._options[name])
+                pre_ping_interval = options.pop("pre_ping_interval", None)
+                url = make_url(options.pop("url"))
+                if "poolclass" not in options and "pool" not in options:
+                    # Time checkouts wherever the dialect would use a QueuePool
+                    dialect = cast(type[DefaultDialect], url.get_dialect())
+                    if dialect.get_pool_class(url) is QueuePool:
+                        options["poolclass"] = InstrumentedQueuePool
+                engine = create_engine(url, **options)
+                if pre_ping_interval is not None:
+                    install_pre_ping(engine, pre_ping_interval)
+                instrument_pool(engine, name)
+                monitor.instrument(engine)
+                self._engines[name] = engine
+            return engine
+
+    def dispose(self) -> None:
+        """Close the pooled connections of every engine created so far."""
+        with self._lock:
+            engines = list(self._engines.values())
+        for engine in engines:
+            engine.dispose()
+
+
+def install_pre_ping(engine: Engine, interval: float) -> None:
+    """Ping pooled connections on checkout only if they have been idle a while.
+
+    ``pool_pre_ping=True`` costs a round trip on every checkout. Connections
+    returned to the pool less than ``interval`` seconds ago are handed out
+    without a ping, since the server cannot have dropped them yet (MySQL's
+    wait_timeout is measured in hours). A failed ping raises
+    DisconnectionError, which makes the pool discard the connection and
+    retry with a new one.
+
+    Args:
+        engine: Engine whose pool to instrument
+        interval: Idle time in seconds after which a connection is pinged
+    """
+
+    @event.listens_for(engine, "checkin")
+    def _checked_in(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        record.info[_LAST_USED] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _checked_out(
+        dbapi_connection: Any, record: ConnectionPoolEntry, proxy: Any
+    ) -> None:
+        last_used = record.info.get(_LAST_USED)
+        # A connection that was never checked in has only just been opened
+        if last_used is None or time.monotonic() - last_used < interval:
+            return
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            raise DisconnectionError("Pooled connection failed pre-ping") from e
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits for a connection.
+
+    The wait covers everything Pool.connect() does before handing out a
+    connection: blocking on an exhausted pool, opening a new connection and
+    the pre-ping. Checkouts that time out are counted separately.
+    """
+
+    # Engine name used as the metrics label; set by instrument_pool()
+    metrics_name = DEFAULT_ENGINE
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, recording the time spent waiting."""
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc(engine=self.metrics_name)
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(
+                time.perf_counter() - start, engine=self.metrics_name
+            )
+        return connection
+
+    def recreate(self) -> QueuePool:
+        """Recreate the pool (on dispose), keeping the metrics label."""
+        pool = super().recreate()
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.metrics_name = self.metrics_name
+        return pool
+
+
+def instrument_pool(engine: Engine, name: str) -> None:
+    """Record pool metrics for an engine under the label ``engine=<name>``.
+
+    Counts connections opened, checkouts, invalidations and pre-ping
+    failures; records how long connections are held and how long they live;
+    and exposes in-use, idle and overflow gauges read from the pool when the
+    metrics are collected. Checkout wait times are recorded by
+    InstrumentedQueuePool.
+
+    Args:
+        engine: Engine whose pool to instrument
+        name: Engine name in the registry
+    """
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.metrics_name = name
+
+    @event.listens_for(engine, "connect")
+    def _connected(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        POOL_CONNECTIONS_OPENED.inc(engine=name)
+        record.info[_OPENED_AT] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _checked_out(
+        dbapi_connection: Any, record: ConnectionPoolEntry, proxy: Any
+    ) -> None:
+        POOL_CHECKOUTS.inc(engine=name)
+        record.info[_CHECKED_OUT_AT] = time.monotonic()
+        if isinstance(engine.pool, QueuePool):
+            POOL_IN_USE_PEAK.set_max(engine.pool.checkedout(), engine=name)
+
+    @event.listens_for(engine, "checkin")
+    def _checked_in(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        checked_out_at = record.info.pop(_CHECKED_OUT_AT, None)
+        if checked_out_at is not None:
+            POOL_CONNECTION_HELD.observe(time.monotonic() - checked_out_at, engine=name)
+
+    @event.listens_for(engine, "invalidate")
+    def _invalidated(
+        dbapi_connection: Any,
+        record: ConnectionPoolEntry,
+        exception: Optional[BaseException],
+    ) -> None:
+        POOL_INVALIDATIONS.inc(engine=name)
+        # Both install_pre_ping() and pool_pre_ping report a failed ping as a
+        # DisconnectionError raised during checkout
+        if isinstance(exception, DisconnectionError):
+            POOL_PRE_PING_FAILURES.inc(engine=name)
+
+    @event.listens_for(engine, "close")
+    def _closed(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        opened_at = record.info.pop(_OPENED_AT, None)
+        if opened_at is not None:
+            POOL_CONNECTION_LIFETIME.observe(time.monotonic() - opened_at, engine=name)
+
+    # Gauges read the engine's current pool, which dispose() replaces
+    if isinstance(engine.pool, QueuePool):
+        POOL_SIZE.set_function(lambda: _queue_pool(engine).size(), engine=name)
+        POOL_IN_USE.set_function(lambda: _queue_pool(engine).checkedout(), engine=name)
+        POOL_IDLE.set_function(lambda: _queue_pool(engine).checkedin(), engine=name)
+        # overflow() starts at -pool_size and only turns positive in a burst
+        POOL_OVERFLOW.set_function(
+            lambda: max(_queue_pool(engine).overflow(), 0), engine=name
+        )
+
+
+def _queue_pool(engine: Engine) -> QueuePool:
+    return cast(QueuePool, engine.pool)
+
+
+class RegistrySQLAlchemy(SQLAlchemy):
+    """Flask-SQLAlchemy extension that takes its engines from the registry.
+
+    ``db.init_app`` configures the registry from the app config (bind key None
+    becomes the default engine) instead of creating a second pool.
+    """
+
+    def _make_engine(
+        self, bind_key: Optional[str], options: dict[str, Any], app: Flask
+    ) -> Engine:
+        name = bind_key or DEFAULT_ENGINE
+        engines.configure(name, **options)
+        return engines.get(name)
+
+
+engines = EngineRegistry()
+
+# Defaults for code running without an app (CLI, migrations, scripts); an app
+# reconfigures the engine from its own config in db.init_app()
+engines.configure(DEFAULT_ENGINE, **engine_options(get_config()))
+
+db = RegistrySQLAlchemy(model_class=Base)
 
 SessionLocal = sessionmaker(
-    bind=engine,
     autoflush=False,
     autocommit=False,
     expire_on_commit=False,
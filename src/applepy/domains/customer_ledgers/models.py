@@ -0,0 +1,29 @@
+from decimal import Decimal
+
+from sqlalchemy import ForeignKey, Integer, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from applepy.db import Base
+
+
+class CustomerLedger(Base):
+    """Database model for a customer's running order and payment totals.
+
+    Maintained by OrderDetailService, OrderService and PaymentService in the
+    same transaction as each change, so a customer's balance is a
+    primary-key lookup instead of a scan of their orders and payments.
+    """
+
+    __tablename__ = "customer_ledgers"
+
+    customer_number: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("customers.customer_number", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    total_ordered: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), nullable=False, default=0
+    )
+    total_paid: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), nullable=False, default=0
+    )
@@ -0,0 +1,180 @@
+from decimal import Decimal
+from typing import Any, Iterable, NamedTuple, Optional, Sequence, cast
+
+from sqlalchemy import Select, Table, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from applepy.domains.customers.models import Customer
+from applepy.domains.order_details.models import OrderDetail
+from applepy.domains.order_totals.models import OrderTotal
+from applepy.domains.orders.models import Order
+from applepy.domains.payments.models import Payment
+from applepy.repositories.base import affected_rows
+from applepy.repositories.upsert import increment_statement
+
+from .models import CustomerLedger
+
+_COUNTERS = ["total_ordered", "total_paid"]
+
+
+class LedgerDelta(NamedTuple):
+    """Change to the ledger of one customer."""
+
+    customer_number: int
+    total_ordered: Decimal
+    total_paid: Decimal
+
+
+def _balance_select() -> Select[Any]:
+    ordered = func.coalesce(CustomerLedger.total_ordered, 0)
+    paid = func.coalesce(CustomerLedger.total_paid, 0)
+    return select(
+        Customer.customer_number,
+        Customer.credit_limit,
+        ordered.label("total_ordered"),
+        paid.label("total_paid"),
+        (ordered - paid).label("outstanding"),
+        (Customer.credit_limit - (ordered - paid)).label("headroom"),
+    ).outerjoin(
+        CustomerLedger, CustomerLedger.customer_number == Customer.customer_number
+    )
+
+
+class CustomerLedgerRepository:
+    """Customer ledger repository.
+
+    Like order totals, ledgers are changed by adding deltas, never by reading
+    and rewriting them.
+    """
+
+    def __init__(self, session: Session) -> None:
+        """Initialize the CustomerLedger repository.
+
+        Args:
+            session: SQLAlchemy session for database operations
+        """
+        self.session = session
+
+    def balance(self, customer_number: int) -> Optional[Any]:
+        """Read a customer's balance in one query.
+
+        Args:
+            customer_number: The customer number
+
+        Returns:
+            A row with the CustomerBalance fields, or None if the customer does
+            not exist
+        """
+        stmt = _balance_select().where(Customer.customer_number == customer_number)
+        return self.session.execute(stmt).first()
+
+    def balances(self) -> Sequence[Any]:
+        """Read every customer's balance in one query.
+
+        Returns:
+            Rows with the CustomerBalance fields, by customer number
+        """
+        stmt = _balance_select().order_by(Customer.customer_number)
+        return self.session.execute(stmt).all()
+
+    def order_customers(self, order_numbers: Iterable[int]) -> dict[int, int]:
+        """Look up the customers of orders, locking the order rows.
+
+        The shared lock (``SELECT ... FOR SHARE``) keeps an order from moving
+        to another customer before the caller's ledger change is written.
+
+        Args:
+            order_numbers: Orders to look up
+
+        Returns:
+            Customer number per existing order
+        """
+        rows = self.session.execute(
+            select(Order.order_number, Order.customer_number)
+            .where(Order.order_number.in_(sorted(set(order_numbers))))
+            .with_for_update(read=True)
+        )
+        return {order_number: customer for order_number, customer in rows.tuples()}
+
+    def order_amount(self, order_number: int) -> Decimal:
+        """Return an order's total amount from order_totals (0 if none)."""
+        amount = self.session.scalar(
+            select(OrderTotal.total_amount).where(
+                OrderTotal.order_number == order_number
+            )
+        )
+        return Decimal(amount or 0)
+
+    def add(self, deltas: Iterable[LedgerDelta]) -> None:
+        """Add deltas to customer ledgers, creating missing rows.
+
+        Uses the dialect's increment upsert, one statement for all customers.
+
+        Args:
+            deltas: Changes to apply, at most one per customer
+        """
+        rows = [delta._asdict() for delta in sorted(deltas)]  # consistent lock order
+        if not rows:
+            return
+
+        table = cast(Table, CustomerLedger.__table__)
+        stmt = increment_statement(
+            self.session.get_bind().dialect.name, table, _COUNTERS
+        )
+        if stmt is not None:
+            self.session.execute(stmt, rows)
+            return
+
+        for row in rows:
+            result = self.session.execute(
+                update(CustomerLedger)
+                .where(CustomerLedger.customer_number == row["customer_number"])
+                .values(
+                    {
+                        name: getattr(CustomerLedger, name) + row[name]
+                        for name in _COUNTERS
+                    }
+                )
+            )
+            if affected_rows(result) == 0:
+                self.session.execute(insert(CustomerLedger), [row])
+
+    def rebuild(self) -> int:
+        """Recompute every customer's ledger from orders and payments.
+
+        Replaces the table's contents with one ``INSERT ... SELECT`` joining
+        customers to the GROUP BY sums of their order lines and payments.
+
+        Returns:
+            Number of customers with a ledger
+        """
+        self.session.execute(delete(CustomerLedger))
+        ordered = (
+            select(
+                Order.customer_number,
+                func.sum(OrderDetail.quantity_ordered * OrderDetail.price_each).label(
+                    "amount"
+                ),
+            )
+            .join(OrderDetail, OrderDetail.order_number == Order.order_number)
+            .group_by(Order.customer_number)
+            .subquery()
+        )
+        paid = (
+            select(Payment.customer_number, func.sum(Payment.amount).label("amount"))
+            .group_by(Payment.customer_number)
+            .subquery()
+        )
+        rows = (
+            select(
+                Customer.customer_number,
+                func.coalesce(ordered.c.amount, 0),
+                func.coalesce(paid.c.amount, 0),
+            )
+            .outerjoin(ordered, ordered.c.customer_number == Customer.customer_number)
+            .outerjoin(paid, paid.c.customer_number == Customer.customer_number)
+        )
+        result = self.session.execute(
+            insert(CustomerLedger).from_select(["customer_number", *_COUNTERS], rows)
+        )
+        return affected_rows(result)
@@ -0,0 +1,21 @@
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class CustomerBalance(BaseModel):
+    """Validation for a customer's account balance on read.
+
+    ``outstanding`` is total_ordered - total_paid; ``headroom`` is
+    credit_limit - outstanding, or None for customers without a credit limit.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    customer_number: int
+    credit_limit: Optional[Decimal] = None
+    total_ordered: Decimal
+    total_paid: Decimal
+    outstanding: Decimal
+    headroom: Optional[Decimal] = None
@@ -0,0 +1,133 @@
+from decimal import Decimal
+from typing import Iterable
+
+from sqlalchemy.orm import Session
+
+from applepy.exceptions import NotFoundException
+from applepy.serialization import validate_all
+
+from .repository import CustomerLedgerRepository, LedgerDelta
+from .schemas import CustomerBalance
+
+
+class CustomerLedgerService:
+    """Customer ledger service.
+
+    Keeps one row per customer with the total amount of their order lines
+    and the total amount of their payments.
+    """
+
+    def __init__(self, session: Session) -> None:
+        """Initialize the CustomerLedger service.
+
+        Args:
+            session: SQLAlchemy session for database operations
+        """
+        self.repo = CustomerLedgerRepository(session)
+
+    def get_balance(self, customer_number: int) -> CustomerBalance:
+        """Retrieve a customer's balance.
+
+        Args:
+            customer_number: The customer number
+
+        Returns:
+            The customer's balance; zeros if they have no orders or payments
+
+        Raises:
+            NotFoundException: If the customer does not exist
+        """
+        row = self.repo.balance(customer_number)
+        if row is None:
+            raise NotFoundException("Customer not found")
+        return CustomerBalance.model_validate(row._mapping)
+
+    def get_balances(self) -> list[CustomerBalance]:
+        """Retrieve every customer's balance.
+
+        Returns:
+            One balance per customer, by customer number
+        """
+        return validate_all(CustomerBalance, (r._mapping for r in self.repo.balances()))
+
+    def add_ordered(self, amounts: Iterable[tuple[int, Decimal]]) -> None:
+        """Add order line amounts to the ledgers of the orders' customers.
+
+        Args:
+            amounts: (order_number, amount) pairs; negative for removed lines
+        """
+        amounts = [(order, amount) for order, amount in amounts if amount]
+        if not amounts:
+            return
+        customers = self.repo.order_customers(order for order, _ in amounts)
+        self._add(
+            LedgerDelta(customers[order], amount, Decimal(0))
+            for order, amount in amounts
+            if order in customers
+        )
+
+    def add_paid(self, amounts: Iterable[tuple[int, Decimal]]) -> None:
+        """Add payment amounts to customer ledgers.
+
+        Args:
+            amounts: (customer_number, amount) pairs; negative for removed
+                payments
+        """
+        self._add(
+            LedgerDelta(customer, Decimal(0), amount) for customer, amount in amounts
+        )
+
+    def order_customer(self, order_number: int) -> int:
+        """Return an order's customer, locking the order row.
+
+        Raises:
+            NotFoundException: If the order does not exist
+        """
+        customers = self.repo.order_customers([order_number])
+        if order_number not in customers:
+            raise NotFoundException("Order not found")
+        return customers[order_number]
+
+    def move_order(self, order_number: int, previous: int, customer: int) -> None:
+        """Move an order's amount from one customer's ledger to another's.
+
+        Args:
+            order_number: The order that changed customer
+            previous: The order's previous customer
+            customer: The order's new customer
+        """
+        if previous == customer:
+            return
+        amount = self.repo.order_amount(order_number)
+        self._add(
+            [
+                LedgerDelta(previous, -amount, Decimal(0)),
+                LedgerDelta(customer, amount, Decimal(0)),
+            ]
+        )
+
+    def rebuild(self) -> int:
+        """Recompute all customer ledgers from order_details and payments.
+
+        Returns:
+            Number of customers with a ledger
+        """
+        return self.repo.rebuild()
+
+    def _add(self, deltas: Iterable[LedgerDelta]) -> None:
+        # Merge deltas per customer and drop those that cancel out
+        merged: dict[int, LedgerDelta] = {}
+        for delta in deltas:
+            previous = merged.get(delta.customer_number)
+            if previous is not None:
+                delta = LedgerDelta(
+                    delta.customer_number,
+                    previous.total_ordered + delta.total_ordered,
+                    previous.total_paid + delta.total_paid,
+                )
+            merged[delta.customer_number] = delta
+        self.repo.add(
+            delta
+            for delta in merged.values()
+            if delta.total_ordered or delta.total_paid
+        )
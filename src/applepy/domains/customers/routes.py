@@ -1,7 +1,21 @@
 """Customer CRUD routes."""
 
+from flask import Blueprint, Response
+
+from applepy.domains.customer_ledgers.models import CustomerLedger
+from applepy.exceptions import NotFoundException
+from applepy.responses import ApiResponse, FlaskApiResponse
 from applepy.routes.base import CrudRoutes
+from applepy.routes.conditional import (
+    conditional_response,
+    not_modified,
+    version_etag,
+)
+from applepy.serialization import list_json, record_json
+from applepy.session import get_session
+from applepy.table_versions import versions
 
+from .models import Customer
 from .schemas import CustomerCreate, CustomerRecord
 from .service import CustomerService
 
@@ -13,8 +27,13 @@ class CustomerRoutes(CrudRoutes[CustomerCreate, CustomerRecord, int]):
     - GET /customers - List all customers
     - GET /customers/<customer_number> - Get customer by number
     - POST /customers - Create new customer
+    - POST /customers/bulk - Create many customers in one transaction
     - PUT /customers/<customer_number> - Update customer
     - DELETE /customers/<customer_number> - Delete customer
+
+    And adds:
+    - GET /customers/balances - Every customer's balance
+    - GET /customers/<customer_number>/balance - One customer's balance
     """
 
     path = "/customers"
@@ -22,3 +41,63 @@ class CustomerRoutes(CrudRoutes[CustomerCreate, CustomerRecord, int]):
     create_schema = CustomerCreate
     record_schema = CustomerRecord
     id_param_name = "customer_number"
+
+    def _create_blueprint(self) -> Blueprint:
+        """Add the balance endpoints to the CRUD blueprint."""
+        bp = super()._create_blueprint()
+        bp.add_url_rule("/balances", "get_balances", self.get_balances, methods=["GET"])
+        bp.add_url_rule(
+            "/<int:customer_number>/balance",
+            "get_balance",
+            self.get_balance,
+            methods=["GET"],
+        )
+        return bp
+
+    def get_balance(self, customer_number: int) -> FlaskApiResponse | Response:
+        """Get a customer's account balance.
+
+        Returns:
+            200: Totals ordered and paid, outstanding amount and headroom
+            304: The client's cached copy (If-None-Match) is still current
+            404: Customer not found
+            500: Server error
+        """
+        try:
+            with get_session(read_only=True) as session:
+                service = CustomerService(session)
+                balance = service.get_balance(customer_number)
+                return conditional_response(record_json(balance))
+        except NotFoundException as e:
+            error_response: ApiResponse[None] = ApiResponse(error=str(e))
+            return error_response.model_dump(), 404
+        except Exception as e:
+            error_response = ApiResponse(error=str(e))
+            return error_response.model_dump(), 500
+
+    def get_balances(self) -> FlaskApiResponse | Response:
+        """Get every customer's account balance.
+
+        The ETag is derived from the versions of the customers and
+        customer_ledgers tables, so ``If-None-Match`` is answered without
+        running the balance query.
+
+        Returns:
+            200: One balance per customer, by customer number
+            304: The client's cached copy (If-None-Match) is still current
+            500: Server error
+        """
+        tables = [Customer.__tablename__, CustomerLedger.__tablename__]
+        try:
+            with get_session(read_only=True) as session:
+                current = versions.read(session, tables)
+                etag = version_etag(*(f"{name}@{current[name]}" for name in tables))
+                cached = not_modified(etag)
+                if cached is not None:
+                    return cached
+
+                balances = CustomerService(session).get_balances()
+                return conditional_response(list_json(balances), etag=etag)
+        except Exception as e:
+            error_response: ApiResponse[None] = ApiResponse(error=str(e))
+            return error_response.model_dump(), 500
@@ -2,6 +2,10 @@
 
 from sqlalchemy.orm import Session
 
+from applepy.domains.customer_ledgers.schemas import CustomerBalance
+from applepy.domains.customer_ledgers.service import CustomerLedgerService
+from applepy.domains.employees.schemas import EmployeeRecord
+from applepy.domains.offices.schemas import OfficeRecord
 from applepy.services.base import BaseService
 
 from .models import Customer
@@ -18,8 +22,15 @@ class CustomerService(BaseService[Customer, int, CustomerCreate, CustomerRecord]
     - get_all: Get all customers
     - update: Update an existing customer with validation
     - delete: Delete a customer
+
+    The sales rep (and their office) can be included.
     """
 
+    includes = {
+        "sales_rep": EmployeeRecord,
+        "sales_rep.office": OfficeRecord,
+    }
+
     def __init__(self, session: Session) -> None:
         """Initialize the Customer service.
 
@@ -28,3 +39,27 @@ class CustomerService(BaseService[Customer, int, CustomerCreate, CustomerRecord]
         """
         repo = CustomerRepository(session)
         super().__init__(repo, CustomerRecord)
+
+    def get_balance(self, customer_number: int) -> CustomerBalance:
+        """Retrieve a customer's totals ordered and paid and their credit headroom.
+
+        Read from the customer_ledgers table, not from orders and payments.
+
+        Args:
+            customer_number: The customer number
+
+        Returns:
+            The customer's balance
+
+        Raises:
+            NotFoundException: If the customer does not exist
+        """
+        return CustomerLedgerService(self.repo.session).get_balance(customer_number)
+
+    def get_balances(self) -> list[CustomerBalance]:
+        """Retrieve every customer's balance with one query.
+
+        Returns:
+            One balance per customer, by customer number
+        """
+        return CustomerLedgerService(self.repo.session).get_balances()
@@ -13,6 +13,7 @@ class EmployeeRoutes(CrudRoutes[EmployeeCreate, EmployeeRecord, int]):
     - GET /employees - List all employees
     - GET /employees/<employee_number> - Get employee by number
     - POST /employees - Create new employee
+    - POST /employees/bulk - Create many employees in one transaction
     - PUT /employees/<employee_number> - Update employee
     - DELETE /employees/<employee_number> - Delete employee
     """
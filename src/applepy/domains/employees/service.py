@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 
+from applepy.domains.offices.schemas import OfficeRecord
 from applepy.services.base import BaseService
 
 from .models import Employee
@@ -10,9 +11,15 @@ from .schemas import EmployeeCreate, EmployeeRecord
 class EmployeeService(BaseService[Employee, int, EmployeeCreate, EmployeeRecord]):
     """Employee service for CRUD operations on Employee entities.
 
-    Inherits all business logic from BaseService.
+    Inherits all business logic from BaseService. The office and the manager
+    can be included.
     """
 
+    includes = {
+        "office": OfficeRecord,
+        "manager": EmployeeRecord,
+    }
+
     def __init__(self, session: Session) -> None:
         """Initialize the Employee service.
 
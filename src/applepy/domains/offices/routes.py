@@ -13,6 +13,7 @@ class OfficeRoutes(CrudRoutes[OfficeCreate, OfficeRecord, str]):
     - GET /offices - List all offices
     - GET /offices/<office_code> - Get office by code
     - POST /offices - Create new office
+    - POST /offices/bulk - Create many offices in one transaction
     - PUT /offices/<office_code> - Update office
     - DELETE /offices/<office_code> - Delete office
     """
@@ -1,16 +1,17 @@
 from sqlalchemy.orm import Session
 
-from applepy.services.base import BaseService
+from applepy.services.cached import CachedService
 
 from .models import Office
 from .repository import OfficeRepository
 from .schemas import OfficeCreate, OfficeRecord
 
 
-class OfficeService(BaseService[Office, str, OfficeCreate, OfficeRecord]):
+class OfficeService(CachedService[Office, str, OfficeCreate, OfficeRecord]):
     """Office service for CRUD operations on Office entities.
 
-    Inherits all business logic from BaseService.
+    Inherits all business logic from BaseService; reads are cached (see
+    CachedService).
     """
 
     def __init__(self, session: Session) -> None:
@@ -1,10 +1,19 @@
+from decimal import Decimal
+from typing import Iterator, Sequence
+
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
 from applepy.exceptions import NotFoundException
+from applepy.repositories.base import affected_rows
+from applepy.repositories.lookup import get_by_key, primary_key_select
 
 from .models import OrderDetail
 from .schemas import OrderDetailCreate, OrderDetailRecord
 
+# Pre-built primary-key SELECT used by get()
+_GET_STATEMENT = primary_key_select(OrderDetail)
+
 
 class OrderDetailRepository:
     """Order detail repository for CRUD operations on OrderDetail entities.
@@ -28,9 +37,22 @@ class OrderDetailRepository:
         """
         return self.session.query(OrderDetail).all()
 
+    def iter_all(self, batch_size: int = 1000) -> Iterator[OrderDetail]:
+        """Iterate over all order details using a server-side cursor.
+
+        Args:
+            batch_size: Number of rows to fetch per round trip
+
+        Returns:
+            Iterator over OrderDetail instances
+        """
+        return iter(self.session.query(OrderDetail).yield_per(batch_size))
+
     def get(self, order_number: int, product_code: str) -> OrderDetail:
         """Retrieve an order detail by its composite key.
 
+        Repeated lookups within a session are served from the identity map.
+
         Args:
             order_number: The order number
             product_code: The product code
@@ -41,13 +63,8 @@ class OrderDetailRepository:
         Raises:
             NotFoundException: If no record with the given keys exists
         """
-        entity = (
-            self.session.query(OrderDetail)
-            .filter(
-                OrderDetail.order_number == order_number,
-                OrderDetail.product_code == product_code,
-            )
-            .first()
+        entity = get_by_key(
+            self.session, OrderDetail, _GET_STATEMENT, (order_number, product_code)
         )
 
         if not entity:
@@ -55,6 +72,36 @@ class OrderDetailRepository:
 
         return entity
 
+    def lock_amounts(self, order_number: int, product_code: str) -> tuple[int, Decimal]:
+        """Read an order detail's quantity and price, locking the row.
+
+        The row stays locked (``SELECT ... FOR UPDATE``) until the transaction
+        ends, so the values cannot change before the caller writes.
+
+        Args:
+            order_number: The order number
+            product_code: The product code
+
+        Returns:
+            (quantity_ordered, price_each)
+
+        Raises:
+            NotFoundException: If no record with the given keys exists
+        """
+        row = self.session.execute(
+            select(OrderDetail.quantity_ordered, OrderDetail.price_each)
+            .where(
+                OrderDetail.order_number == order_number,
+                OrderDetail.product_code == product_code,
+            )
+            .with_for_update()
+        ).first()
+
+        if row is None:
+            raise NotFoundException("OrderDetail not found")
+
+        return row[0], Decimal(row[1])
+
     def get_by_order(self, order_number: int) -> list[OrderDetail]:
         """Retrieve all order details for an order.
 
@@ -84,30 +131,60 @@ class OrderDetailRepository:
         self.session.flush()
         return entity
 
-    def update(self, data: OrderDetailRecord) -> OrderDetail:
-        """Update an existing order detail.
+    def bulk_create(self, items: Sequence[OrderDetailCreate]) -> int:
+        """Insert many order details with a single multi-row INSERT.
 
         Args:
-            data: Pydantic schema instance with field values
+            items: Validated create schemas
 
         Returns:
-            The updated OrderDetail instance
+            Number of rows inserted
+        """
+        rows = [item.model_dump() for item in items]
+        if rows:
+            self.session.execute(insert(OrderDetail), rows)
+        return len(rows)
+
+    def update_in_place(self, data: OrderDetailRecord) -> None:
+        """Update an existing order detail with a single UPDATE statement.
+
+        The row is not loaded first; the rowcount tells whether it exists.
+
+        Args:
+            data: Pydantic schema instance with field values
 
         Raises:
             NotFoundException: If no record with the given keys exists
         """
-        entity = (
-            self.session.query(OrderDetail)
-            .filter(
+        values = data.model_dump(exclude_unset=True)
+        values.pop("order_number", None)
+        values.pop("product_code", None)
+
+        result = self.session.execute(
+            update(OrderDetail)
+            .where(
                 OrderDetail.order_number == data.order_number,
                 OrderDetail.product_code == data.product_code,
             )
-            .first()
+            .values(**values)
         )
-
-        if not entity:
+        if affected_rows(result) == 0:
             raise NotFoundException("OrderDetail not found")
 
+    def update(self, data: OrderDetailRecord) -> OrderDetail:
+        """Update an existing order detail.
+
+        Args:
+            data: Pydantic schema instance with field values
+
+        Returns:
+            The updated OrderDetail instance
+
+        Raises:
+            NotFoundException: If no record with the given keys exists
+        """
+        entity = self.get(data.order_number, data.product_code)
+
         update_data = data.model_dump(exclude_unset=True)
         update_data.pop("order_number", None)
         update_data.pop("product_code", None)
@@ -127,16 +204,11 @@ class OrderDetailRepository:
         Raises:
             NotFoundException: If no record with the given keys exists
         """
-        entity = (
-            self.session.query(OrderDetail)
-            .filter(
+        result = self.session.execute(
+            delete(OrderDetail).where(
                 OrderDetail.order_number == order_number,
                 OrderDetail.product_code == product_code,
             )
-            .first()
         )
-
-        if not entity:
+        if affected_rows(result) == 0:
             raise NotFoundException("OrderDetail not found")
-
-        self.session.delete(entity)
@@ -1,21 +1,30 @@
 """OrderDetail routes with composite key support."""
 
+from typing import Iterator
+
 from flask import Blueprint, Response, jsonify, request
 
-from applepy.session import get_session
+from applepy.exceptions import ValidationError
+from applepy.routes.bulk import bulk_adapter, parse_bulk
+from applepy.routes.streaming import STREAM_BATCH_SIZE, ndjson_response, wants_ndjson
+from applepy.serialization import json_response, records_json
+from applepy.session import get_session, get_stream_session
 
 from .schemas import OrderDetailCreate, OrderDetailRecord
 from .service import OrderDetailService
 
+_bulk_adapter = bulk_adapter(OrderDetailCreate)
+
 
 class OrderDetailRoutes:
     """Routes for order details with composite primary key.
 
     Endpoints:
-    - GET /order-details - List all order details
+    - GET /order-details - List all order details (JSON or streamed NDJSON)
     - GET /order-details/<order_number>/<product_code> - Get by composite key
     - GET /orders/<order_number>/details - Get all details for an order
     - POST /order-details - Create new order detail
+    - POST /order-details/bulk - Create many order details in one transaction
     - PUT /order-details/<order_number>/<product_code> - Update order detail
     - DELETE /order-details/<order_number>/<product_code> - Delete order detail
     """
@@ -49,6 +58,12 @@ class OrderDetailRoutes:
             cls.create,
             methods=["POST"],
         )
+        app.add_url_rule(
+            f"{cls.path}/bulk",
+            f"{cls.path}_bulk_create",
+            cls.bulk_create,
+            methods=["POST"],
+        )
         app.add_url_rule(
             f"{cls.path}/<int:order_number>/<product_code>",
             f"{cls.path}_update",
@@ -64,37 +79,63 @@ class OrderDetailRoutes:
 
     @staticmethod
     def list_all() -> Response:
-        """List all order details."""
-        with get_session() as session:
+        """List all order details.
+
+        Streams NDJSON when the client sends ``Accept: application/x-ndjson``.
+        """
+        if wants_ndjson():
+
+            def stream() -> Iterator[OrderDetailRecord]:
+                with get_stream_session(read_only=True) as session:
+                    service = OrderDetailService(session)
+                    yield from service.iter_all(STREAM_BATCH_SIZE)
+
+            return ndjson_response(stream())
+
+        with get_session(read_only=True) as session:
             service = OrderDetailService(session)
             records = service.all()
-            return jsonify([r.model_dump() for r in records])
+            return json_response(records_json(OrderDetailRecord, records))
 
     @staticmethod
     def get(order_number: int, product_code: str) -> Response:
         """Get order detail by composite key."""
-        with get_session() as session:
+        with get_session(read_only=True) as session:
             service = OrderDetailService(session)
             record = service.get(order_number, product_code)
-            return jsonify(record.model_dump())
+            return json_response(record.model_dump_json().encode())
 
     @staticmethod
     def get_by_order(order_number: int) -> Response:
         """Get all order details for an order."""
-        with get_session() as session:
+        with get_session(read_only=True) as session:
             service = OrderDetailService(session)
             records = service.get_by_order(order_number)
-            return jsonify([r.model_dump() for r in records])
+            return json_response(records_json(OrderDetailRecord, records))
 
     @staticmethod
-    def create() -> tuple[Response, int]:
+    def create() -> Response:
         """Create new order detail."""
         data = OrderDetailCreate(**request.get_json())
         with get_session() as session:
             service = OrderDetailService(session)
             record = service.create(data)
             session.commit()
-            return jsonify(record.model_dump()), 201
+            return json_response(record.model_dump_json().encode(), 201)
+
+    @staticmethod
+    def bulk_create() -> tuple[Response, int]:
+        """Create many order details from a JSON array in one transaction."""
+        try:
+            items = parse_bulk(_bulk_adapter, request.get_json())
+        except ValidationError as e:
+            return jsonify({"error": str(e)}), 400
+
+        with get_session() as session:
+            service = OrderDetailService(session)
+            count = service.bulk_create(items)
+            session.commit()
+            return jsonify({"count": count}), 201
 
     @staticmethod
     def update(order_number: int, product_code: str) -> Response:
@@ -107,7 +148,7 @@ class OrderDetailRoutes:
             service = OrderDetailService(session)
             record = service.update(data)
             session.commit()
-            return jsonify(record.model_dump())
+            return json_response(record.model_dump_json().encode())
 
     @staticmethod
     def delete(order_number: int, product_code: str) -> tuple[Response, int]:
@@ -15,6 +15,14 @@ class OrderDetailBase(BaseModel):
     order_line_number: int
 
 
+class OrderLineCreate(BaseModel):
+    """Validation for a line of a new order; its numbers are assigned."""
+
+    product_code: str
+    quantity_ordered: int
+    price_each: Decimal
+
+
 class OrderDetailCreate(OrderDetailBase):
     """Validation for new order detail on creation."""
 
@@ -1,5 +1,14 @@
+from decimal import Decimal
+from typing import Iterator, Sequence
+
 from sqlalchemy.orm import Session
 
+from applepy.domains.customer_ledgers.service import CustomerLedgerService
+from applepy.domains.order_totals.repository import OrderTotalDelta
+from applepy.domains.order_totals.service import OrderTotalService
+from applepy.domains.sales_rollups.service import SalesRollupService
+from applepy.serialization import validate_all
+
 from .repository import OrderDetailRepository
 from .schemas import OrderDetailCreate, OrderDetailRecord
 
@@ -7,7 +16,11 @@ from .schemas import OrderDetailCreate, OrderDetailRecord
 class OrderDetailService:
     """Order detail service for CRUD operations on OrderDetail entities.
 
-    Uses composite primary key (order_number, product_code).
+    Uses composite primary key (order_number, product_code). Every write
+    also updates the order's totals (see OrderTotalService) and its
+    customer's ledger (see CustomerLedgerService), and marks the order's
+    month for a sales rollup refresh (see SalesRollupService), in the same
+    transaction.
     """
 
     def __init__(self, session: Session) -> None:
@@ -17,6 +30,9 @@ class OrderDetailService:
             session: SQLAlchemy session for database operations
         """
         self.repo = OrderDetailRepository(session)
+        self.totals = OrderTotalService(session)
+        self.ledgers = CustomerLedgerService(session)
+        self.rollups = SalesRollupService(session)
 
     def all(self) -> list[OrderDetailRecord]:
         """Retrieve all order details.
@@ -25,7 +41,19 @@ class OrderDetailService:
             List of all OrderDetailRecord instances
         """
         entities = self.repo.all()
-        return [OrderDetailRecord.model_validate(e) for e in entities]
+        return validate_all(OrderDetailRecord, entities)
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[OrderDetailRecord]:
+        """Stream all order details, transforming each one as it is read.
+
+        Args:
+            batch_size: Number of rows to fetch per round trip
+
+        Returns:
+            Iterator over OrderDetailRecord instances
+        """
+        for entity in self.repo.iter_all(batch_size):
+            yield OrderDetailRecord.model_validate(entity)
 
     def get(self, order_number: int, product_code: str) -> OrderDetailRecord:
         """Retrieve an order detail by its composite key.
@@ -50,7 +78,7 @@ class OrderDetailService:
             List of OrderDetailRecord instances for the order
         """
         entities = self.repo.get_by_order(order_number)
-        return [OrderDetailRecord.model_validate(e) for e in entities]
+        return validate_all(OrderDetailRecord, entities)
 
     def create(self, data: OrderDetailCreate) -> OrderDetailRecord:
         """Create a new order detail.
@@ -62,19 +90,59 @@ class OrderDetailService:
             The newly created OrderDetailRecord instance
         """
         entity = self.repo.create(data)
+        self._record(
+            [_delta(data.order_number, 1, data.quantity_ordered, data.price_each)]
+        )
         return OrderDetailRecord.model_validate(entity)
 
+    def bulk_create(self, items: Sequence[OrderDetailCreate]) -> int:
+        """Create many order details in one multi-row INSERT.
+
+        Args:
+            items: Validated create schemas
+
+        Returns:
+            Number of order details created
+        """
+        count = self.repo.bulk_create(items)
+        self._record(
+            [
+                _delta(item.order_number, 1, item.quantity_ordered, item.price_each)
+                for item in items
+            ]
+        )
+        return count
+
     def update(self, data: OrderDetailRecord) -> OrderDetailRecord:
         """Update an existing order detail.
 
+        The previous quantity and price are read (and the row locked) first,
+        so the order's totals and ledger can be adjusted by the difference.
+
         Args:
             data: Pydantic schema instance with field values
 
         Returns:
             The updated OrderDetailRecord instance
         """
-        entity = self.repo.update(data)
-        return OrderDetailRecord.model_validate(entity)
+        quantity, price = self.repo.lock_amounts(data.order_number, data.product_code)
+
+        if data.model_fields_set.issuperset(OrderDetailRecord.model_fields):
+            self.repo.update_in_place(data)
+            record = data
+        else:
+            entity = self.repo.update(data)
+            record = OrderDetailRecord.model_validate(entity)
+
+        self._record(
+            [
+                _delta(record.order_number, 0, -quantity, price),
+                _delta(
+                    record.order_number, 0, record.quantity_ordered, record.price_each
+                ),
+            ]
+        )
+        return record
 
     def delete(self, order_number: int, product_code: str) -> None:
         """Delete an order detail by its composite key.
@@ -82,5 +150,24 @@ class OrderDetailService:
         Args:
             order_number: The order number
             product_code: The product code
+
+        Raises:
+            NotFoundException: If no record with the given keys exists
         """
+        quantity, price = self.repo.lock_amounts(order_number, product_code)
         self.repo.delete(order_number, product_code)
+        self._record([_delta(order_number, -1, -quantity, price)])
+
+    def _record(self, deltas: Sequence[OrderTotalDelta]) -> None:
+        """Apply line changes to the order totals, ledgers and sales rollups."""
+        self.totals.add(deltas)
+        self.ledgers.add_ordered(
+            (delta.order_number, delta.total_amount) for delta in deltas
+        )
+        self.rollups.mark_orders(delta.order_number for delta in deltas)
+
+
+def _delta(
+    order_number: int, lines: int, quantity: int, price: Decimal
+) -> OrderTotalDelta:
+    return OrderTotalDelta(order_number, lines, quantity, quantity * price)
@@ -0,0 +1,28 @@
+from decimal import Decimal
+
+from sqlalchemy import ForeignKey, Integer, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from applepy.db import Base
+
+
+class OrderTotal(Base):
+    """Database model for the running totals of an order's lines.
+
+    Maintained by OrderDetailService in the same transaction as each line
+    change, so reading an order's value is a primary-key lookup instead of a
+    scan of its lines.
+    """
+
+    __tablename__ = "order_totals"
+
+    order_number: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("orders.order_number", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    line_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    item_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_amount: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=0
+    )
@@ -0,0 +1,116 @@
+from decimal import Decimal
+from typing import Any, Iterable, NamedTuple, Optional, cast
+
+from sqlalchemy import Table, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from applepy.domains.order_details.models import OrderDetail
+from applepy.domains.orders.models import Order
+from applepy.repositories.base import affected_rows
+from applepy.repositories.upsert import increment_statement
+
+from .models import OrderTotal
+
+_COUNTERS = ["line_count", "item_count", "total_amount"]
+
+
+class OrderTotalDelta(NamedTuple):
+    """Change to the totals of one order."""
+
+    order_number: int
+    line_count: int
+    item_count: int
+    total_amount: Decimal
+
+
+class OrderTotalRepository:
+    """Order totals repository.
+
+    Totals are changed by adding deltas, never by reading and rewriting them,
+    so concurrent line changes to the same order cannot lose updates.
+    """
+
+    def __init__(self, session: Session) -> None:
+        """Initialize the OrderTotal repository.
+
+        Args:
+            session: SQLAlchemy session for database operations
+        """
+        self.session = session
+
+    def summary(self, order_number: int) -> Optional[Any]:
+        """Read an order's totals in one query.
+
+        Args:
+            order_number: The order number
+
+        Returns:
+            A row with order_number, line_count, item_count and total_amount
+            (zeros for an order without totals), or None if the order does
+            not exist
+        """
+        stmt = (
+            select(
+                Order.order_number,
+                func.coalesce(OrderTotal.line_count, 0).label("line_count"),
+                func.coalesce(OrderTotal.item_count, 0).label("item_count"),
+                func.coalesce(OrderTotal.total_amount, 0).label("total_amount"),
+            )
+            .outerjoin(OrderTotal, OrderTotal.order_number == Order.order_number)
+            .where(Order.order_number == order_number)
+        )
+        return self.session.execute(stmt).first()
+
+    def add(self, deltas: Iterable[OrderTotalDelta]) -> None:
+        """Add deltas to order totals, creating missing rows.
+
+        Uses the dialect's increment upsert (``ON DUPLICATE KEY UPDATE
+        line_count = line_count + VALUES(line_count), ...`` on MySQL), one
+        statement for all orders.
+
+        Args:
+            deltas: Changes to apply, at most one per order
+        """
+        rows = [delta._asdict() for delta in sorted(deltas)]  # consistent lock order
+        if not rows:
+            return
+
+        table = cast(Table, OrderTotal.__table__)
+        stmt = increment_statement(
+            self.session.get_bind().dialect.name, table, _COUNTERS
+        )
+        if stmt is not None:
+            self.session.execute(stmt, rows)
+            return
+
+        for row in rows:
+            result = self.session.execute(
+                update(OrderTotal)
+                .where(OrderTotal.order_number == row["order_number"])
+                .values(
+                    {name: getattr(OrderTotal, name) + row[name] for name in _COUNTERS}
+                )
+            )
+            if affected_rows(result) == 0:
+                self.session.execute(insert(OrderTotal), [row])
+
+    def rebuild(self) -> int:
+        """Recompute every order's totals from its lines.
+
+        Replaces the table's contents with one ``INSERT ... SELECT ... GROUP
+        BY`` over order_details.
+
+        Returns:
+            Number of orders with totals
+        """
+        self.session.execute(delete(OrderTotal))
+        lines = select(
+            OrderDetail.order_number,
+            func.count(),
+            func.sum(OrderDetail.quantity_ordered),
+            func.sum(OrderDetail.quantity_ordered * OrderDetail.price_each),
+        ).group_by(OrderDetail.order_number)
+        result = self.session.execute(
+            insert(OrderTotal).from_select(["order_number", *_COUNTERS], lines)
+        )
+        return affected_rows(result)
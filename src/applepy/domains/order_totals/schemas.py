@@ -0,0 +1,19 @@
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict
+
+
+class OrderTotalRecord(BaseModel):
+    """Validation for the totals of an order's lines on read."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    line_count: int
+    item_count: int
+    total_amount: Decimal
+
+
+class OrderSummary(OrderTotalRecord):
+    """Validation for an order summary on read."""
+
+    order_number: int
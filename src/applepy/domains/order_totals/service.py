@@ -0,0 +1,70 @@
+from typing import Iterable
+
+from sqlalchemy.orm import Session
+
+from applepy.exceptions import NotFoundException
+
+from .repository import OrderTotalDelta, OrderTotalRepository
+from .schemas import OrderSummary
+
+
+class OrderTotalService:
+    """Order totals service.
+
+    Keeps one row per order with its line count, item count (sum of
+    quantities) and total amount (sum of quantity * price).
+    """
+
+    def __init__(self, session: Session) -> None:
+        """Initialize the OrderTotal service.
+
+        Args:
+            session: SQLAlchemy session for database operations
+        """
+        self.repo = OrderTotalRepository(session)
+
+    def get_summary(self, order_number: int) -> OrderSummary:
+        """Retrieve the totals of an order.
+
+        Args:
+            order_number: The order number
+
+        Returns:
+            The order's summary; all zeros if it has no lines
+
+        Raises:
+            NotFoundException: If the order does not exist
+        """
+        row = self.repo.summary(order_number)
+        if row is None:
+            raise NotFoundException("Order not found")
+        return OrderSummary.model_validate(row._mapping)
+
+    def add(self, deltas: Iterable[OrderTotalDelta]) -> None:
+        """Apply changes to order totals in the session's transaction.
+
+        Deltas for the same order are merged first.
+
+        Args:
+            deltas: Changes caused by creating, updating or deleting lines
+        """
+        merged: dict[int, OrderTotalDelta] = {}
+        for delta in deltas:
+            previous = merged.get(delta.order_number)
+            if previous is not None:
+                delta = OrderTotalDelta(
+                    delta.order_number,
+                    previous.line_count + delta.line_count,
+                    previous.item_count + delta.item_count,
+                    previous.total_amount + delta.total_amount,
+                )
+            merged[delta.order_number] = delta
+        self.repo.add(merged.values())
+
+    def rebuild(self) -> int:
+        """Recompute all order totals from order_details.
+
+        Returns:
+            Number of orders with totals
+        """
+        return self.repo.rebuild()
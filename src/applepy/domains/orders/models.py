@@ -8,6 +8,8 @@ from applepy.db import Base
 
 if TYPE_CHECKING:
     from applepy.domains.customers.models import Customer
+    from applepy.domains.order_details.models import OrderDetail
+    from applepy.domains.order_totals.models import OrderTotal
 
 
 class Order(Base):
@@ -27,3 +29,9 @@ class Order(Base):
         Integer, ForeignKey("customers.customer_number"), nullable=False
     )
     customer: Mapped[Optional["Customer"]] = relationship("Customer")
+    # Read-only: lines are written through the order details routes
+    details: Mapped[list["OrderDetail"]] = relationship(
+        "OrderDetail", viewonly=True, order_by="OrderDetail.order_line_number"
+    )
+    # Read-only: maintained by OrderDetailService as lines change
+    totals: Mapped[Optional["OrderTotal"]] = relationship("OrderTotal", viewonly=True)
@@ -1,6 +1,13 @@
 """Order CRUD routes."""
 
+from flask import Blueprint, Response
+
+from applepy.exceptions import NotFoundException
+from applepy.responses import ApiResponse, FlaskApiResponse
 from applepy.routes.base import CrudRoutes
+from applepy.routes.conditional import conditional_response
+from applepy.serialization import record_json
+from applepy.session import get_session
 
 from .schemas import OrderCreate, OrderRecord
 from .service import OrderService
@@ -13,8 +20,12 @@ class OrderRoutes(CrudRoutes[OrderCreate, OrderRecord, int]):
     - GET /orders - List all orders
     - GET /orders/<order_number> - Get order by number
     - POST /orders - Create new order
+    - POST /orders/bulk - Create many orders in one transaction
     - PUT /orders/<order_number> - Update order
     - DELETE /orders/<order_number> - Delete order
+
+    And adds:
+    - GET /orders/<order_number>/summary - Line count, item count and total
     """
 
     path = "/orders"
@@ -22,3 +33,35 @@ class OrderRoutes(CrudRoutes[OrderCreate, OrderRecord, int]):
     create_schema = OrderCreate
     record_schema = OrderRecord
     id_param_name = "order_number"
+
+    def _create_blueprint(self) -> Blueprint:
+        """Add the summary endpoint to the CRUD blueprint."""
+        bp = super()._create_blueprint()
+        bp.add_url_rule(
+            "/<int:order_number>/summary",
+            "get_summary",
+            self.get_summary,
+            methods=["GET"],
+        )
+        return bp
+
+    def get_summary(self, order_number: int) -> FlaskApiResponse | Response:
+        """Get an order's totals.
+
+        Returns:
+            200: The order's line count, item count and total amount
+            304: The client's cached copy (If-None-Match) is still current
+            404: Order not found
+            500: Server error
+        """
+        try:
+            with get_session(read_only=True) as session:
+                service = OrderService(session)
+                summary = service.get_summary(order_number)
+                return conditional_response(record_json(summary))
+        except NotFoundException as e:
+            error_response: ApiResponse[None] = ApiResponse(error=str(e))
+            return error_response.model_dump(), 404
+        except Exception as e:
+            error_response = ApiResponse(error=str(e))
+            return error_response.model_dump(), 500
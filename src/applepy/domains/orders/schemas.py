@@ -1,7 +1,9 @@
 from datetime import date
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from applepy.domains.order_details.schemas import OrderLineCreate
 
 
 class OrderBase(BaseModel):
@@ -18,9 +20,24 @@ class OrderBase(BaseModel):
 
 
 class OrderCreate(OrderBase):
-    """Validation for new order on creation."""
-
-    pass
+    """Validation for new order on creation.
+
+    ``details`` optionally lists the order's lines, which are created in the
+    same transaction. It is excluded from model_dump() since it is not a
+    column of the order row.
+    """
+
+    details: list[OrderLineCreate] = Field(default_factory=list, exclude=True)
+
+    @field_validator("details")
+    @classmethod
+    def _one_line_per_product(
+        cls, details: list[OrderLineCreate]
+    ) -> list[OrderLineCreate]:
+        codes = [line.product_code for line in details]
+        if len(set(codes)) != len(codes):
+            raise ValueError("Each product may only appear on one line")
+        return details
 
 
 class OrderRecord(OrderBase):
@@ -1,5 +1,18 @@
+from typing import Sequence, cast
+
 from sqlalchemy.orm import Session
 
+from applepy.domains.customer_ledgers.service import CustomerLedgerService
+from applepy.domains.customers.schemas import CustomerRecord
+from applepy.domains.employees.schemas import EmployeeRecord
+from applepy.domains.order_details.schemas import OrderDetailCreate, OrderDetailRecord
+from applepy.domains.order_details.service import OrderDetailService
+from applepy.domains.order_totals.schemas import OrderSummary, OrderTotalRecord
+from applepy.domains.order_totals.service import OrderTotalService
+from applepy.domains.products.schemas import ProductRecord
+from applepy.domains.sales_rollups.service import SalesRollupService
+from applepy.exceptions import ValidationError
+from applepy.includes import include_schema
 from applepy.services.base import BaseService
 
 from .models import Order
@@ -10,9 +23,19 @@ from .schemas import OrderCreate, OrderRecord
 class OrderService(BaseService[Order, int, OrderCreate, OrderRecord]):
     """Order service for CRUD operations on Order entities.
 
-    Inherits all business logic from BaseService.
+    Inherits all business logic from BaseService. The customer (and their
+    sales rep), the order lines (and their products) and the order's
+    totals can be included.
     """
 
+    includes = {
+        "customer": CustomerRecord,
+        "customer.sales_rep": EmployeeRecord,
+        "details": OrderDetailRecord,
+        "details.product": ProductRecord,
+        "totals": OrderTotalRecord,
+    }
+
     def __init__(self, session: Session) -> None:
         """Initialize the Order service.
 
@@ -21,3 +44,100 @@ class OrderService(BaseService[Order, int, OrderCreate, OrderRecord]):
         """
         repo = OrderRepository(session)
         super().__init__(repo, OrderRecord)
+
+    def create(self, data: OrderCreate) -> OrderRecord:
+        """Create an order together with its lines.
+
+        The order row is flushed once to obtain its number. The lines are
+        then numbered from 1 in request order and inserted with a single
+        multi-row INSERT, in the same transaction.
+
+        Args:
+            data: Order to create, optionally with ``details``
+
+        Returns:
+            The created order, with its lines embedded as ``details`` when any
+            were given
+        """
+        record = super().create(data)
+        if not data.details:
+            return record
+
+        lines = [
+            OrderDetailCreate(
+                order_number=record.order_number,
+                order_line_number=number,
+                **line.model_dump(),
+            )
+            for number, line in enumerate(data.details, start=1)
+        ]
+        OrderDetailService(self.repo.session).bulk_create(lines)
+
+        schema = include_schema(OrderRecord, Order, (("details", OrderDetailRecord),))
+        return cast(
+            OrderRecord,
+            schema(
+                **record.model_dump(), details=[line.model_dump() for line in lines]
+            ),
+        )
+
+    def update(self, data: OrderRecord) -> OrderRecord:
+        """Update an existing order.
+
+        When the update sets ``customer_number``, the order's previous
+        customer is read (and the order row locked) first. If it changed, the
+        order's total moves to the new customer's ledger. When it sets
+        ``customer_number`` or ``order_date``, the order's months before and
+        after the update are marked for a sales rollup refresh.
+
+        Args:
+            data: Pydantic record schema with updated field values
+
+        Returns:
+            The updated order
+
+        Raises:
+            NotFoundException: If the order does not exist
+        """
+        moved = "customer_number" in data.model_fields_set
+        if not moved and "order_date" not in data.model_fields_set:
+            return super().update(data)
+
+        ledgers = CustomerLedgerService(self.repo.session)
+        rollups = SalesRollupService(self.repo.session)
+        previous = ledgers.order_customer(data.order_number) if moved else None
+        rollups.mark_orders([data.order_number])
+        record = super().update(data)
+        rollups.mark_orders([record.order_number])
+        if previous is not None:
+            ledgers.move_order(record.order_number, previous, record.customer_number)
+        return record
+
+    def get_summary(self, order_number: int) -> OrderSummary:
+        """Retrieve an order's line count, item count and total amount.
+
+        Read from the order_totals summary table, not from the lines.
+
+        Args:
+            order_number: The order number
+
+        Returns:
+            The order's summary
+
+        Raises:
+            NotFoundException: If the order does not exist
+        """
+        return OrderTotalService(self.repo.session).get_summary(order_number)
+
+    def bulk_create(self, items: Sequence[OrderCreate]) -> int:
+        """Create many orders in one multi-row INSERT.
+
+        Raises:
+            ValidationError: If an order carries details; orders with lines
+                must be created one at a time so their numbers are known
+        """
+        if any(item.details for item in items):
+            raise ValidationError(
+                "Orders with details cannot be bulk created; POST /orders instead"
+            )
+        return super().bulk_create(items)
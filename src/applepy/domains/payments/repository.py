@@ -1,10 +1,19 @@
+from decimal import Decimal
+from typing import Iterator, Sequence
+
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
 from applepy.exceptions import NotFoundException
+from applepy.repositories.base import affected_rows
+from applepy.repositories.lookup import get_by_key, primary_key_select
 
 from .models import Payment
 from .schemas import PaymentCreate, PaymentRecord
 
+# Pre-built primary-key SELECT used by get()
+_GET_STATEMENT = primary_key_select(Payment)
+
 
 class PaymentRepository:
     """Payment repository for CRUD operations on Payment entities.
@@ -28,9 +37,22 @@ class PaymentRepository:
         """
         return self.session.query(Payment).all()
 
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Payment]:
+        """Iterate over all payments using a server-side cursor.
+
+        Args:
+            batch_size: Number of rows to fetch per round trip
+
+        Returns:
+            Iterator over Payment instances
+        """
+        return iter(self.session.query(Payment).yield_per(batch_size))
+
     def get(self, customer_number: int, check_number: str) -> Payment:
         """Retrieve a payment by its composite key.
 
+        Repeated lookups within a session are served from the identity map.
+
         Args:
             customer_number: The customer number
             check_number: The check number
@@ -41,19 +63,44 @@ class PaymentRepository:
         Raises:
             NotFoundException: If no record with the given keys exists
         """
-        entity = (
-            self.session.query(Payment)
-            .filter(
+        entity = get_by_key(
+            self.session, Payment, _GET_STATEMENT, (customer_number, check_number)
+        )
+
+        if not entity:
+            raise NotFoundException("Payment not found")
+
+        return entity
+
+    def lock_amount(self, customer_number: int, check_number: str) -> Decimal:
+        """Read a payment's amount, locking the row.
+
+        The row stays locked (``SELECT ... FOR UPDATE``) until the transaction
+        ends, so the amount cannot change before the caller writes.
+
+        Args:
+            customer_number: The customer number
+            check_number: The check number
+
+        Returns:
+            The payment's amount
+
+        Raises:
+            NotFoundException: If no record with the given keys exists
+        """
+        amount = self.session.scalar(
+            select(Payment.amount)
+            .where(
                 Payment.customer_number == customer_number,
                 Payment.check_number == check_number,
             )
-            .first()
+            .with_for_update()
         )
 
-        if not entity:
+        if amount is None:
             raise NotFoundException("Payment not found")
 
-        return entity
+        return Decimal(amount)
 
     def get_by_customer(self, customer_number: int) -> list[Payment]:
         """Retrieve all payments for a customer.
@@ -84,30 +131,60 @@ class PaymentRepository:
         self.session.flush()
         return entity
 
-    def update(self, data: PaymentRecord) -> Payment:
-        """Update an existing payment.
+    def bulk_create(self, items: Sequence[PaymentCreate]) -> int:
+        """Insert many payments with a single multi-row INSERT.
 
         Args:
-            data: Pydantic schema instance with field values
+            items: Validated create schemas
 
         Returns:
-            The updated Payment instance
+            Number of rows inserted
+        """
+        rows = [item.model_dump() for item in items]
+        if rows:
+            self.session.execute(insert(Payment), rows)
+        return len(rows)
+
+    def update_in_place(self, data: PaymentRecord) -> None:
+        """Update an existing payment with a single UPDATE statement.
+
+        The row is not loaded first; the rowcount tells whether it exists.
+
+        Args:
+            data: Pydantic schema instance with field values
 
         Raises:
             NotFoundException: If no record with the given keys exists
         """
-        entity = (
-            self.session.query(Payment)
-            .filter(
+        values = data.model_dump(exclude_unset=True)
+        values.pop("customer_number", None)
+        values.pop("check_number", None)
+
+        result = self.session.execute(
+            update(Payment)
+            .where(
                 Payment.customer_number == data.customer_number,
                 Payment.check_number == data.check_number,
             )
-            .first()
+            .values(**values)
         )
-
-        if not entity:
+        if affected_rows(result) == 0:
             raise NotFoundException("Payment not found")
 
+    def update(self, data: PaymentRecord) -> Payment:
+        """Update an existing payment.
+
+        Args:
+            data: Pydantic schema instance with field values
+
+        Returns:
+            The updated Payment instance
+
+        Raises:
+            NotFoundException: If no record with the given keys exists
+        """
+        entity = self.get(data.customer_number, data.check_number)
+
         update_data = data.model_dump(exclude_unset=True)
         update_data.pop("customer_number", None)
         update_data.pop("check_number", None)
@@ -127,16 +204,11 @@ class PaymentRepository:
         Raises:
             NotFoundException: If no record with the given keys exists
         """
-        entity = (
-            self.session.query(Payment)
-            .filter(
+        result = self.session.execute(
+            delete(Payment).where(
                 Payment.customer_number == customer_number,
                 Payment.check_number == check_number,
             )
-            .first()
         )
-
-        if not entity:
+        if affected_rows(result) == 0:
             raise NotFoundException("Payment not found")
-
-        self.session.delete(entity)
@@ -1,21 +1,30 @@
 """Payment routes with composite key support."""
 
+from typing import Iterator
+
 from flask import Blueprint, Response, jsonify, request
 
-from applepy.session import get_session
+from applepy.exceptions import ValidationError
+from applepy.routes.bulk import bulk_adapter, parse_bulk
+from applepy.routes.streaming import STREAM_BATCH_SIZE, ndjson_response, wants_ndjson
+from applepy.serialization import json_response, records_json
+from applepy.session import get_session, get_stream_session
 
 from .schemas import PaymentCreate, PaymentRecord
 from .service import PaymentService
 
+_bulk_adapter = bulk_adapter(PaymentCreate)
+
 
 class PaymentRoutes:
     """Routes for payments with composite primary key.
 
     Endpoints:
-    - GET /payments - List all payments
+    - GET /payments - List all payments (JSON or streamed NDJSON)
     - GET /payments/<customer_number>/<check_number> - Get by composite key
     - GET /customers/<customer_number>/payments - Get all payments for customer
     - POST /payments - Create new payment
+    - POST /payments/bulk - Create many payments in one transaction
     - PUT /payments/<customer_number>/<check_number> - Update payment
     - DELETE /payments/<customer_number>/<check_number> - Delete payment
     """
@@ -49,6 +58,12 @@ class PaymentRoutes:
             cls.create,
             methods=["POST"],
         )
+        app.add_url_rule(
+            f"{cls.path}/bulk",
+            f"{cls.path}_bulk_create",
+            cls.bulk_create,
+            methods=["POST"],
+        )
         app.add_url_rule(
             f"{cls.path}/<int:customer_number>/<check_number>",
             f"{cls.path}_update",
@@ -64,37 +79,63 @@ class PaymentRoutes:
 
     @staticmethod
     def list_all() -> Response:
-        """List all payments."""
-        with get_session() as session:
+        """List all payments.
+
+        Streams NDJSON when the client sends ``Accept: application/x-ndjson``.
+        """
+        if wants_ndjson():
+
+            def stream() -> Iterator[PaymentRecord]:
+                with get_stream_session(read_only=True) as session:
+                    service = PaymentService(session)
+                    yield from service.iter_all(STREAM_BATCH_SIZE)
+
+            return ndjson_response(stream())
+
+        with get_session(read_only=True) as session:
             service = PaymentService(session)
             records = service.all()
-            return jsonify([r.model_dump() for r in records])
+            return json_response(records_json(PaymentRecord, records))
 
     @staticmethod
     def get(customer_number: int, check_number: str) -> Response:
         """Get payment by composite key."""
-        with get_session() as session:
+        with get_session(read_only=True) as session:
             service = PaymentService(session)
             record = service.get(customer_number, check_number)
-            return jsonify(record.model_dump())
+            return json_response(record.model_dump_json().encode())
 
     @staticmethod
     def get_by_customer(customer_number: int) -> Response:
         """Get all payments for a customer."""
-        with get_session() as session:
+        with get_session(read_only=True) as session:
             service = PaymentService(session)
             records = service.get_by_customer(customer_number)
-            return jsonify([r.model_dump() for r in records])
+            return json_response(records_json(PaymentRecord, records))
 
     @staticmethod
-    def create() -> tuple[Response, int]:
+    def create() -> Response:
         """Create new payment."""
         data = PaymentCreate(**request.get_json())
         with get_session() as session:
             service = PaymentService(session)
             record = service.create(data)
             session.commit()
-            return jsonify(record.model_dump()), 201
+            return json_response(record.model_dump_json().encode(), 201)
+
+    @staticmethod
+    def bulk_create() -> tuple[Response, int]:
+        """Create many payments from a JSON array in one transaction."""
+        try:
+            items = parse_bulk(_bulk_adapter, request.get_json())
+        except ValidationError as e:
+            return jsonify({"error": str(e)}), 400
+
+        with get_session() as session:
+            service = PaymentService(session)
+            count = service.bulk_create(items)
+            session.commit()
+            return jsonify({"count": count}), 201
 
     @staticmethod
     def update(customer_number: int, check_number: str) -> Response:
@@ -107,7 +148,7 @@ class PaymentRoutes:
             service = PaymentService(session)
             record = service.update(data)
             session.commit()
-            return jsonify(record.model_dump())
+            return json_response(record.model_dump_json().encode())
 
     @staticmethod
     def delete(customer_number: int, check_number: str) -> tuple[Response, int]:
@@ -1,5 +1,10 @@
+from typing import Iterator, Sequence
+
 from sqlalchemy.orm import Session
 
+from applepy.domains.customer_ledgers.service import CustomerLedgerService
+from applepy.serialization import validate_all
+
 from .repository import PaymentRepository
 from .schemas import PaymentCreate, PaymentRecord
 
@@ -7,7 +12,9 @@ from .schemas import PaymentCreate, PaymentRecord
 class PaymentService:
     """Payment service for CRUD operations on Payment entities.
 
-    Uses composite primary key (customer_number, check_number).
+    Uses composite primary key (customer_number, check_number). Every write
+    also updates the customer's ledger (see CustomerLedgerService) in the
+    same transaction.
     """
 
     def __init__(self, session: Session) -> None:
@@ -17,6 +24,7 @@ class PaymentService:
             session: SQLAlchemy session for database operations
         """
         self.repo = PaymentRepository(session)
+        self.ledgers = CustomerLedgerService(session)
 
     def all(self) -> list[PaymentRecord]:
         """Retrieve all payments.
@@ -25,7 +33,19 @@ class PaymentService:
             List of all PaymentRecord instances
         """
         entities = self.repo.all()
-        return [PaymentRecord.model_validate(e) for e in entities]
+        return validate_all(PaymentRecord, entities)
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[PaymentRecord]:
+        """Stream all payments, transforming each one as it is read.
+
+        Args:
+            batch_size: Number of rows to fetch per round trip
+
+        Returns:
+            Iterator over PaymentRecord instances
+        """
+        for entity in self.repo.iter_all(batch_size):
+            yield PaymentRecord.model_validate(entity)
 
     def get(self, customer_number: int, check_number: str) -> PaymentRecord:
         """Retrieve a payment by its composite key.
@@ -50,7 +70,7 @@ class PaymentService:
             List of PaymentRecord instances for the customer
         """
         entities = self.repo.get_by_customer(customer_number)
-        return [PaymentRecord.model_validate(e) for e in entities]
+        return validate_all(PaymentRecord, entities)
 
     def create(self, data: PaymentCreate) -> PaymentRecord:
         """Create a new payment.
@@ -62,19 +82,45 @@ class PaymentService:
             The newly created PaymentRecord instance
         """
         entity = self.repo.create(data)
+        self.ledgers.add_paid([(data.customer_number, data.amount)])
         return PaymentRecord.model_validate(entity)
 
+    def bulk_create(self, items: Sequence[PaymentCreate]) -> int:
+        """Create many payments in one multi-row INSERT.
+
+        Args:
+            items: Validated create schemas
+
+        Returns:
+            Number of payments created
+        """
+        count = self.repo.bulk_create(items)
+        self.ledgers.add_paid((item.customer_number, item.amount) for item in items)
+        return count
+
     def update(self, data: PaymentRecord) -> PaymentRecord:
         """Update an existing payment.
 
+        The previous amount is read (and the row locked) first, so the
+        customer's ledger can be adjusted by the difference.
+
         Args:
             data: Pydantic schema instance with field values
 
         Returns:
             The updated PaymentRecord instance
         """
-        entity = self.repo.update(data)
-        return PaymentRecord.model_validate(entity)
+        amount = self.repo.lock_amount(data.customer_number, data.check_number)
+
+        if data.model_fields_set.issuperset(PaymentRecord.model_fields):
+            self.repo.update_in_place(data)
+            record = data
+        else:
+            entity = self.repo.update(data)
+            record = PaymentRecord.model_validate(entity)
+
+        self.ledgers.add_paid([(record.customer_number, record.amount - amount)])
+        return record
 
     def delete(self, customer_number: int, check_number: str) -> None:
         """Delete a payment by its composite key.
@@ -83,4 +129,6 @@ class PaymentService:
             customer_number: The customer number
             check_number: The check number
         """
+        amount = self.repo.lock_amount(customer_number, check_number)
         self.repo.delete(customer_number, check_number)
+        self.ledgers.add_paid([(customer_number, -amount)])
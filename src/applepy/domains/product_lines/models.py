@@ -1,13 +1,22 @@
 from typing import Optional
 
-from sqlalchemy import String, Text
+from sqlalchemy import LargeBinary, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from applepy.db import Base
 
+# Largest image accepted by PUT /product-lines/<product_line>/image (MEDIUMBLOB)
+MAX_IMAGE_BYTES = 16 * 1024 * 1024 - 1
+
 
 class ProductLine(Base):
-    """Database model for product line data."""
+    """Database model for product line data.
+
+    The image is deferred: loading a product line does not read the image
+    bytes, which are only served by the image endpoint. Its content type and
+    SHA-256 hash are stored next to it so the endpoint can answer conditional
+    and range requests without reading the image.
+    """
 
     __tablename__ = "product_lines"
 
@@ -16,4 +25,10 @@ class ProductLine(Base):
         String(4000), nullable=True, default=None
     )
     html_description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    image: Mapped[Optional[bytes]] = mapped_column(nullable=True)
+    image: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary(MAX_IMAGE_BYTES), nullable=True, deferred=True
+    )
+    image_content_type: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True
+    )
+    image_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
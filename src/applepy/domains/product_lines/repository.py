@@ -1,19 +1,39 @@
+import hashlib
+from typing import Iterator, NamedTuple
+
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
-from applepy.repositories.base import BaseRepository
+from applepy.exceptions import NotFoundException
+from applepy.repositories.base import BaseRepository, affected_rows
 
 from .models import ProductLine
 from .schemas import ProductLineCreate, ProductLineRecord
 
+# Bytes read per query when hashing an image stored without its hash
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class ImageInfo(NamedTuple):
+    """Metadata of a stored product line image."""
+
+    content_type: str
+    sha256: str
+    size: int
+
 
 class ProductLineRepository(
     BaseRepository[ProductLine, str, ProductLineCreate, ProductLineRecord]
 ):
     """Product line repository for CRUD operations on ProductLine entities.
 
-    Inherits all CRUD operations from BaseRepository.
+    Inherits all CRUD operations from BaseRepository. Filtering and sorting are
+    limited to the short columns; the descriptions and image are not indexed.
+    The image is read and written only by the image methods below.
     """
 
+    filterable_fields = ("product_line", "text_description")
+
     def __init__(self, session: Session) -> None:
         """Initialize the ProductLine repository.
 
@@ -21,3 +41,90 @@ class ProductLineRepository(
             session: SQLAlchemy session for database operations
         """
         super().__init__(session, ProductLine, "product_line")
+
+    def image_info(self, product_line: str) -> ImageInfo:
+        """Return an image's metadata without reading its bytes.
+
+        Args:
+            product_line: Product line name
+
+        An image stored without its hash (written outside write_image()) is
+        read once to compute it.
+
+        Returns:
+            Content type, SHA-256 hex digest and size in bytes
+
+        Raises:
+            NotFoundException: If the product line or its image does not exist
+        """
+        row = self.session.execute(
+            select(
+                ProductLine.image_content_type,
+                ProductLine.image_hash,
+                func.length(ProductLine.image),
+            ).where(ProductLine.product_line == product_line)
+        ).one_or_none()
+        if row is None:
+            raise NotFoundException("ProductLine not found")
+
+        content_type, sha256, size = row
+        if size is None:
+            raise NotFoundException("Image not found")
+        if sha256 is None:
+            digest = hashlib.sha256()
+            for chunk in self.read_image(product_line, 0, size, _HASH_CHUNK_SIZE):
+                digest.update(chunk)
+            sha256 = digest.hexdigest()
+        return ImageInfo(content_type or "application/octet-stream", sha256, int(size))
+
+    def read_image(
+        self, product_line: str, start: int, stop: int, chunk_size: int
+    ) -> Iterator[bytes]:
+        """Read the bytes ``[start, stop)`` of an image, one chunk per query.
+
+        Each chunk is selected with ``SUBSTR``, so no more than chunk_size
+        bytes are held in memory at a time.
+
+        Args:
+            product_line: Product line name
+            start: Offset of the first byte
+            stop: Offset after the last byte
+            chunk_size: Bytes to read per query
+
+        Returns:
+            Iterator over the chunks
+        """
+        for offset in range(start, stop, chunk_size):
+            length = min(chunk_size, stop - offset)
+            chunk = self.session.scalar(
+                select(func.substr(ProductLine.image, offset + 1, length)).where(
+                    ProductLine.product_line == product_line
+                )
+            )
+            if not chunk:
+                return
+            yield bytes(chunk)
+
+    def write_image(self, product_line: str, data: bytes, content_type: str) -> str:
+        """Store an image with a single UPDATE.
+
+        Args:
+            product_line: Product line name
+            data: Image bytes
+            content_type: Media type of the image
+
+        Returns:
+            SHA-256 hex digest of the image
+
+        Raises:
+            NotFoundException: If the product line does not exist
+        """
+        sha256 = hashlib.sha256(data).hexdigest()
+        result = self.session.execute(
+            update(ProductLine)
+            .where(ProductLine.product_line == product_line)
+            .values(image=data, image_content_type=content_type, image_hash=sha256)
+        )
+        if affected_rows(result) == 0:
+            raise NotFoundException("ProductLine not found")
+        return sha256
@@ -1,10 +1,24 @@
 """ProductLine CRUD routes."""
 
+from contextlib import ExitStack
+from typing import Any
+
+from flask import Blueprint, Response, request
+from werkzeug.datastructures import ContentRange
+
+from applepy.exceptions import NotFoundException
+from applepy.responses import ApiResponse, FlaskApiResponse
 from applepy.routes.base import CrudRoutes
+from applepy.routes.conditional import not_modified
+from applepy.session import get_session, get_stream_session
 
+from .models import MAX_IMAGE_BYTES
 from .schemas import ProductLineCreate, ProductLineRecord
 from .service import ProductLineService
 
+# Bytes read from the database per query when streaming an image
+IMAGE_CHUNK_SIZE = 256 * 1024
+
 
 class ProductLineRoutes(CrudRoutes[ProductLineCreate, ProductLineRecord, str]):
     """CRUD routes for product lines.
@@ -13,8 +27,13 @@ class ProductLineRoutes(CrudRoutes[ProductLineCreate, ProductLineRecord, str]):
     - GET /product-lines - List all product lines
     - GET /product-lines/<product_line> - Get product line by name
     - POST /product-lines - Create new product line
+    - POST /product-lines/bulk - Create many product lines in one transaction
     - PUT /product-lines/<product_line> - Update product line
     - DELETE /product-lines/<product_line> - Delete product line
+
+    And adds:
+    - GET /product-lines/<product_line>/image - Stream the image
+    - PUT /product-lines/<product_line>/image - Upload the image
     """
 
     path = "/product-lines"
@@ -22,3 +41,125 @@ class ProductLineRoutes(CrudRoutes[ProductLineCreate, ProductLineRecord, str]):
     create_schema = ProductLineCreate
     record_schema = ProductLineRecord
     id_param_name = "product_line"
+
+    def _create_blueprint(self) -> Blueprint:
+        """Add the image endpoints to the CRUD blueprint."""
+        bp = super()._create_blueprint()
+        bp.add_url_rule(
+            "/<product_line>/image", "get_image", self.get_image, methods=["GET"]
+        )
+        bp.add_url_rule(
+            "/<product_line>/image", "put_image", self.put_image, methods=["PUT"]
+        )
+        return bp
+
+    def get_image(self, product_line: str) -> FlaskApiResponse | Response:
+        """Stream a product line's image.
+
+        The image is read from the database in IMAGE_CHUNK_SIZE pieces while
+        the response is sent, through a session of its own that is closed once
+        the body has been sent. The ETag is the SHA-256 of the image. A single
+        ``Range: bytes=...`` is honored (subject to ``If-Range``) with a
+        ``206 Partial Content``; requests for several ranges get the whole
+        image.
+
+        Returns:
+            200: The image
+            206: The requested byte range
+            304: The client's cached copy (If-None-Match) is still current
+            404: Product line or image not found
+            416: The requested range lies outside the image
+            500: Server error
+        """
+        stack = ExitStack()
+        try:
+            session = stack.enter_context(get_stream_session(read_only=True))
+            service = ProductLineService(session)
+            info = service.get_image_info(product_line)
+        except NotFoundException as e:
+            stack.close()
+            error_response: ApiResponse[None] = ApiResponse(error=str(e))
+            return error_response.model_dump(), 404
+        except Exception as e:
+            stack.close()
+            error_response = ApiResponse(error=str(e))
+            return error_response.model_dump(), 500
+
+        cached = not_modified(info.sha256)
+        if cached is not None:
+            stack.close()
+            return cached
+
+        start, stop, status = 0, info.size, 200
+        byte_range = request.range
+        if_range = request.if_range
+        if (
+            byte_range is not None
+            and len(byte_range.ranges) == 1
+            and (if_range.etag is None or if_range.etag == info.sha256)
+            and if_range.date is None
+        ):
+            bounds = byte_range.range_for_length(info.size)
+            if bounds is None:
+                stack.close()
+                response = Response(status=416)
+                response.content_range = ContentRange("bytes", None, None, info.size)
+                return response
+            start, stop = bounds
+            status = 206
+
+        response = Response(
+            service.iter_image(product_line, start, stop, IMAGE_CHUNK_SIZE),
+            status=status,
+            mimetype=info.content_type,
+        )
+        response.content_length = stop - start
+        response.accept_ranges = "bytes"
+        response.set_etag(info.sha256)
+        if status == 206:
+            response.content_range = ContentRange("bytes", start, stop, info.size)
+        response.call_on_close(stack.close)
+        return response
+
+    def put_image(self, product_line: str) -> FlaskApiResponse | Any:
+        """Upload a product line's image.
+
+        The request body is the raw image and its Content-Type is stored as
+        the image's media type.
+
+        Returns:
+            200: Image stored; the ETag header carries its hash
+            400: Empty body
+            404: Product line not found
+            413: Image larger than MAX_IMAGE_BYTES
+            500: Server error
+        """
+        if (request.content_length or 0) > MAX_IMAGE_BYTES:
+            error_response: ApiResponse[None] = ApiResponse(
+                error=f"Image exceeds {MAX_IMAGE_BYTES} bytes"
+            )
+            return error_response.model_dump(), 413
+
+        data = request.get_data(cache=False)
+        if not data:
+            error_response = ApiResponse(error="No image data provided")
+            return error_response.model_dump(), 400
+        if len(data) > MAX_IMAGE_BYTES:
+            error_response = ApiResponse(error=f"Image exceeds {MAX_IMAGE_BYTES} bytes")
+            return error_response.model_dump(), 413
+
+        content_type = request.mimetype or "application/octet-stream"
+        try:
+            with get_session() as session:
+                service = ProductLineService(session)
+                sha256 = service.set_image(product_line, data, content_type)
+                session.commit()
+        except NotFoundException as e:
+            error_response = ApiResponse(error=str(e))
+            return error_response.model_dump(), 404
+        except Exception as e:
+            error_response = ApiResponse(error=str(e))
+            return error_response.model_dump(), 500
+
+        response: ApiResponse[None] = ApiResponse(message="Image uploaded")
+        return response.model_dump(), 200, {"ETag": f'"{sha256}"'}
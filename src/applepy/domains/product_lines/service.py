@@ -1,18 +1,21 @@
+from typing import Iterator
+
 from sqlalchemy.orm import Session
 
-from applepy.services.base import BaseService
+from applepy.services.cached import CachedService
 
 from .models import ProductLine
-from .repository import ProductLineRepository
+from .repository import ImageInfo, ProductLineRepository
 from .schemas import ProductLineCreate, ProductLineRecord
 
 
 class ProductLineService(
-    BaseService[ProductLine, str, ProductLineCreate, ProductLineRecord]
+    CachedService[ProductLine, str, ProductLineCreate, ProductLineRecord]
 ):
     """Product line service for CRUD operations on ProductLine entities.
 
-    Inherits all business logic from BaseService.
+    Inherits all business logic from BaseService; reads are cached (see
+    CachedService).
     """
 
     def __init__(self, session: Session) -> None:
@@ -21,5 +24,30 @@ class ProductLineService(
         Args:
             session: SQLAlchemy session for database operations
         """
-        repo = ProductLineRepository(session)
-        super().__init__(repo, ProductLineRecord)
+        self.repo: ProductLineRepository = ProductLineRepository(session)
+        super().__init__(self.repo, ProductLineRecord)
+
+    def get_image_info(self, product_line: str) -> ImageInfo:
+        """Return the content type, hash and size of a product line's image.
+
+        Raises:
+            NotFoundException: If the product line or its image does not exist
+        """
+        return self.repo.image_info(product_line)
+
+    def iter_image(
+        self, product_line: str, start: int, stop: int, chunk_size: int
+    ) -> Iterator[bytes]:
+        """Stream the bytes ``[start, stop)`` of a product line's image."""
+        return self.repo.read_image(product_line, start, stop, chunk_size)
+
+    def set_image(self, product_line: str, data: bytes, content_type: str) -> str:
+        """Replace a product line's image.
+
+        Returns:
+            SHA-256 hex digest of the image, used as its ETag
+
+        Raises:
+            NotFoundException: If the product line does not exist
+        """
+        return self.repo.write_image(product_line, data, content_type)
@@ -13,6 +13,8 @@ class ProductRoutes(CrudRoutes[ProductCreate, ProductRecord, str]):
     - GET /products - List all products
     - GET /products/<product_code> - Get product by code
     - POST /products - Create new product
+    - POST /products/bulk - Create many products in one transaction
+    - PUT /products/bulk - Insert or update many products by product_code
     - PUT /products/<product_code> - Update product
     - DELETE /products/<product_code> - Delete product
     """
@@ -22,3 +24,4 @@ class ProductRoutes(CrudRoutes[ProductCreate, ProductRecord, str]):
     create_schema = ProductCreate
     record_schema = ProductRecord
     id_param_name = "product_code"
+    allow_bulk_upsert = True
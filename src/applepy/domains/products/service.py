@@ -1,18 +1,22 @@
 from sqlalchemy.orm import Session
 
-from applepy.services.base import BaseService
+from applepy.domains.product_lines.schemas import ProductLineRecord
+from applepy.services.cached import CachedService
 
 from .models import Product
 from .repository import ProductRepository
 from .schemas import ProductCreate, ProductRecord
 
 
-class ProductService(BaseService[Product, str, ProductCreate, ProductRecord]):
+class ProductService(CachedService[Product, str, ProductCreate, ProductRecord]):
     """Product service for CRUD operations on Product entities.
 
-    Inherits all business logic from BaseService.
+    Inherits all business logic from BaseService; reads are cached (see
+    CachedService). The product line can be included.
     """
 
+    includes = {"product_line_ref": ProductLineRecord}
+
     def __init__(self, session: Session) -> None:
         """Initialize the Product service.
 
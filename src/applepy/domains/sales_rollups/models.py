@@ -0,0 +1,46 @@
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import Index, Integer, Numeric, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from applepy.db import Base
+
+
+class SalesRollup(Base):
+    """Database model for pre-aggregated sales.
+
+    One row per month, product line, product vendor, customer country and
+    sales office, with the revenue, units and number of orders of the lines
+    in that cell. Refreshed month by month from orders and order_details
+    (see SalesRollupService), so analytics read a few thousand rows instead
+    of every order line.
+    """
+
+    __tablename__ = "sales_rollups"
+    __table_args__ = (Index("ix_sales_rollups_year_month", "year", "month"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    year: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    month: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    product_line: Mapped[str] = mapped_column(String(50), nullable=False)
+    product_vendor: Mapped[str] = mapped_column(String(50), nullable=False)
+    country: Mapped[str] = mapped_column(String(50), nullable=False)
+    # The customer's sales rep's office; None for customers without one
+    office_code: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    revenue: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    units: Mapped[int] = mapped_column(Integer, nullable=False)
+    order_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class StaleSalesMonth(Base):
+    """Database model for a month whose rollups must be recomputed.
+
+    Written in the same transaction as each order or order line change and
+    removed when the month is refreshed.
+    """
+
+    __tablename__ = "sales_rollup_stale_months"
+
+    year: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    month: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
@@ -0,0 +1,318 @@
+from datetime import date
+from typing import Any, Iterable, Mapping, NamedTuple, Optional, Sequence, cast
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    SQLColumnExpression,
+    Table,
+    and_,
+    delete,
+    distinct,
+    extract,
+    func,
+    insert,
+    or_,
+    select,
+)
+from sqlalchemy.orm import Session
+
+from applepy.domains.customers.models import Customer
+from applepy.domains.employees.models import Employee
+from applepy.domains.order_details.models import OrderDetail
+from applepy.domains.orders.models import Order
+from applepy.domains.products.models import Product
+from applepy.repositories.base import affected_rows
+from applepy.repositories.upsert import upsert_statement
+
+from .models import SalesRollup, StaleSalesMonth
+from .schemas import DIMENSIONS, MEASURES
+
+
+class Month(NamedTuple):
+    """A calendar month."""
+
+    year: int
+    month: int
+
+    def bounds(self) -> tuple[date, date]:
+        """Return the month's first day and the first day of the next month."""
+        if self.month == 12:
+            return date(self.year, 12, 1), date(self.year + 1, 1, 1)
+        return date(self.year, self.month, 1), date(self.year, self.month + 1, 1)
+
+
+class _Source(NamedTuple):
+    """Columns to group and sum when reading sales from one set of tables."""
+
+    year: SQLColumnExpression[Any]
+    month: SQLColumnExpression[Any]
+    dimensions: Mapping[str, SQLColumnExpression[Any]]
+    measures: Mapping[str, SQLColumnExpression[Any]]
+
+
+# Sales computed from the order lines themselves
+_LINES = _Source(
+    year=extract("year", Order.order_date),
+    month=extract("month", Order.order_date),
+    dimensions={
+        "product_line": Product.product_line,
+        "product_vendor": Product.product_vendor,
+        "country": Customer.country,
+        "office": Employee.office_code,
+    },
+    measures={
+        "revenue": func.sum(OrderDetail.quantity_ordered * OrderDetail.price_each),
+        "units": func.sum(OrderDetail.quantity_ordered),
+        "order_count": func.count(distinct(Order.order_number)),
+    },
+)
+
+# Sales re-aggregated from the rollup rows
+_ROLLUPS = _Source(
+    year=SalesRollup.year,
+    month=SalesRollup.month,
+    dimensions={
+        "product_line": SalesRollup.product_line,
+        "product_vendor": SalesRollup.product_vendor,
+        "country": SalesRollup.country,
+        "office": SalesRollup.office_code,
+    },
+    measures={
+        "revenue": func.sum(SalesRollup.revenue),
+        "units": func.sum(SalesRollup.units),
+        "order_count": func.sum(SalesRollup.order_count),
+    },
+)
+
+_ROLLUP_COLUMNS = [
+    "year",
+    "month",
+    "product_line",
+    "product_vendor",
+    "country",
+    "office_code",
+    *MEASURES,
+]
+
+
+def _grouped(
+    source: _Source, dimensions: Sequence[str], measures: Sequence[str]
+) -> Select[Any]:
+    # The month dimension is grouped as two columns, labelled year and month
+    keys: list[SQLColumnExpression[Any]] = []
+    columns: list[ColumnElement[Any]] = []
+    for name in dimensions:
+        if name == "month":
+            keys += [source.year, source.month]
+            columns += [source.year.label("year"), source.month.label("month")]
+        else:
+            keys.append(source.dimensions[name])
+            columns.append(source.dimensions[name].label(name))
+    columns += [
+        func.coalesce(source.measures[name], 0).label(name) for name in measures
+    ]
+    return select(*columns).group_by(*keys).order_by(*keys)
+
+
+def _lines(dimensions: Sequence[str], measures: Sequence[str]) -> Select[Any]:
+    return (
+        _grouped(_LINES, dimensions, measures)
+        .select_from(OrderDetail)
+        .join(Order, Order.order_number == OrderDetail.order_number)
+        .join(Product, Product.product_code == OrderDetail.product_code)
+        .join(Customer, Customer.customer_number == Order.customer_number)
+        .outerjoin(
+            Employee, Employee.employee_number == Customer.sales_rep_employee_number
+        )
+    )
+
+
+def _in_months(months: Sequence[Month]) -> ColumnElement[bool]:
+    # Date ranges rather than EXTRACT(...) so an index on order_date is usable
+    return or_(
+        *(
+            and_(Order.order_date >= first, Order.order_date < following)
+            for first, following in (month.bounds() for month in months)
+        )
+    )
+
+
+class SalesRollupRepository:
+    """Sales rollup repository.
+
+    Reads sales grouped by any of the DIMENSIONS either from the rollups or
+    straight from orders and order_details, and recomputes the rollups of
+    stale months.
+    """
+
+    def __init__(self, session: Session) -> None:
+        """Initialize the SalesRollup repository.
+
+        Args:
+            session: SQLAlchemy session for database operations
+        """
+        self.session = session
+
+    def rollup_totals(
+        self,
+        dimensions: Sequence[str],
+        measures: Sequence[str],
+        start: Optional[Month] = None,
+        end: Optional[Month] = None,
+    ) -> Sequence[Any]:
+        """Sum the rollup rows by the given dimensions.
+
+        Args:
+            dimensions: Dimensions to group by, in output order
+            measures: Measures to sum
+            start: First month to include
+            end: Last month to include
+
+        Returns:
+            One row per group, labelled by dimension and measure names (the
+            month as ``year`` and ``month`` numbers), ordered by dimensions
+        """
+        stmt = _grouped(_ROLLUPS, dimensions, measures)
+        period = SalesRollup.year * 100 + SalesRollup.month
+        if start is not None:
+            stmt = stmt.where(period >= start.year * 100 + start.month)
+        if end is not None:
+            stmt = stmt.where(period <= end.year * 100 + end.month)
+        return self.session.execute(stmt).all()
+
+    def line_totals(
+        self,
+        dimensions: Sequence[str],
+        measures: Sequence[str],
+        start: Optional[Month] = None,
+        end: Optional[Month] = None,
+    ) -> Sequence[Any]:
+        """Sum order lines by the given dimensions with one GROUP BY query.
+
+        Args:
+            dimensions: Dimensions to group by, in output order
+            measures: Measures to compute
+            start: First month to include
+            end: Last month to include
+
+        Returns:
+            Rows shaped like those of rollup_totals()
+        """
+        stmt = _lines(dimensions, measures)
+        if start is not None:
+            stmt = stmt.where(Order.order_date >= start.bounds()[0])
+        if end is not None:
+            stmt = stmt.where(Order.order_date < end.bounds()[1])
+        return self.session.execute(stmt).all()
+
+    def mark_orders(self, order_numbers: Iterable[int]) -> None:
+        """Mark the months of orders as stale.
+
+        Args:
+            order_numbers: Orders whose lines or attributes changed
+        """
+        numbers = sorted(set(order_numbers))
+        if not numbers:
+            return
+        rows = self.session.execute(
+            select(_LINES.year, _LINES.month)
+            .where(Order.order_number.in_(numbers))
+            .distinct()
+        )
+        months = sorted(Month(int(year), int(month)) for year, month in rows)
+        if not months:
+            return
+
+        table = cast(Table, StaleSalesMonth.__table__)
+        stmt = upsert_statement(self.session.get_bind().dialect.name, table, [])
+        params = [month._asdict() for month in months]
+        if stmt is not None:
+            self.session.execute(stmt, params)
+            return
+
+        existing = set(
+            self.session.execute(
+                select(StaleSalesMonth.year, StaleSalesMonth.month)
+            ).tuples()
+        )
+        missing = [p for p in params if (p["year"], p["month"]) not in existing]
+        if missing:
+            self.session.execute(insert(StaleSalesMonth), missing)
+
+    def lock_stale_months(self) -> list[Month]:
+        """Read the stale months, locking their rows.
+
+        The rows stay locked (``SELECT ... FOR UPDATE``) until the transaction
+        ends, so a change committed while the months are recomputed marks its
+        month again instead of being lost when the marks are removed.
+
+        Returns:
+            Stale months, oldest first
+        """
+        rows = self.session.execute(
+            select(StaleSalesMonth.year, StaleSalesMonth.month)
+            .order_by(StaleSalesMonth.year, StaleSalesMonth.month)
+            .with_for_update()
+        )
+        return [Month(year, month) for year, month in rows.tuples()]
+
+    def refresh(self, months: Sequence[Month]) -> int:
+        """Recompute the rollups of some months and clear their stale marks.
+
+        Deletes the months' rollup rows and inserts new ones with one
+        ``INSERT ... SELECT ... GROUP BY`` over their order lines.
+
+        Args:
+            months: Months to recompute
+
+        Returns:
+            Number of rollup rows written
+        """
+        if not months:
+            return 0
+        self.session.execute(
+            delete(SalesRollup).where(
+                or_(
+                    *(
+                        and_(SalesRollup.year == m.year, SalesRollup.month == m.month)
+                        for m in months
+                    )
+                )
+            )
+        )
+        result = self.session.execute(
+            insert(SalesRollup).from_select(
+                _ROLLUP_COLUMNS,
+                _lines(DIMENSIONS, MEASURES).where(_in_months(months)),
+            )
+        )
+        self.session.execute(
+            delete(StaleSalesMonth).where(
+                or_(
+                    *(
+                        and_(
+                            StaleSalesMonth.year == m.year,
+                            StaleSalesMonth.month == m.month,
+                        )
+                        for m in months
+                    )
+                )
+            )
+        )
+        return affected_rows(result)
+
+    def rebuild(self) -> int:
+        """Recompute every month's rollups and clear all stale marks.
+
+        Returns:
+            Number of rollup rows written
+        """
+        self.session.execute(delete(SalesRollup))
+        self.session.execute(delete(StaleSalesMonth))
+        result = self.session.execute(
+            insert(SalesRollup).from_select(
+                _ROLLUP_COLUMNS, _lines(DIMENSIONS, MEASURES)
+            )
+        )
+        return affected_rows(result)
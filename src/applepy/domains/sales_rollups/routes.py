@@ -0,0 +1,108 @@
+"""Sales analytics routes."""
+
+import re
+from typing import Optional, Sequence
+
+from flask import Blueprint, Response, request
+
+from applepy.exceptions import ValidationError
+from applepy.responses import ApiResponse, FlaskApiResponse
+from applepy.routes.conditional import conditional_response
+from applepy.serialization import list_json
+from applepy.session import get_session
+
+from .repository import Month
+from .schemas import DIMENSIONS, MEASURES
+from .service import SalesRollupService
+
+# Response header naming the tables a response was computed from
+SOURCE_HEADER = "X-Sales-Source"
+
+_MONTH = re.compile(r"^(?P<year>\d{4})-(?P<month>0[1-9]|1[0-2])$")
+
+
+class SalesAnalyticsRoutes:
+    """Routes for sales analytics.
+
+    Endpoints:
+    - GET /analytics/sales - Revenue, units and order count grouped by month,
+      product line, product vendor, customer country and/or sales office
+    """
+
+    path = "/analytics/sales"
+
+    @classmethod
+    def register(cls, app: Blueprint) -> None:
+        """Register routes with Flask app."""
+        app.add_url_rule(
+            cls.path,
+            f"{cls.path}_get",
+            cls.get_sales,
+            methods=["GET"],
+        )
+
+    @staticmethod
+    def get_sales() -> FlaskApiResponse | Response:
+        """Get sales grouped by the requested dimensions.
+
+        Query parameters:
+            group_by: Comma-separated dimensions (default: none, one total)
+            measures: Comma-separated measures (default: all)
+            from: First month to include, ``YYYY-MM``
+            to: Last month to include, ``YYYY-MM``
+            fresh: ``true`` to read orders and order_details instead of the
+                rollups
+
+        Returns:
+            200: One item per group; the X-Sales-Source header says whether
+                it was read from ``rollups`` or ``orders``
+            304: The client's cached copy (If-None-Match) is still current
+            400: Unknown dimension or measure, or malformed month
+            500: Server error
+        """
+        try:
+            dimensions = _parse_names(request.args.get("group_by"), DIMENSIONS, ())
+            measures = _parse_names(request.args.get("measures"), MEASURES, MEASURES)
+            start = _parse_month(request.args.get("from"))
+            end = _parse_month(request.args.get("to"))
+            fresh = request.args.get("fresh", "").lower() in ("1", "true")
+
+            with get_session(read_only=True) as session:
+                service = SalesRollupService(session)
+                rows, source = service.get_sales(
+                    dimensions, measures, start, end, fresh=fresh
+                )
+            response = conditional_response(list_json(rows))
+            response.headers[SOURCE_HEADER] = source
+            return response
+        except ValidationError as e:
+            error_response: ApiResponse[None] = ApiResponse(error=str(e))
+            return error_response.model_dump(), 400
+        except Exception as e:
+            error_response = ApiResponse(error=str(e))
+            return error_response.model_dump(), 500
+
+
+def _parse_names(
+    raw: Optional[str], allowed: Sequence[str], default: Sequence[str]
+) -> tuple[str, ...]:
+    """Parse a comma-separated list of names, in the order of ``allowed``."""
+    if raw is None:
+        return tuple(default)
+    names = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = sorted(names.difference(allowed))
+    if unknown:
+        raise ValidationError(
+            f"Unknown name(s): {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+        )
+    return tuple(name for name in allowed if name in names)
+
+
+def _parse_month(raw: Optional[str]) -> Optional[Month]:
+    """Parse a ``YYYY-MM`` month."""
+    if not raw:
+        return None
+    match = _MONTH.match(raw)
+    if match is None:
+        raise ValidationError(f"Invalid month {raw!r}, expected YYYY-MM")
+    return Month(int(match["year"]), int(match["month"]))
@@ -0,0 +1,30 @@
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+# Names accepted by ?group_by=, in response field order
+DIMENSIONS = ("month", "product_line", "product_vendor", "country", "office")
+
+# Names accepted by ?measures=, in response field order
+MEASURES = ("revenue", "units", "order_count")
+
+
+class SalesRow(BaseModel):
+    """Validation for one group of sales on read.
+
+    Responses only carry the requested dimensions and measures (see
+    applepy.fieldsets.partial_schema). ``month`` is ``YYYY-MM``; ``office``
+    is None for customers without a sales rep.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    month: str
+    product_line: str
+    product_vendor: str
+    country: str
+    office: Optional[str] = None
+    revenue: Decimal
+    units: int
+    order_count: int
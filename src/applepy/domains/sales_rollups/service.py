@@ -0,0 +1,105 @@
+from typing import Any, Iterable, Optional, Sequence
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from applepy.fieldsets import partial_schema
+from applepy.serialization import validate_all
+
+from .repository import Month, SalesRollupRepository
+from .schemas import SalesRow
+
+# Where get_sales() read its rows from
+ROLLUPS = "rollups"
+ORDERS = "orders"
+
+
+class SalesRollupService:
+    """Sales analytics service.
+
+    Serves sales grouped by month, product line, product vendor, customer
+    country and sales office from the sales_rollups table. Order and order
+    line writes mark their months stale in the same transaction, and
+    refresh() recomputes only those months.
+    """
+
+    def __init__(self, session: Session) -> None:
+        """Initialize the SalesRollup service.
+
+        Args:
+            session: SQLAlchemy session for database operations
+        """
+        self.repo = SalesRollupRepository(session)
+
+    def get_sales(
+        self,
+        dimensions: Sequence[str],
+        measures: Sequence[str],
+        start: Optional[Month] = None,
+        end: Optional[Month] = None,
+        fresh: bool = False,
+    ) -> tuple[list[BaseModel], str]:
+        """Retrieve sales grouped by dimensions.
+
+        Rollups are used unless ``fresh`` is set or an order count is asked
+        for without grouping by both product line and product vendor: an
+        order with lines in several of those cells is counted once in each,
+        so its rollup counts do not add up. Either way one GROUP BY query
+        is run.
+
+        Args:
+            dimensions: Dimensions to group by (see schemas.DIMENSIONS)
+            measures: Measures to compute (see schemas.MEASURES)
+            start: First month to include
+            end: Last month to include
+            fresh: Read orders and order_details instead of the rollups
+
+        Returns:
+            One record per group with the requested fields, ordered by
+            dimensions, and ROLLUPS or ORDERS for the tables read
+        """
+        split = "order_count" in measures and not {
+            "product_line",
+            "product_vendor",
+        }.issubset(dimensions)
+        if fresh or split:
+            source = ORDERS
+            rows = self.repo.line_totals(dimensions, measures, start, end)
+        else:
+            source = ROLLUPS
+            rows = self.repo.rollup_totals(dimensions, measures, start, end)
+
+        schema = partial_schema(SalesRow, (*dimensions, *measures))
+        return validate_all(schema, (_record(row) for row in rows)), source
+
+    def mark_orders(self, order_numbers: Iterable[int]) -> None:
+        """Mark the months of orders as stale in the session's transaction.
+
+        Args:
+            order_numbers: Orders whose lines, date or customer changed
+        """
+        self.repo.mark_orders(order_numbers)
+
+    def refresh(self) -> int:
+        """Recompute the rollups of the stale months.
+
+        Returns:
+            Number of rollup rows written
+        """
+        return self.repo.refresh(self.repo.lock_stale_months())
+
+    def rebuild(self) -> int:
+        """Recompute the rollups of every month.
+
+        Returns:
+            Number of rollup rows written
+        """
+        return self.repo.rebuild()
+
+
+def _record(row: Any) -> dict[str, Any]:
+    values = dict(row._mapping)
+    if "year" in values:
+        year, month = int(values.pop("year")), int(values["month"])
+        values["month"] = f"{year:04d}-{month:02d}"
+    return values
@@ -40,6 +40,13 @@ if not DATABASE_URL:
             "- SQLite: sqlite:///./test.db\n"
         )
 
+# Optional read replicas, as a comma-separated list of database URLs
+DATABASE_REPLICA_URLS = [
+    url.strip()
+    for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+    if url.strip()
+]
+
 # Test database configuration
 # When testing, we use transaction rollback isolation with the development database.
 # The TEST_DATABASE_URL is available but not used - it's here for reference or
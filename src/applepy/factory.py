@@ -2,8 +2,12 @@
 
 from flask import Flask
 
+from applepy import cache, http_metrics
+from applepy.config import get_config
 from applepy.db import db
-from applepy.env import DATABASE_URL
+from applepy.query_stats import monitor
+from applepy.replicas import router
+from applepy.session import close_request_sessions
 
 
 def create_app(config: str | None = None) -> Flask:
@@ -14,25 +18,38 @@ def create_app(config: str | None = None) -> Flask:
     allows for dependency injection and better testing support.
 
     Args:
-        config: Configuration mode ('development', 'testing', 'production').
-               Defaults to 'development' if not specified.
+        config: Configuration profile ('development', 'testing', 'production').
+               Defaults to the APPLEPY_CONFIG environment variable, then to
+               'testing' when TESTING is set and 'development' otherwise.
 
     Returns:
         Configured Flask application instance with database initialized.
+
+    Raises:
+        ValueError: If the configuration profile is unknown
     """
     app = Flask("applepy")
 
-    # Set default configuration
-    if config is None:
-        config = "development"
+    # Load the selected profile (see applepy.config)
+    app.config.from_object(get_config(config))
+    app.json.sort_keys = app.config["JSON_SORT_KEYS"]  # type: ignore[attr-defined]
 
-    # Configure application based on mode
-    app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URL
+    # Initialize database with app, then register any read replicas with the
+    # same engine options as the primary
+    db.init_app(app)
+    router.configure(app.config["DATABASE_REPLICA_URLS"], app.config["REPLICA_ROUTING"])
 
-    # Enable SQL echo in development mode for debugging
-    app.config["SQLALCHEMY_ECHO"] = config == "development"
+    # Cache backend for the cached services
+    cache.init_app(app)
 
-    # Initialize database with app
-    db.init_app(app)
+    # Per-endpoint latency, size and status metrics (registered first so they
+    # see the response after every other after_request hook)
+    http_metrics.init_app(app)
+
+    # Count statements and database time per request (X-DB-* headers, logs)
+    monitor.init_app(app)
+
+    # Close the request-scoped sessions opened by get_session()
+    app.teardown_appcontext(close_request_sessions)
 
     return app
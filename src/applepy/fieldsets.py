@@ -0,0 +1,81 @@
+"""Sparse fieldset helpers for ``?fields=a,b,c`` query parameters.
+
+Clients that only need a few columns can name them; the repository then selects
+just those columns and the service builds a partial record from them instead of
+loading and dumping the full entity.
+"""
+
+from functools import lru_cache
+from typing import Any, Mapping, Optional, Sequence, Type
+
+from pydantic import BaseModel, create_model
+
+from applepy.exceptions import ValidationError
+
+
+def parse_fields(args: Mapping[str, str]) -> Optional[list[str]]:
+    """Parse the comma-separated ``fields`` query parameter.
+
+    Args:
+        args: Request query parameters
+
+    Returns:
+        De-duplicated list of requested field names in request order, or None
+        if no fieldset was requested
+    """
+    raw = args.get("fields")
+    if not raw:
+        return None
+
+    fields = list(dict.fromkeys(f.strip() for f in raw.split(",") if f.strip()))
+    return fields or None
+
+
+def with_key(fields: Sequence[str], key_field: str) -> tuple[str, ...]:
+    """Return the fieldset with the primary key field first.
+
+    The key is always included so partial records stay addressable and
+    paginated listings can still produce a cursor.
+    """
+    return (key_field, *(f for f in fields if f != key_field))
+
+
+@lru_cache(maxsize=256)
+def partial_schema(
+    schema_class: Type[BaseModel], fields: tuple[str, ...]
+) -> Type[BaseModel]:
+    """Build (and cache) a schema containing only the requested fields.
+
+    Field types, defaults and model configuration are copied from
+    ``schema_class``, so partial records validate and serialize exactly like the
+    full record would for those fields.
+
+    Args:
+        schema_class: Full record schema (e.g., CustomerRecord)
+        fields: Names of the fields to keep
+
+    Returns:
+        A Pydantic model class with just those fields
+
+    Raises:
+        ValidationError: If a requested field is not part of the schema
+    """
+    unknown = [f for f in fields if f not in schema_class.model_fields]
+    if unknown:
+        allowed = ", ".join(schema_class.model_fields)
+        raise ValidationError(
+            f"Unknown field(s): {', '.join(unknown)}. Allowed fields: {allowed}"
+        )
+
+    definitions: dict[str, Any] = {
+        name: (
+            schema_class.model_fields[name].annotation,
+            schema_class.model_fields[name],
+        )
+        for name in fields
+    }
+    return create_model(
+        f"Partial{schema_class.__name__}",
+        __config__=schema_class.model_config,
+        **definitions,
+    )
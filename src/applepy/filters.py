@@ -0,0 +1,105 @@
+"""Declarative filter and sort grammar for list endpoints.
+
+Query parameters other than the reserved ones are read as filters on mapped
+columns and compiled to SQL by the repository, so filtering happens on indexed
+columns in the database rather than on the client::
+
+    ?status=Shipped                   status = 'Shipped'
+    ?order_date[gte]=2024-01-01       order_date >= '2024-01-01'
+    ?status[in]=Shipped,Resolved      status IN ('Shipped', 'Resolved')
+    ?shipped_date[null]=true          shipped_date IS NULL
+    ?sort=-order_date,order_number    ORDER BY order_date DESC, order_number
+
+This module only parses the grammar; which fields may be used is decided by the
+repository (see BaseRepository.filterable_fields).
+"""
+
+import re
+from typing import Iterable, NamedTuple
+
+from applepy.exceptions import ValidationError
+
+# Query parameters with their own meaning that are never treated as filters
+RESERVED_PARAMS = frozenset({"limit", "after", "fields", "include", "sort"})
+
+# Supported comparison operators, keyed by their query string spelling
+OPERATORS = frozenset(
+    {"eq", "ne", "gt", "gte", "lt", "lte", "in", "contains", "startswith", "null"}
+)
+
+_FILTER_KEY = re.compile(r"^(?P<field>\w+)(?:\[(?P<op>\w+)\])?$")
+
+
+class Filter(NamedTuple):
+    """A single ``field <op> value`` condition parsed from the query string."""
+
+    field: str
+    op: str
+    value: str
+
+
+class SortKey(NamedTuple):
+    """A single ORDER BY term parsed from the ``sort`` parameter."""
+
+    field: str
+    descending: bool
+
+
+def parse_filters(items: Iterable[tuple[str, str]]) -> list[Filter]:
+    """Parse filter conditions from query string items.
+
+    Args:
+        items: (key, value) pairs, e.g. ``request.args.items(multi=True)``;
+            reserved parameters are skipped
+
+    Returns:
+        List of filters, combined with AND by the repository
+
+    Raises:
+        ValidationError: If a key is malformed or uses an unknown operator
+    """
+    filters = []
+    for key, value in items:
+        if key in RESERVED_PARAMS:
+            continue
+
+        match = _FILTER_KEY.match(key)
+        if not match:
+            raise ValidationError(f"Invalid filter parameter: {key}")
+
+        op = match.group("op") or "eq"
+        if op not in OPERATORS:
+            raise ValidationError(
+                f"Unknown filter operator '{op}'. "
+                f"Allowed operators: {', '.join(sorted(OPERATORS))}"
+            )
+
+        filters.append(Filter(match.group("field"), op, value))
+
+    return filters
+
+
+def parse_sort(raw: str | None) -> list[SortKey]:
+    """Parse the comma-separated ``sort`` parameter.
+
+    A leading ``-`` sorts that field in descending order.
+
+    Args:
+        raw: Value of the ``sort`` query parameter, if any
+
+    Returns:
+        List of sort keys in priority order
+    """
+    if not raw:
+        return []
+
+    keys = []
+    for term in raw.split(","):
+        term = term.strip()
+        if not term:
+            continue
+        if term.startswith("-"):
+            keys.append(SortKey(term[1:], True))
+        else:
+            keys.append(SortKey(term.lstrip("+"), False))
+    return keys
@@ -8,8 +8,10 @@ from applepy.domains.orders.routes import OrderRoutes
 from applepy.domains.payments.routes import PaymentRoutes
 from applepy.domains.product_lines.routes import ProductLineRoutes
 from applepy.domains.products.routes import ProductRoutes
+from applepy.domains.sales_rollups.routes import SalesAnalyticsRoutes
 from applepy.factory import create_app
 from applepy.responses import ApiResponse, FlaskApiResponse
+from applepy.routes.metrics import metrics_bp
 
 app = create_app()
 
@@ -30,6 +32,13 @@ payments_bp = Blueprint("payments", __name__)
 PaymentRoutes.register(payments_bp)
 app.register_blueprint(payments_bp)
 
+sales_analytics_bp = Blueprint("sales_analytics", __name__)
+SalesAnalyticsRoutes.register(sales_analytics_bp)
+app.register_blueprint(sales_analytics_bp)
+
+# Operational endpoints
+app.register_blueprint(metrics_bp)
+
 
 @app.route("/", methods=["GET"])
 def hello_world() -> FlaskApiResponse:
@@ -0,0 +1,105 @@
+"""Per-endpoint HTTP metrics: latency, request/response sizes and status codes.
+
+Requests are labelled by their Flask endpoint name (``office.list``,
+``order_details./order-details_get``, ...) rather than by path, so the number
+of series stays bounded no matter how many ids are requested. Requests that
+match no route are labelled ``<unmatched>``.
+"""
+
+import time
+from typing import Optional
+
+from flask import Flask, Response, g, request
+
+from applepy.metrics import metrics
+
+# Label for requests that matched no route (404s, 405s)
+UNMATCHED_ENDPOINT = "<unmatched>"
+
+# Byte-size buckets for request and response bodies
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+REQUEST_LATENCY = metrics.histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to returning its response",
+    ["endpoint", "method"],
+)
+REQUESTS = metrics.counter(
+    "http_requests_total",
+    "Requests handled, by status code",
+    ["endpoint", "method", "status"],
+)
+REQUEST_SIZE = metrics.histogram(
+    "http_request_size_bytes",
+    "Size of request bodies",
+    ["endpoint", "method"],
+    buckets=SIZE_BUCKETS,
+)
+RESPONSE_SIZE = metrics.histogram(
+    "http_response_size_bytes",
+    "Size of response bodies with a known length (streamed bodies are skipped)",
+    ["endpoint", "method"],
+    buckets=SIZE_BUCKETS,
+)
+
+# Flask ``g`` attributes holding when the request started, its response and
+# how long producing the response took
+_STARTED_ATTR = "_applepy_request_started_at"
+_RESPONSE_ATTR = "_applepy_response"
+_DURATION_ATTR = "_applepy_request_duration"
+
+
+def _start_request() -> None:
+    setattr(g, _STARTED_ATTR, time.perf_counter())
+
+
+def _record_response(response: Response) -> Response:
+    started_at = g.get(_STARTED_ATTR)
+    if started_at is not None:
+        setattr(g, _DURATION_ATTR, time.perf_counter() - started_at)
+    setattr(g, _RESPONSE_ATTR, response)
+    return response
+
+
+def _finish_request(exc: Optional[BaseException]) -> None:
+    # Teardown runs again after a body streamed with stream_with_context has
+    # been sent; only the first run records the request
+    started_at = g.pop(_STARTED_ATTR, None)
+    if started_at is None:
+        return
+
+    endpoint = request.endpoint or UNMATCHED_ENDPOINT
+    method = request.method
+    # Use the time measured when the response was returned; only failed
+    # requests have none
+    duration = g.get(_DURATION_ATTR, time.perf_counter() - started_at)
+    REQUEST_LATENCY.observe(duration, endpoint=endpoint, method=method)
+
+    if request.content_length is not None:
+        REQUEST_SIZE.observe(request.content_length, endpoint=endpoint, method=method)
+
+    # Without a response the request failed with an unhandled exception
+    response: Optional[Response] = g.get(_RESPONSE_ATTR)
+    status = response.status_code if response is not None else 500
+    REQUESTS.inc(endpoint=endpoint, method=method, status=status)
+    if response is not None and not response.is_streamed:
+        size = response.calculate_content_length()
+        if size is not None:
+            RESPONSE_SIZE.observe(size, endpoint=endpoint, method=method)
+
+
+def init_app(app: Flask) -> None:
+    """Record HTTP metrics for every request an app handles.
+
+    Latency runs from the first before_request hook until this module's
+    after_request hook sees the response, so it includes building the
+    response but not sending a streamed body. Metrics are recorded once per
+    request, at its first teardown.
+
+    Args:
+        app: Flask application
+    """
+    # Run before the other before_request hooks so their time is included
+    app.before_request_funcs.setdefault(None, []).insert(0, _start_request)
+    app.after_request(_record_response)
+    app.teardown_request(_finish_request)
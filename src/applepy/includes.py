@@ -0,0 +1,186 @@
+"""Eager loading of related records for ``?include=a,b.c`` query parameters.
+
+A client that needs an order together with its customer and lines can ask for
+them in one request (``GET /orders/10100?include=customer,details.product``)
+instead of fetching each related record separately. Each service whitelists
+the relationship paths it can embed and the record schema to embed them with.
+The repository loads them with one eager loader per relationship:
+
+- many-to-one (``Order.customer``): ``joinedload``, a LEFT OUTER JOIN in the
+  same SELECT
+- one-to-many (``Order.details``): ``selectinload``, one extra
+  ``SELECT ... WHERE key IN (...)`` for the whole result
+
+The number of queries is therefore bounded by the number of included paths,
+not by the number of rows.
+
+Related records are only embedded when requested. Record schemas do not
+declare them, because validating a schema from an entity reads every field
+and would lazy-load each relationship once per row.
+"""
+
+from functools import lru_cache
+from typing import Any, Mapping, Optional, Sequence, Type, cast
+
+from pydantic import BaseModel, create_model
+from sqlalchemy.orm import (
+    Mapper,
+    RelationshipDirection,
+    RelationshipProperty,
+    class_mapper,
+    joinedload,
+    selectinload,
+)
+from sqlalchemy.orm.interfaces import ORMOption
+
+from applepy.exceptions import ValidationError
+
+
+def parse_include(args: Mapping[str, str]) -> Optional[list[str]]:
+    """Parse the comma-separated ``include`` query parameter.
+
+    Args:
+        args: Request query parameters
+
+    Returns:
+        De-duplicated list of requested relationship paths in request order,
+        or None if nothing was requested
+    """
+    raw = args.get("include")
+    if not raw:
+        return None
+
+    paths = list(dict.fromkeys(p.strip() for p in raw.split(",") if p.strip()))
+    return paths or None
+
+
+def resolve_includes(
+    requested: Sequence[str], allowed: Mapping[str, Type[BaseModel]]
+) -> tuple[str, ...]:
+    """Check requested paths against a whitelist and add their parents.
+
+    Including ``details.product`` implies ``details``.
+
+    Args:
+        requested: Relationship paths from parse_include()
+        allowed: Includable paths mapped to the schema they are embedded with
+
+    Returns:
+        Sorted tuple of every path to load
+
+    Raises:
+        ValidationError: If a path is not in the whitelist
+    """
+    unknown = [path for path in requested if path not in allowed]
+    if unknown:
+        choices = ", ".join(allowed) or "none"
+        raise ValidationError(
+            f"Cannot include: {', '.join(unknown)}. Allowed includes: {choices}"
+        )
+
+    paths: set[str] = set()
+    for path in requested:
+        parts = path.split(".")
+        paths.update(".".join(parts[: i + 1]) for i in range(len(parts)))
+    return tuple(sorted(paths))
+
+
+def _relationships(model_class: type, path: str) -> list[RelationshipProperty[Any]]:
+    """Resolve a dotted path to the relationships it walks through."""
+    relationships = []
+    mapper: Mapper[Any] = class_mapper(model_class)
+    for name in path.split("."):
+        relationship = mapper.relationships[name]
+        relationships.append(relationship)
+        mapper = relationship.mapper
+    return relationships
+
+
+def loader_options(model_class: type, paths: Sequence[str]) -> list[ORMOption]:
+    """Build eager loader options for relationship paths.
+
+    Args:
+        model_class: Mapped class the paths start from
+        paths: Paths from resolve_includes()
+
+    Returns:
+        One loader chain per path that is not a prefix of another path
+    """
+    leaves = [
+        path for path in paths if not any(p.startswith(f"{path}.") for p in paths)
+    ]
+    options: list[ORMOption] = []
+    for path in leaves:
+        option: Any = None
+        for relationship in _relationships(model_class, path):
+            attribute = relationship.class_attribute
+            if relationship.direction is RelationshipDirection.MANYTOONE:
+                option = (
+                    joinedload(attribute)
+                    if option is None
+                    else option.joinedload(attribute)
+                )
+            else:
+                option = (
+                    selectinload(attribute)
+                    if option is None
+                    else option.selectinload(attribute)
+                )
+        if option is not None:
+            options.append(option)
+    return options
+
+
+def included_tables(model_class: type, paths: Sequence[str]) -> list[str]:
+    """Return the tables read by the included relationships."""
+    return sorted(
+        {
+            _relationships(model_class, path)[-1].mapper.class_.__tablename__
+            for path in paths
+        }
+    )
+
+
+@lru_cache(maxsize=256)
+def include_schema(
+    schema_class: Type[BaseModel],
+    model_class: type,
+    includes: tuple[tuple[str, Type[BaseModel]], ...],
+) -> Type[BaseModel]:
+    """Build (and cache) a schema embedding related records.
+
+    Args:
+        schema_class: Record schema (full or partial) of the model
+        model_class: Mapped class the relationship paths start from
+        includes: (path, schema) pairs for every path to embed, as returned by
+            resolve_includes() and looked up in the service's whitelist
+
+    Returns:
+        A subclass of ``schema_class`` with one field per top-level path: the
+        related record (or None) for many-to-one relationships, a list of
+        records for one-to-many ones
+    """
+    nested: dict[str, list[tuple[str, Type[BaseModel]]]] = {}
+    schemas: dict[str, Type[BaseModel]] = {}
+    for path, schema in includes:
+        head, _, rest = path.partition(".")
+        if rest:
+            nested.setdefault(head, []).append((rest, schema))
+        else:
+            schemas[head] = schema
+
+    definitions: dict[str, Any] = {}
+    for name, schema in schemas.items():
+        relationship = class_mapper(model_class).relationships[name]
+        if name in nested:
+            schema = include_schema(
+                schema, cast(type, relationship.mapper.class_), tuple(nested[name])
+            )
+        annotation: Any = list[schema] if relationship.uselist else Optional[schema]  # type: ignore[valid-type]
+        definitions[name] = (annotation, ...)
+
+    return create_model(
+        f"{schema_class.__name__}WithIncludes",
+        __base__=schema_class,
+        **definitions,
+    )
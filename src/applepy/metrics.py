@@ -0,0 +1,376 @@
+"""In-process metrics registry: counters, gauges and histograms with labels.
+
+Metrics live in process memory and are read by the metrics endpoints, so no
+external agent or client library is needed. Label values are passed as
+keyword arguments::
+
+    checkouts = metrics.counter("db_pool_checkouts_total", "...", ["engine"])
+    checkouts.inc(engine="default")
+
+Each process (e.g., each gunicorn worker) keeps its own values. The registry
+can be read as JSON (snapshot()) or in the Prometheus text exposition format
+(render_prometheus()).
+"""
+
+import math
+import threading
+from typing import Any, Callable, Generic, Iterable, Optional, Sequence, TypeVar
+
+# Histogram bucket upper bounds in seconds, suited to request and query latency
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+LabelValues = tuple[str, ...]
+ValueT = TypeVar("ValueT")
+
+
+class Metric(Generic[ValueT]):
+    """Base class for a named metric with a fixed set of label names."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str]) -> None:
+        """Initialize the metric.
+
+        Args:
+            name: Metric name (e.g., 'db_pool_checkouts_total')
+            documentation: One-line description
+            labels: Names of the labels every observation must provide
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._values: dict[LabelValues, ValueT] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.label_names):
+            raise ValueError(
+                f"{self.name} expects labels {list(self.label_names)}, "
+                f"got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def labels_of(self, key: LabelValues) -> dict[str, str]:
+        """Return the label mapping for a stored label-value tuple."""
+        return dict(zip(self.label_names, key, strict=True))
+
+    def items(self) -> list[tuple[LabelValues, ValueT]]:
+        """Return a consistent copy of every (label values, value) pair."""
+        with self._lock:
+            return list(self._values.items())
+
+
+class Counter(Metric[float]):
+    """Monotonically increasing count (e.g., checkouts, invalidations)."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the counter for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Return the current count for the given labels."""
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(Metric[float]):
+    """Value that goes up and down (e.g., connections in use).
+
+    A gauge can also be bound to a callback with set_function(); the callback
+    is evaluated each time the metrics are read.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str]) -> None:
+        """Initialize the gauge (see Metric)."""
+        super().__init__(name, documentation, labels)
+        self._functions: dict[LabelValues, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the gauge for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Decrease the gauge for the given labels."""
+        self.inc(-amount, **labels)
+
+    def set_max(self, value: float, **labels: Any) -> None:
+        """Raise the gauge to value if it is higher (a high-water mark)."""
+        key = self._key(labels)
+        with self._lock:
+            if value > self._values.get(key, -math.inf):
+                self._values[key] = value
+
+    def set_function(self, function: Callable[[], float], **labels: Any) -> None:
+        """Read the gauge for the given labels from a callback."""
+        key = self._key(labels)
+        with self._lock:
+            self._functions[key] = function
+
+    def value(self, **labels: Any) -> float:
+        """Return the current value for the given labels."""
+        key = self._key(labels)
+        function = self._functions.get(key)
+        return function() if function else self._values.get(key, 0.0)
+
+    def items(self) -> list[tuple[LabelValues, float]]:
+        """Return every value, evaluating bound callbacks."""
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+        values.update({key: function() for key, function in functions.items()})
+        return list(values.items())
+
+
+class HistogramValue:
+    """Bucket counts, total count and sum for one label set."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """Initialize empty buckets with the given upper bounds."""
+        self.bounds = tuple(buckets)
+        self.counts = [0] * len(self.bounds)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        for index, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Return (upper bound, cumulative count) pairs ending with +Inf."""
+        running = 0
+        pairs = []
+        for bound, count in zip(self.bounds, self.counts, strict=True):
+            running += count
+            pairs.append((bound, running))
+        pairs.append((math.inf, self.count))
+        return pairs
+
+    def copy(self) -> "HistogramValue":
+        """Return an independent copy."""
+        value = HistogramValue(self.bounds)
+        value.counts = list(self.counts)
+        value.count = self.count
+        value.sum = self.sum
+        return value
+
+
+class Histogram(Metric[HistogramValue]):
+    """Distribution of observations in fixed buckets (e.g., wait times)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram (see Metric).
+
+        Args:
+            name: Metric name
+            documentation: One-line description
+            labels: Label names
+            buckets: Sorted bucket upper bounds
+        """
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            histogram = self._values.get(key)
+            if histogram is None:
+                histogram = self._values[key] = HistogramValue(self.buckets)
+            histogram.observe(value)
+
+    def value(self, **labels: Any) -> Optional[HistogramValue]:
+        """Return a copy of the histogram for the given labels, if any."""
+        key = self._key(labels)
+        with self._lock:
+            histogram = self._values.get(key)
+            return histogram.copy() if histogram else None
+
+    def items(self) -> list[tuple[LabelValues, HistogramValue]]:
+        """Return copies of every histogram."""
+        with self._lock:
+            return [(key, value.copy()) for key, value in self._values.items()]
+
+
+MetricT = TypeVar("MetricT", bound=Metric[Any])
+
+
+class MetricsRegistry:
+    """Named collection of metrics.
+
+    Asking for an existing name returns the registered metric, so modules can
+    declare the metrics they use at import time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, Metric[Any]] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: MetricT) -> MetricT:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is None:
+                self._metrics[metric.name] = metric
+                return metric
+        if type(existing) is not type(metric):
+            raise ValueError(f"{metric.name} is already registered as {existing.kind}")
+        return existing  # type: ignore[return-value]
+
+    def counter(
+        self, name: str, documentation: str, labels: Sequence[str] = ()
+    ) -> Counter:
+        """Get or register a counter."""
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        """Get or register a gauge."""
+        return self._register(Gauge(name, documentation, labels))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or register a histogram."""
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def collect(self) -> Iterable[Metric[Any]]:
+        """Return every registered metric, sorted by name."""
+        with self._lock:
+            return sorted(self._metrics.values(), key=lambda metric: metric.name)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return every metric as a JSON-serializable dict.
+
+        Counters and gauges map to ``{"labels": ..., "value": ...}`` entries;
+        histograms to ``{"labels", "count", "sum", "buckets"}`` entries, with
+        cumulative bucket counts keyed by upper bound.
+        """
+        result: dict[str, Any] = {}
+        for metric in self.collect():
+            values: list[dict[str, Any]] = []
+            for key, value in metric.items():
+                entry: dict[str, Any] = {"labels": metric.labels_of(key)}
+                if isinstance(value, HistogramValue):
+                    entry["count"] = value.count
+                    entry["sum"] = value.sum
+                    entry["buckets"] = {
+                        _format_bound(bound): count
+                        for bound, count in value.cumulative()
+                    }
+                else:
+                    entry["value"] = value
+                values.append(entry)
+            result[metric.name] = {
+                "type": metric.kind,
+                "help": metric.documentation,
+                "values": values,
+            }
+        return result
+
+    def render_prometheus(self) -> str:
+        """Return every metric in the Prometheus text exposition format.
+
+        Histograms are written as cumulative ``_bucket`` series with an ``le``
+        label, followed by ``_sum`` and ``_count``.
+        """
+        lines: list[str] = []
+        for metric in self.collect():
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for key, value in metric.items():
+                labels = metric.labels_of(key)
+                if isinstance(value, HistogramValue):
+                    for bound, count in value.cumulative():
+                        bucket_labels = {**labels, "le": _format_bound(bound)}
+                        lines.append(
+                            f"{metric.name}_bucket{_format_labels(bucket_labels)} "
+                            f"{count}"
+                        )
+                    lines.append(
+                        f"{metric.name}_sum{_format_labels(labels)} "
+                        f"{_format_value(value.sum)}"
+                    )
+                    lines.append(
+                        f"{metric.name}_count{_format_labels(labels)} {value.count}"
+                    )
+                else:
+                    lines.append(
+                        f"{metric.name}{_format_labels(labels)} {_format_value(value)}"
+                    )
+        return "\n".join(lines) + "\n"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(bound)
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in labels.items()
+    )
+    return f"{{{pairs}}}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Process-wide registry used by the application
+metrics = MetricsRegistry()
@@ -0,0 +1,99 @@
+"""Keyset pagination helpers shared by the list endpoints.
+
+List endpoints page through a table by key rather than by offset, so fetching
+page N costs the same index range scan as fetching page 1. A page position is
+the list of sort key values (ending with the primary key) of the last row on
+the previous page. The client only ever sees an opaque cursor, which lets the
+encoding change without breaking callers.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Mapping, Optional, Sequence
+
+from applepy.exceptions import ValidationError
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(position: Sequence[Any]) -> str:
+    """Encode the position of the last row of a page as an opaque cursor.
+
+    Values that are not native JSON types (dates, decimals) are encoded as
+    strings; the repository coerces them back using the column types.
+
+    Args:
+        position: Sort key values of the last row on the page
+
+    Returns:
+        URL-safe cursor string to be passed back as the ``after`` parameter
+    """
+    raw = json.dumps(list(position), separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Cursor string from the ``after`` query parameter
+
+    Returns:
+        The position (list of sort key values) the cursor points at
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValidationError("Invalid pagination cursor") from e
+
+    if not isinstance(payload, list) or not payload:
+        raise ValidationError("Invalid pagination cursor")
+
+    return payload
+
+
+def wants_page(args: Mapping[str, str]) -> bool:
+    """Return True if the query string asks for a paginated listing."""
+    return "limit" in args or "after" in args
+
+
+def parse_page_args(
+    args: Mapping[str, str],
+    default_limit: int = DEFAULT_PAGE_SIZE,
+    max_limit: int = MAX_PAGE_SIZE,
+) -> tuple[int, Optional[list[Any]]]:
+    """Parse and validate the ``limit`` and ``after`` query parameters.
+
+    Args:
+        args: Request query parameters
+        default_limit: Page size used when ``limit`` is omitted
+        max_limit: Largest page size a client may request
+
+    Returns:
+        Tuple of (limit, after position or None)
+
+    Raises:
+        ValidationError: If limit is not a positive integer up to max_limit,
+            or the cursor is malformed
+    """
+    raw_limit = args.get("limit")
+    if raw_limit is None:
+        limit = default_limit
+    else:
+        try:
+            limit = int(raw_limit)
+        except ValueError as e:
+            raise ValidationError("limit must be an integer") from e
+        if limit < 1 or limit > max_limit:
+            raise ValidationError(f"limit must be between 1 and {max_limit}")
+
+    raw_after = args.get("after")
+    after = decode_cursor(raw_after) if raw_after else None
+
+    return limit, after
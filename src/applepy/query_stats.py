@@ -0,0 +1,218 @@
+"""Per-request query statistics, slow-query log and N+1 detection.
+
+Every engine in applepy.db.engines times its statements with cursor execute
+events. Inside a Flask request the statements are tallied per request; when
+the response goes out the totals are added as ``X-DB-Queries`` and
+``X-DB-Time-ms`` headers and logged with structured fields. Statements slower
+than SLOW_QUERY_MS are logged with their parameters redacted, and a statement
+run N_PLUS_ONE_THRESHOLD or more times in one request is reported as a likely
+N+1 query: the typical source is a lazy relationship() (Customer.sales_rep,
+Order.customer, Employee.manager, OrderDetail.product, ...) loaded in a loop.
+"""
+
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from flask import Flask, Response, g, has_request_context, request
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger(__name__)
+
+# Response headers carrying the per-request totals
+QUERIES_HEADER = "X-DB-Queries"
+TIME_HEADER = "X-DB-Time-ms"
+
+# Flask ``g`` attribute holding the current request's QueryStats
+_STATS_ATTR = "_applepy_query_stats"
+
+# Key in a connection's info dict holding when the current statement started
+_STARTED_AT = "applepy_statement_started_at"
+
+
+@dataclass
+class QueryStats:
+    """Statements executed during one request."""
+
+    count: int = 0
+    seconds: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def milliseconds(self) -> float:
+        """Total database time in milliseconds."""
+        return self.seconds * 1000
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Return statements executed at least ``threshold`` times."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+def current_stats() -> Optional[QueryStats]:
+    """Return the query statistics of the current request, if any."""
+    if not has_request_context():
+        return None
+    return g.get(_STATS_ATTR)
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Replace bound parameter values with their type names.
+
+    Keeps the shape of the parameters (names, positions, row count for
+    executemany) so a slow statement can be reproduced without logging
+    customer data.
+
+    Args:
+        parameters: Parameters as passed to the DBAPI cursor
+
+    Returns:
+        The same structure with every value replaced by ``<type>``
+    """
+    if isinstance(parameters, dict):
+        return {key: redact_parameters(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(value) for value in parameters]
+    return f"<{type(parameters).__name__}>"
+
+
+class QueryMonitor:
+    """Times statements on instrumented engines and applies the thresholds."""
+
+    def __init__(
+        self, slow_query_ms: Optional[float] = None, n_plus_one_threshold: int = 0
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            slow_query_ms: Log statements taking at least this long (None
+                disables the slow-query log)
+            n_plus_one_threshold: Warn when one statement runs this many times
+                in a request (0 disables the check)
+        """
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    def configure(
+        self, slow_query_ms: Optional[float], n_plus_one_threshold: int
+    ) -> None:
+        """Update the thresholds (see __init__)."""
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    def instrument(self, engine: Engine) -> None:
+        """Time every statement executed through an engine.
+
+        Args:
+            engine: Engine to listen on
+        """
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+
+    def _before_execute(self, conn: Any, *args: Any) -> None:
+        conn.info[_STARTED_AT] = time.perf_counter()
+
+    def _after_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        started_at = conn.info.pop(_STARTED_AT, None)
+        if started_at is None:
+            return
+        elapsed = time.perf_counter() - started_at
+
+        stats = current_stats()
+        if stats is not None:
+            stats.count += 1
+            stats.seconds += elapsed
+            stats.statements[statement] += 1
+
+        if self.slow_query_ms is not None and elapsed * 1000 >= self.slow_query_ms:
+            logger.warning(
+                "Slow query (%.1f ms): %s",
+                elapsed * 1000,
+                statement,
+                extra={
+                    "db_statement": statement,
+                    "db_parameters": redact_parameters(parameters),
+                    "db_time_ms": round(elapsed * 1000, 3),
+                    "endpoint": request.endpoint if has_request_context() else None,
+                },
+            )
+
+    def start_request(self) -> None:
+        """Start counting statements for the current request."""
+        setattr(g, _STATS_ATTR, QueryStats())
+
+    def finish_request(self, response: Response) -> Response:
+        """Report the current request's statements.
+
+        Adds the totals as response headers, logs them and warns about
+        statements repeated often enough to suggest an N+1 query.
+
+        Args:
+            response: Outgoing response
+
+        Returns:
+            The response with the query headers set
+        """
+        stats = current_stats()
+        if stats is None:
+            return response
+
+        response.headers[QUERIES_HEADER] = str(stats.count)
+        response.headers[TIME_HEADER] = f"{stats.milliseconds:.2f}"
+
+        fields = {
+            "endpoint": request.endpoint,
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "db_queries": stats.count,
+            "db_time_ms": round(stats.milliseconds, 3),
+        }
+        logger.info(
+            "%s %s: %d queries in %.2f ms",
+            request.method,
+            request.path,
+            stats.count,
+            stats.milliseconds,
+            extra=fields,
+        )
+
+        if self.n_plus_one_threshold > 0:
+            for statement, count in stats.repeated(self.n_plus_one_threshold):
+                logger.warning(
+                    "Possible N+1 query: executed %d times in %s %s: %s",
+                    count,
+                    request.method,
+                    request.path,
+                    statement,
+                    extra={**fields, "db_statement": statement, "db_repeats": count},
+                )
+        return response
+
+    def init_app(self, app: Flask) -> None:
+        """Apply an app's thresholds and report statements per request.
+
+        Reads SLOW_QUERY_MS and N_PLUS_ONE_THRESHOLD from the app config.
+
+        Args:
+            app: Flask application
+        """
+        self.configure(app.config["SLOW_QUERY_MS"], app.config["N_PLUS_ONE_THRESHOLD"])
+        app.before_request(self.start_request)
+        app.after_request(self.finish_request)
+
+
+monitor = QueryMonitor()
@@ -0,0 +1,115 @@
+"""Route read-only sessions to read replicas.
+
+Replica engines are registered in applepy.db.engines next to the primary.
+get_session(read_only=True) asks the module-level ``router`` for a replica
+engine. Writes always go to the primary. Once a request has committed a
+write, the rest of that request reads from the primary as well, so it sees
+its own writes regardless of replication lag.
+"""
+
+import itertools
+import threading
+from typing import Literal, Optional, Sequence
+
+from flask import g, has_request_context
+from sqlalchemy import Engine
+
+from applepy.db import DEFAULT_ENGINE, EngineRegistry, engines
+
+# Replica selection strategies
+Strategy = Literal["round_robin", "least_connections"]
+STRATEGIES: tuple[Strategy, ...] = ("round_robin", "least_connections")
+
+# Flask ``g`` attribute marking that this request has written to the primary
+_STICKY_ATTR = "_applepy_wrote_primary"
+
+
+class ReplicaRouter:
+    """Choose a replica engine for each read-only session.
+
+    ``round_robin`` cycles through the replicas. ``least_connections`` picks
+    the replica whose pool has the fewest connections checked out. With no
+    replicas configured every session uses the primary.
+    """
+
+    def __init__(self, registry: EngineRegistry) -> None:
+        """Initialize a router with no replicas.
+
+        Args:
+            registry: Registry the replica engines are configured in
+        """
+        self._registry = registry
+        self._names: list[str] = []
+        self._strategy: Strategy = "round_robin"
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def replica_names(self) -> list[str]:
+        """Names of the replica engines in the registry."""
+        return list(self._names)
+
+    def configure(
+        self, urls: Sequence[str], strategy: Strategy = "round_robin"
+    ) -> None:
+        """Register replica engines with the primary's pool options.
+
+        Args:
+            urls: Database URLs of the read replicas (may be empty)
+            strategy: How to choose a replica for each read
+
+        Raises:
+            ValueError: If the strategy is unknown
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(
+                f"Unknown replica routing {strategy!r}. "
+                f"Choose one of: {', '.join(STRATEGIES)}"
+            )
+
+        primary_options = self._registry.options(DEFAULT_ENGINE)
+        names = []
+        for index, url in enumerate(urls):
+            name = f"replica-{index}"
+            self._registry.configure(name, **{**primary_options, "url": url})
+            names.append(name)
+
+        with self._lock:
+            self._names = names
+            self._strategy = strategy
+
+    def choose(self) -> Optional[Engine]:
+        """Return the replica engine for the next read, or None if none exist."""
+        names = self._names
+        if not names:
+            return None
+
+        if self._strategy == "least_connections":
+            return min(
+                (self._registry.get(name) for name in names),
+                key=_checked_out,
+            )
+
+        with self._lock:
+            index = next(self._counter) % len(names)
+        return self._registry.get(names[index])
+
+
+def _checked_out(engine: Engine) -> int:
+    # Pools without a size (e.g. NullPool) count as idle
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if checkedout is not None else 0
+
+
+def mark_wrote_primary() -> None:
+    """Record that the current request has committed to the primary."""
+    if has_request_context():
+        setattr(g, _STICKY_ATTR, True)
+
+
+def wrote_primary() -> bool:
+    """Return True if the current request has committed to the primary."""
+    return has_request_context() and bool(g.get(_STICKY_ATTR, False))
+
+
+router = ReplicaRouter(engines)
@@ -1,11 +1,40 @@
 """Generic base repository for CRUD operations."""
 
-from typing import Generic, Type, TypeVar
+from typing import (
+    Any,
+    ClassVar,
+    Generic,
+    Iterator,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-
-from applepy.exceptions import NotFoundException
+from sqlalchemy import CursorResult, Select, delete, insert, update
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Query,
+    RelationshipDirection,
+    Session,
+    class_mapper,
+    load_only,
+)
+
+from applepy.exceptions import NotFoundException, ValidationError
+from applepy.filters import Filter, SortKey
+from applepy.includes import loader_options
+from applepy.repositories.criteria import (
+    KeyColumn,
+    coerce_value,
+    compile_filter,
+    keyset_after,
+    order_by,
+)
+from applepy.repositories.lookup import get_by_key, primary_key_select
+from applepy.repositories.upsert import upsert_statement
 
 # Type variables for generic CRUD operations
 T = TypeVar("T")  # Model class
@@ -13,6 +42,32 @@ K = TypeVar("K")  # ID type (str, int, etc.)
 CreateSchemaT = TypeVar("CreateSchemaT", bound=BaseModel)  # Create schema
 RecordSchemaT = TypeVar("RecordSchemaT", bound=BaseModel)  # Record/response schema
 
+# Upper bound on pre-built get() statements (one per model and fieldset)
+MAX_CACHED_STATEMENTS = 256
+
+
+def has_dependent_rows(model_class: type) -> bool:
+    """Return True if deleting a row must go through the unit of work.
+
+    One-to-many and many-to-many relationships make ``Session.delete`` load and
+    detach (or cascade to) the related rows, which a plain DELETE statement
+    would skip. View-only relationships are never written, so they do not
+    count.
+    """
+    return any(
+        rel.direction is not RelationshipDirection.MANYTOONE and not rel.viewonly
+        for rel in class_mapper(model_class).relationships
+    )
+
+
+def affected_rows(result: Any) -> int:
+    """Return the number of rows matched by an executed UPDATE or DELETE.
+
+    The MySQL drivers are connected with ``CLIENT_FOUND_ROWS`` by SQLAlchemy,
+    so an UPDATE that leaves a row unchanged still counts it as matched.
+    """
+    return cast(CursorResult[Any], result).rowcount
+
 
 class BaseRepository(Generic[T, K, CreateSchemaT, RecordSchemaT]):
     """Generic repository base class providing CRUD operations.
@@ -27,8 +82,20 @@ class BaseRepository(Generic[T, K, CreateSchemaT, RecordSchemaT]):
         K: The ID field type (e.g., str for office_code, int for employee_number)
         CreateSchemaT: Pydantic schema for creation (e.g., OfficeCreate)
         RecordSchemaT: Pydantic schema for responses (e.g., OfficeRecord)
+
+    Subclasses may set filterable_fields to restrict which columns can be used
+    in list filters and sort keys; by default every mapped column can.
     """
 
+    # Columns usable in ?field[op]=value filters and ?sort= (None = all columns)
+    filterable_fields: Optional[tuple[str, ...]] = None
+
+    # Pre-built primary-key SELECTs shared by all instances, keyed by model,
+    # sparse fieldset and included relationships
+    _get_statements: ClassVar[
+        dict[tuple[type, Optional[tuple[str, ...]], tuple[str, ...]], Select[Any]]
+    ] = {}
+
     def __init__(
         self,
         session: Session,
@@ -45,20 +112,222 @@ class BaseRepository(Generic[T, K, CreateSchemaT, RecordSchemaT]):
         self.session = session
         self.model_class = model_class
         self.id_field_name = id_field_name
+        self._delete_via_session = has_dependent_rows(model_class)
+
+    def _column(self, name: str) -> InstrumentedAttribute[Any]:
+        """Resolve a filterable/sortable field name to its mapped column.
+
+        Args:
+            name: Field name from the query string
+
+        Returns:
+            The mapped column attribute
+
+        Raises:
+            ValidationError: If the field is not whitelisted for filtering
+        """
+        allowed = self.filterable_fields or tuple(
+            class_mapper(self.model_class).column_attrs.keys()
+        )
+        if name != self.id_field_name and name not in allowed:
+            raise ValidationError(
+                f"Cannot filter or sort on '{name}'. "
+                f"Allowed fields: {', '.join(allowed)}"
+            )
+        column: InstrumentedAttribute[Any] = getattr(self.model_class, name)
+        return column
+
+    def _keys(self, sort: Sequence[SortKey]) -> list[KeyColumn]:
+        """Resolve sort keys, appending the primary key as a unique tie-breaker."""
+        keys = [(self._column(key.field), key.descending) for key in sort]
+        if self.id_field_name not in {key.field for key in sort}:
+            keys.append((getattr(self.model_class, self.id_field_name), False))
+        return keys
+
+    def _load_only(self, fields: Sequence[str], keys: Sequence[KeyColumn] = ()) -> Any:
+        """Build a ``load_only`` option for a sparse fieldset plus key columns.
+
+        Raises:
+            ValidationError: If a field is not a mapped column of the model
+        """
+        columns = class_mapper(self.model_class).column_attrs
+        unknown = [f for f in fields if f not in columns]
+        if unknown:
+            raise ValidationError(f"Unknown field(s): {', '.join(unknown)}")
+        return load_only(
+            *(getattr(self.model_class, f) for f in fields),
+            *(column for column, _ in keys),
+        )
 
-    def all(self) -> list[T]:
+    def _get_statement(
+        self, fields: Optional[Sequence[str]], include: Sequence[str] = ()
+    ) -> Select[Any]:
+        """Return the pre-built primary-key SELECT for a fieldset and includes.
+
+        Statements are built once and reused across requests, so a lookup only
+        binds the key instead of constructing and compiling a new query.
+
+        Raises:
+            ValidationError: If a field is not a mapped column of the model
+        """
+        cache_key = (
+            self.model_class,
+            tuple(fields) if fields else None,
+            tuple(include),
+        )
+        statement = self._get_statements.get(cache_key)
+        if statement is None:
+            options = [self._load_only(fields)] if fields else []
+            options.extend(loader_options(self.model_class, include))
+            statement = primary_key_select(self.model_class, options)
+            if len(self._get_statements) < MAX_CACHED_STATEMENTS:
+                self._get_statements[cache_key] = statement
+        return statement
+
+    def _query(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        filters: Sequence[Filter] = (),
+        keys: Sequence[KeyColumn] = (),
+        include: Sequence[str] = (),
+    ) -> Query[T]:
+        """Build the base query for a listing or lookup.
+
+        When ``fields`` is given only those columns (plus the primary key and any
+        sort keys) are selected via ``load_only``; the remaining attributes are
+        never fetched, so wide text and BLOB columns stay in the database.
+
+        Args:
+            fields: Names of the mapped columns to load, or None for all
+            filters: Parsed filters, combined with AND into the WHERE clause
+            keys: Key columns to ORDER BY
+            include: Relationship paths to eager load (see applepy.includes)
+
+        Returns:
+            Query over the model class
+
+        Raises:
+            ValidationError: If a field or filter is invalid for the model
+        """
+        query = self.session.query(self.model_class)
+        if filters:
+            query = query.filter(
+                *(compile_filter(self._column(f.field), f) for f in filters)
+            )
+        if fields:
+            query = query.options(self._load_only(fields, keys))
+        if include:
+            query = query.options(*loader_options(self.model_class, include))
+        if keys:
+            query = query.order_by(*order_by(keys))
+        return query
+
+    def all(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        filters: Sequence[Filter] = (),
+        sort: Sequence[SortKey] = (),
+        include: Sequence[str] = (),
+    ) -> list[T]:
         """Retrieve all records of this model type.
 
+        Args:
+            fields: Optional sparse fieldset of column names to load
+            filters: Optional filters compiled into the WHERE clause
+            sort: Optional sort keys compiled into the ORDER BY clause
+            include: Optional relationship paths to eager load
+
+        Returns:
+            List of all matching model instances from the database
+        """
+        keys = self._keys(sort) if sort else ()
+        return self._query(fields, filters, keys, include).all()
+
+    def iter_all(
+        self,
+        batch_size: int = 1000,
+        fields: Optional[Sequence[str]] = None,
+        filters: Sequence[Filter] = (),
+        sort: Sequence[SortKey] = (),
+        include: Sequence[str] = (),
+    ) -> Iterator[T]:
+        """Iterate over all records using a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time (``yield_per``), so the full
+        table is never held in memory at once. The query is executed
+        immediately; only fetching is deferred.
+
+        Args:
+            batch_size: Number of rows to fetch per round trip
+            fields: Optional sparse fieldset of column names to load
+            filters: Optional filters compiled into the WHERE clause
+            sort: Optional sort keys compiled into the ORDER BY clause
+            include: Optional relationship paths to eager load, per batch
+
         Returns:
-            List of all model instances from the database
+            Iterator over model instances
         """
-        return self.session.query(self.model_class).all()
+        keys = self._keys(sort) if sort else ()
+        query = self._query(fields, filters, keys, include)
+        return iter(query.yield_per(batch_size))
 
-    def get(self, id_value: K) -> T:
+    def page(
+        self,
+        limit: int,
+        after: Optional[Sequence[Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        filters: Sequence[Filter] = (),
+        sort: Sequence[SortKey] = (),
+        include: Sequence[str] = (),
+    ) -> tuple[list[T], Optional[list[Any]]]:
+        """Retrieve one page of records using keyset pagination.
+
+        Rows are ordered by the sort keys followed by the primary key and
+        selected with ``WHERE (keys) > :after ... LIMIT limit + 1``, so every page
+        is an index range scan regardless of how deep it is. The extra row is
+        only used to detect whether another page follows.
+
+        Args:
+            limit: Maximum number of records to return
+            after: Key values of the last record on the previous page, or None
+                for the first page
+            fields: Optional sparse fieldset of column names to load
+            filters: Optional filters compiled into the WHERE clause
+            sort: Optional sort keys; the primary key is always the final key
+            include: Optional relationship paths to eager load
+
+        Returns:
+            Tuple of (records on this page, key values to continue after or
+            None if this is the last page)
+        """
+        keys = self._keys(sort)
+        query = self._query(fields, filters, keys, include)
+        if after is not None:
+            query = query.filter(keyset_after(keys, after))
+
+        entities = query.limit(limit + 1).all()
+        if len(entities) <= limit:
+            return entities, None
+
+        last = entities[limit - 1]
+        return entities[:limit], [getattr(last, column.key) for column, _ in keys]
+
+    def get(
+        self,
+        id_value: K,
+        fields: Optional[Sequence[str]] = None,
+        include: Sequence[str] = (),
+    ) -> T:
         """Retrieve a single record by its primary key.
 
+        Follows ``Session.get`` semantics: an entity already in the session's
+        identity map is returned without SQL; otherwise a cached pre-built
+        SELECT is executed.
+
         Args:
             id_value: The value of the primary key field
+            fields: Optional sparse fieldset of column names to load
+            include: Optional relationship paths to eager load
 
         Returns:
             The model instance if found
@@ -67,8 +336,14 @@ class BaseRepository(Generic[T, K, CreateSchemaT, RecordSchemaT]):
             NotFoundException: If no record with the given ID exists
         """
         id_field = getattr(self.model_class, self.id_field_name)
-        entity = (
-            self.session.query(self.model_class).filter(id_field == id_value).first()
+        try:
+            key = coerce_value(id_field, id_value)
+        except ValidationError as e:
+            # An ID of the wrong type cannot match any row
+            raise NotFoundException(f"{self.model_class.__name__} not found") from e
+
+        entity = get_by_key(
+            self.session, self.model_class, self._get_statement(fields, include), (key,)
         )
 
         if not entity:
@@ -91,6 +366,85 @@ class BaseRepository(Generic[T, K, CreateSchemaT, RecordSchemaT]):
         self.session.flush()  # Flush to populate auto-increment fields
         return entity
 
+    def bulk_create(self, items: Sequence[CreateSchemaT]) -> int:
+        """Insert many records with a single multi-row INSERT.
+
+        Rows are sent as one executemany/insertmanyvalues batch rather than one
+        ``add`` + ``flush`` round trip per entity. Generated keys are not loaded
+        back.
+
+        Args:
+            items: Validated create schemas
+
+        Returns:
+            Number of rows inserted
+        """
+        rows = [item.model_dump() for item in items]
+        if rows:
+            self.session.execute(insert(self.model_class), rows)
+        return len(rows)
+
+    def upsert(self, items: Sequence[RecordSchemaT]) -> int:
+        """Insert or update many records by primary key in one statement.
+
+        Uses the dialect's native upsert (``ON DUPLICATE KEY UPDATE`` on
+        MySQL/MariaDB, ``ON CONFLICT ... DO UPDATE`` on SQLite/PostgreSQL), so
+        existing rows are never read first. Every field of each item is
+        written; on other dialects each row falls back to ``Session.merge``.
+
+        Args:
+            items: Validated record schemas including the primary key
+
+        Returns:
+            Number of rows sent (inserted or updated)
+        """
+        rows = [item.model_dump() for item in items]
+        if not rows:
+            return 0
+
+        table = class_mapper(self.model_class).local_table
+        update_columns = [name for name in rows[0] if name != self.id_field_name]
+        stmt = upsert_statement(
+            self.session.get_bind().dialect.name,
+            table,  # type: ignore[arg-type]
+            update_columns,
+        )
+        if stmt is None:
+            for row in rows:
+                self.session.merge(self.model_class(**row))
+            self.session.flush()
+        else:
+            self.session.execute(stmt, rows)
+        return len(rows)
+
+    def update_in_place(self, data: RecordSchemaT) -> None:
+        """Update a record with a single ``UPDATE ... WHERE pk = :id`` statement.
+
+        Unlike update(), the row is not loaded first and no entity is returned;
+        callers that already hold every field of the record (e.g., a full PUT)
+        can answer from the request data.
+
+        Args:
+            data: Pydantic schema instance with field values including ID
+
+        Raises:
+            NotFoundException: If no record with the given ID exists
+        """
+        id_value = getattr(data, self.id_field_name)
+        values = data.model_dump(exclude_unset=True)
+        values.pop(self.id_field_name, None)
+        if not values:
+            # Nothing to write, but a missing record must still be reported
+            self.get(id_value, [self.id_field_name])
+            return
+
+        id_field = getattr(self.model_class, self.id_field_name)
+        result = self.session.execute(
+            update(self.model_class).where(id_field == id_value).values(**values)
+        )
+        if affected_rows(result) == 0:
+            raise NotFoundException(f"{self.model_class.__name__} not found")
+
     def update(self, data: RecordSchemaT) -> T:
         """Update an existing record from validated schema data.
 
@@ -106,17 +460,8 @@ class BaseRepository(Generic[T, K, CreateSchemaT, RecordSchemaT]):
         Raises:
             NotFoundException: If no record with the given ID exists
         """
-        # Get ID value from schema
-        id_value = getattr(data, self.id_field_name)
-
-        # Query for existing entity
-        id_field = getattr(self.model_class, self.id_field_name)
-        entity = (
-            self.session.query(self.model_class).filter(id_field == id_value).first()
-        )
-
-        if not entity:
-            raise NotFoundException(f"{self.model_class.__name__} not found")
+        # Get existing entity by the ID value from the schema
+        entity = self.get(getattr(data, self.id_field_name))
 
         # Get only the fields that were explicitly set
         update_data = data.model_dump(exclude_unset=True)
@@ -133,6 +478,11 @@ class BaseRepository(Generic[T, K, CreateSchemaT, RecordSchemaT]):
     def delete(self, id_value: K) -> None:
         """Delete a record by its primary key.
 
+        Issues a single ``DELETE ... WHERE pk = :id`` and uses the rowcount to
+        detect a missing record. Models with one-to-many relationships are
+        loaded and deleted through the session instead, so the ORM can update
+        or cascade to the related rows.
+
         Args:
             id_value: The value of the primary key field
 
@@ -140,11 +490,13 @@ class BaseRepository(Generic[T, K, CreateSchemaT, RecordSchemaT]):
             NotFoundException: If no record with the given ID exists
         """
         id_field = getattr(self.model_class, self.id_field_name)
-        entity = (
-            self.session.query(self.model_class).filter(id_field == id_value).first()
-        )
 
-        if not entity:
-            raise NotFoundException(f"{self.model_class.__name__} not found")
+        if not self._delete_via_session:
+            result = self.session.execute(
+                delete(self.model_class).where(id_field == id_value)
+            )
+            if affected_rows(result) == 0:
+                raise NotFoundException(f"{self.model_class.__name__} not found")
+            return
 
-        self.session.delete(entity)
+        self.session.delete(self.get(id_value))
@@ -0,0 +1,185 @@
+"""Compile parsed filters, sort keys and keyset positions into SQL clauses.
+
+These helpers work on mapped column attributes (e.g. ``Order.status``) so the
+repository can build WHERE and ORDER BY clauses from the query string grammar in
+:mod:`applepy.filters` without any per-model code.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Sequence
+
+from sqlalchemy import ColumnElement, and_, false, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from applepy.exceptions import ValidationError
+from applepy.filters import Filter
+
+# A mapped column and whether it is sorted in descending order
+KeyColumn = tuple[InstrumentedAttribute[Any], bool]
+
+_TRUE_VALUES = frozenset({"true", "1", "yes"})
+_FALSE_VALUES = frozenset({"false", "0", "no"})
+
+
+def coerce_value(column: InstrumentedAttribute[Any], raw: Any) -> Any:
+    """Convert a query string (or cursor) value to the column's Python type.
+
+    Args:
+        column: Mapped column attribute the value is compared against
+        raw: Value as received from the client
+
+    Returns:
+        The value converted to the column's Python type
+
+    Raises:
+        ValidationError: If the value cannot be converted
+    """
+    if raw is None:
+        return None
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return raw
+
+    if type(raw) is python_type:
+        return raw
+
+    try:
+        if python_type is bool:
+            return _parse_bool(str(raw))
+        if python_type is datetime:
+            return datetime.fromisoformat(str(raw))
+        if python_type is date:
+            return date.fromisoformat(str(raw))
+        if python_type is Decimal:
+            return Decimal(str(raw))
+        if python_type in (int, float, str):
+            return python_type(raw)
+    except (ValueError, InvalidOperation) as e:
+        raise ValidationError(f"Invalid value for {column.key}: {raw!r}") from e
+
+    raise ValidationError(f"Cannot filter on {column.key}")
+
+
+def _parse_bool(raw: str) -> bool:
+    value = raw.lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    raise ValueError(raw)
+
+
+def compile_filter(
+    column: InstrumentedAttribute[Any], condition: Filter
+) -> ColumnElement[bool]:
+    """Compile a single parsed filter into a SQL boolean expression.
+
+    Args:
+        column: Mapped column attribute named by the filter
+        condition: Parsed filter (operator and raw value)
+
+    Returns:
+        SQLAlchemy boolean clause usable in ``WHERE``
+
+    Raises:
+        ValidationError: If the value is invalid for the column or operator
+    """
+    op, raw = condition.op, condition.value
+
+    if op == "null":
+        try:
+            is_null = _parse_bool(raw)
+        except ValueError as e:
+            raise ValidationError(f"{column.key}[null] must be true or false") from e
+        return column.is_(None) if is_null else column.is_not(None)
+
+    if op == "in":
+        values = [coerce_value(column, v) for v in raw.split(",") if v != ""]
+        return column.in_(values)
+
+    if op == "contains":
+        return column.contains(raw, autoescape=True)
+
+    if op == "startswith":
+        return column.startswith(raw, autoescape=True)
+
+    value = coerce_value(column, raw)
+    if op == "eq":
+        return column == value
+    if op == "ne":
+        return column != value
+    if op == "gt":
+        return column > value
+    if op == "gte":
+        return column >= value
+    if op == "lt":
+        return column < value
+    if op == "lte":
+        return column <= value
+
+    raise ValidationError(f"Unknown filter operator '{op}'")
+
+
+def order_by(keys: Sequence[KeyColumn]) -> list[ColumnElement[Any]]:
+    """Build ORDER BY terms for the given key columns."""
+    return [
+        column.desc() if descending else column.asc() for column, descending in keys
+    ]
+
+
+def keyset_after(
+    keys: Sequence[KeyColumn], position: Sequence[Any]
+) -> ColumnElement[bool]:
+    """Build the WHERE clause selecting rows that sort after ``position``.
+
+    For keys (a, b, pk) this expands to
+    ``a > :a OR (a = :a AND b > :b) OR (a = :a AND b = :b AND pk > :pk)``,
+    with ``<`` for descending keys. NULLs are treated as sorting first in
+    ascending order and last in descending order, as MySQL/MariaDB and SQLite
+    do.
+
+    Args:
+        keys: Key columns in ORDER BY order, ending with the primary key
+        position: Key values of the last row on the previous page
+
+    Returns:
+        SQLAlchemy boolean clause
+
+    Raises:
+        ValidationError: If the position does not match the key columns
+    """
+    if len(position) != len(keys):
+        raise ValidationError("Pagination cursor does not match the requested sort")
+
+    values = [
+        coerce_value(column, value)
+        for (column, _), value in zip(keys, position, strict=True)
+    ]
+
+    branches = []
+    for i, (column, descending) in enumerate(keys):
+        equal_prefix = [
+            _equals(prefix_column, value)
+            for (prefix_column, _), value in zip(keys[:i], values[:i], strict=True)
+        ]
+        branches.append(and_(*equal_prefix, _beyond(column, descending, values[i])))
+    return or_(*branches)
+
+
+def _equals(column: InstrumentedAttribute[Any], value: Any) -> ColumnElement[bool]:
+    return column.is_(None) if value is None else column == value
+
+
+def _beyond(
+    column: InstrumentedAttribute[Any], descending: bool, value: Any
+) -> ColumnElement[bool]:
+    if value is None:
+        # NULLs come first ascending (everything non-NULL follows) and last
+        # descending (nothing follows)
+        return false() if descending else column.is_not(None)
+    if descending:
+        return or_(column < value, column.is_(None))
+    return column > value
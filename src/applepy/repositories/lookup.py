@@ -0,0 +1,72 @@
+"""Primary-key lookups with ``Session.get`` semantics and pre-built statements.
+
+A lookup first consults the session's identity map, so fetching the same row
+twice within a request (e.g., validating a foreign key and then returning it)
+costs no SQL. On a miss it executes a SELECT built once per model (and
+fieldset) with bound parameters for the key, so hot GET-by-id paths skip query
+construction and hit SQLAlchemy's compiled cache directly.
+"""
+
+from typing import Any, Optional, Sequence, Type, TypeVar
+
+from sqlalchemy import Select, bindparam, select
+from sqlalchemy.orm import Session, class_mapper
+from sqlalchemy.orm.interfaces import ORMOption
+
+T = TypeVar("T")
+
+
+def primary_key_select(
+    model_class: Type[T], options: Sequence[ORMOption] = ()
+) -> Select[tuple[T]]:
+    """Build ``SELECT ... WHERE pk1 = :pk1 [AND pk2 = :pk2]`` for a model.
+
+    Each primary key column is bound to a parameter named after the column.
+
+    Args:
+        model_class: Mapped model class
+        options: Loader options (e.g., ``load_only``) to apply
+
+    Returns:
+        Select statement to execute with get_by_key()
+    """
+    # configure=False: statements may be built at import time, before every
+    # related model has been mapped
+    columns = class_mapper(model_class, configure=False).primary_key
+    stmt = select(model_class).where(
+        *(column == bindparam(column.name) for column in columns)
+    )
+    if options:
+        stmt = stmt.options(*options)
+    return stmt
+
+
+def get_by_key(
+    session: Session,
+    model_class: Type[T],
+    statement: Select[tuple[T]],
+    key: Sequence[Any],
+) -> Optional[T]:
+    """Fetch a row by primary key, preferring the session's identity map.
+
+    Args:
+        session: Session to look in
+        model_class: Mapped model class
+        statement: Statement from primary_key_select() for the model
+        key: Primary key values in mapper order, converted to the column types
+
+    Returns:
+        The entity, or None if no row has that key
+    """
+    mapper = class_mapper(model_class)
+    cached: Optional[T] = session.identity_map.get(
+        mapper.identity_key_from_primary_key(tuple(key))
+    )
+    if cached is not None:
+        return cached
+
+    params = {
+        column.name: value
+        for column, value in zip(mapper.primary_key, key, strict=True)
+    }
+    return session.execute(statement, params).scalars().first()
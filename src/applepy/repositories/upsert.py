@@ -0,0 +1,106 @@
+"""Build dialect-native upsert (insert or update) statements.
+
+MySQL/MariaDB use ``INSERT ... ON DUPLICATE KEY UPDATE``; SQLite and PostgreSQL
+use ``INSERT ... ON CONFLICT (pk) DO UPDATE``. Either way a whole batch of rows is
+written in one statement without reading the existing rows first.
+"""
+
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.sql.dml import Insert
+
+
+def upsert_statement(
+    dialect_name: str,
+    table: Table,
+    update_columns: Sequence[str],
+) -> Optional[Insert]:
+    """Build an upsert statement for ``table`` on its primary key.
+
+    Args:
+        dialect_name: Name of the connection's dialect (e.g. ``mysql``)
+        table: Table to write to
+        update_columns: Columns overwritten when the primary key already exists
+
+    Returns:
+        An INSERT statement with the dialect's conflict clause, to be executed
+        with a list of row dicts, or None if the dialect has no native upsert
+    """
+    if dialect_name in ("mysql", "mariadb"):
+        mysql_stmt = mysql.insert(table)
+        if not update_columns:
+            # ON DUPLICATE KEY UPDATE needs at least one assignment
+            update_columns = [column.name for column in table.primary_key.columns]
+        return mysql_stmt.on_duplicate_key_update(
+            {name: mysql_stmt.inserted[name] for name in update_columns}
+        )
+
+    if dialect_name == "sqlite":
+        sqlite_stmt = sqlite.insert(table)
+        return _on_conflict(sqlite_stmt, table, update_columns)
+
+    if dialect_name == "postgresql":
+        pg_stmt = postgresql.insert(table)
+        return _on_conflict(pg_stmt, table, update_columns)
+
+    return None
+
+
+def increment_statement(
+    dialect_name: str,
+    table: Table,
+    counter_columns: Sequence[str],
+) -> Optional[Insert]:
+    """Build an upsert that adds to counters instead of overwriting them.
+
+    Each row is inserted as given; if its primary key already exists, each
+    counter column is increased by the row's value instead (``counter =
+    counter + inserted.counter``).
+
+    Args:
+        dialect_name: Name of the connection's dialect (e.g. ``mysql``)
+        table: Table to write to
+        counter_columns: Columns to add to on conflict
+
+    Returns:
+        An INSERT statement to be executed with a list of row dicts, or None
+        if the dialect has no native upsert
+    """
+    if dialect_name in ("mysql", "mariadb"):
+        mysql_stmt = mysql.insert(table)
+        return mysql_stmt.on_duplicate_key_update(
+            {
+                name: table.c[name] + mysql_stmt.inserted[name]
+                for name in counter_columns
+            }
+        )
+
+    if dialect_name in ("sqlite", "postgresql"):
+        stmt: Any = (
+            sqlite.insert(table)
+            if dialect_name == "sqlite"
+            else postgresql.insert(table)
+        )
+        result: Insert = stmt.on_conflict_do_update(
+            index_elements=list(table.primary_key.columns),
+            set_={
+                name: table.c[name] + stmt.excluded[name] for name in counter_columns
+            },
+        )
+        return result
+
+    return None
+
+
+def _on_conflict(stmt: Any, table: Table, update_columns: Sequence[str]) -> Insert:
+    index_elements = list(table.primary_key.columns)
+    if not update_columns:
+        result: Insert = stmt.on_conflict_do_nothing(index_elements=index_elements)
+        return result
+    result = stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={name: stmt.excluded[name] for name in update_columns},
+    )
+    return result
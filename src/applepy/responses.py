@@ -26,10 +26,19 @@ class ListResponse(BaseModel, Generic[T]):
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    """Wrapper for paginated list responses."""
+    """Wrapper for keyset-paginated list responses.
+
+    ``next_cursor`` is an opaque token to send back as ``?after=`` to fetch the
+    following page. It is ``None`` once the last page has been reached.
+    """
 
     items: list[T]
     count: int
-    page: int
     page_size: int
-    total_pages: int
+    next_cursor: Optional[str] = None
+
+
+class BulkResponse(BaseModel):
+    """Result of a bulk write operation."""
+
+    count: int
@@ -5,16 +5,36 @@ REST endpoints for any domain entity. Subclasses specify the service class,
 schemas, and path, and all CRUD endpoints are created automatically.
 """
 
-from typing import Any, Generic, Type, TypeVar
+from contextlib import ExitStack
+from typing import Any, Generic, Optional, Type, TypeVar
 
-from flask import Blueprint, request
+from flask import Blueprint, Response, request
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from applepy.exceptions import NotFoundException
-from applepy.responses import ApiResponse, FlaskApiResponse, ListResponse
+from applepy.exceptions import NotFoundException, ValidationError
+from applepy.fieldsets import parse_fields
+from applepy.filters import Filter, SortKey, parse_filters, parse_sort
+from applepy.includes import parse_include
+from applepy.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    encode_cursor,
+    parse_page_args,
+    wants_page,
+)
+from applepy.responses import ApiResponse, BulkResponse, FlaskApiResponse
+from applepy.routes.bulk import bulk_adapter, parse_bulk
+from applepy.routes.conditional import (
+    conditional_response,
+    not_modified,
+    version_etag,
+)
+from applepy.routes.streaming import STREAM_BATCH_SIZE, ndjson_response, wants_ndjson
+from applepy.serialization import json_response, list_json, page_json, record_json
 from applepy.services.base import BaseService
-from applepy.session import get_session
+from applepy.session import get_session, get_stream_session
+from applepy.table_versions import versions
 
 # Type variables for generic CRUD routes
 K = TypeVar("K")  # ID type
@@ -25,14 +45,19 @@ RecordSchemaT = TypeVar("RecordSchemaT", bound=BaseModel)
 class CrudRoutes(Generic[CreateSchemaT, RecordSchemaT, K]):
     """Base class for generating CRUD REST endpoints.
 
-    This class automatically generates list, get, create, update, and delete
-    endpoints for a domain entity. Subclasses need to specify:
+    This class automatically generates list, get, create, bulk create, update and
+    delete endpoints for a domain entity. Subclasses need to specify:
     - path: URL prefix for the routes (e.g., '/offices')
     - service_class: The service class to use for business logic
     - create_schema: Pydantic schema for POST/PUT requests
     - record_schema: Pydantic schema for responses
     - id_param_name: Name of the URL parameter for the ID (e.g., 'office_code')
 
+    Subclasses may also override default_page_size and max_page_size to tune
+    keyset pagination of the list endpoint, and stream_batch_size to tune
+    NDJSON streaming. Setting allow_bulk_upsert adds PUT <path>/bulk, which
+    inserts or updates many records by primary key.
+
     Type parameters:
         CreateSchemaT: Pydantic schema for create/update operations
         RecordSchemaT: Pydantic schema for responses
@@ -46,8 +71,20 @@ class CrudRoutes(Generic[CreateSchemaT, RecordSchemaT, K]):
     record_schema: Type[RecordSchemaT]
     id_param_name: str
 
+    # Keyset pagination limits for the list endpoint
+    default_page_size: int = DEFAULT_PAGE_SIZE
+    max_page_size: int = MAX_PAGE_SIZE
+
+    # Rows fetched per server-side cursor round trip when streaming NDJSON
+    stream_batch_size: int = STREAM_BATCH_SIZE
+
+    # Expose PUT <path>/bulk (insert or update by primary key)
+    allow_bulk_upsert: bool = False
+
     def __init__(self) -> None:
         """Initialize the CRUD routes and create the blueprint."""
+        self._bulk_adapter = bulk_adapter(self.create_schema)
+        self._bulk_record_adapter = bulk_adapter(self.record_schema)
         self.blueprint = self._create_blueprint()
 
     def _create_blueprint(self) -> Blueprint:
@@ -61,6 +98,9 @@ class CrudRoutes(Generic[CreateSchemaT, RecordSchemaT, K]):
         # Register all CRUD endpoints
         bp.add_url_rule("", "list", self.list_all, methods=["GET"])
         bp.add_url_rule("", "create", self.create, methods=["POST"])
+        bp.add_url_rule("/bulk", "bulk_create", self.bulk_create, methods=["POST"])
+        if self.allow_bulk_upsert:
+            bp.add_url_rule("/bulk", "bulk_upsert", self.bulk_upsert, methods=["PUT"])
         bp.add_url_rule(
             f"/<{self.id_param_name}>",
             "get",
@@ -94,54 +134,181 @@ class CrudRoutes(Generic[CreateSchemaT, RecordSchemaT, K]):
         """Get a service instance for the given session."""
         return self.service_class(session)  # type: ignore[call-arg, arg-type]
 
-    def list_all(self) -> FlaskApiResponse:
-        """List all records.
+    def list_all(self) -> FlaskApiResponse | Response:
+        """List all records, or one page of records.
+
+        In every mode the query string may carry:
+        - ``field=value`` / ``field[op]=value`` filters and ``sort=-a,b``, which
+          are compiled to SQL by the repository (see applepy.filters)
+        - ``fields=a,b,c`` to restrict the selected columns and returned fields
+        - ``include=a,b.c`` to embed related records, eager loaded with one
+          query (or join) per relationship (see applepy.includes)
+
+        Passing ``limit`` and/or ``after`` switches to keyset pagination; see
+        _list_page(). Sending ``Accept: application/x-ndjson`` streams every
+        record instead; see _stream_all(). JSON responses carry a strong ETag
+        derived from the table's change version (see _list_etag()) and honor
+        ``If-None-Match`` without running the list query.
 
         Returns:
-            200: List of all records
+            200: List of all records (or one page of records)
+            304: The client's cached copy (If-None-Match) is still current
+            400: Invalid pagination, filter, sort or field parameters
             500: Server error
         """
         try:
-            with get_session() as session:
+            fields = parse_fields(request.args)
+            filters = parse_filters(request.args.items(multi=True))
+            sort = parse_sort(request.args.get("sort"))
+            include = parse_include(request.args)
+
+            if wants_ndjson():
+                return self._stream_all(fields, filters, sort, include)
+
+            if wants_page(request.args):
+                return self._list_page(fields, filters, sort, include)
+
+            with get_session(read_only=True) as session:
                 service = self._get_service(session)
-                records = service.get_all()
-                list_response: ListResponse[RecordSchemaT] = ListResponse(
-                    items=list(records), count=len(records)
-                )
-                response: ApiResponse[ListResponse[RecordSchemaT]] = ApiResponse(
-                    data=list_response
-                )
-                return response.model_dump(), 200
-        except Exception as e:
+                etag = self._list_etag(service, include)
+                cached = not_modified(etag)
+                if cached is not None:
+                    return cached
+
+                records = service.get_all(fields, filters, sort, include)
+                return conditional_response(list_json(records), etag=etag)
+        except ValidationError as e:
             error_response: ApiResponse[None] = ApiResponse(error=str(e))
+            return error_response.model_dump(), 400
+        except Exception as e:
+            error_response = ApiResponse(error=str(e))
             return error_response.model_dump(), 500
 
-    def get_by_id(self, **kwargs: Any) -> FlaskApiResponse:
+    def _list_etag(
+        self,
+        service: BaseService,  # type: ignore[type-arg]
+        include: Optional[list[str]] = None,
+    ) -> str:
+        """Derive a listing's ETag from its table versions and query string.
+
+        Costs one lookup in table_versions. The versions of the listed table
+        and of every included table only change when a write to them is
+        committed, so an unchanged tag means the listing is unchanged too.
+
+        Raises:
+            ValidationError: If an include is not allowed
+        """
+        tables = service.table_names(include)
+        current = versions.read(service.repo.session, tables)
+        return version_etag(
+            *(f"{name}@{current[name]}" for name in tables), request.full_path
+        )
+
+    def _stream_all(
+        self,
+        fields: Optional[list[str]],
+        filters: list[Filter],
+        sort: list[SortKey],
+        include: Optional[list[str]] = None,
+    ) -> Response:
+        """Stream every matching record as newline-delimited JSON.
+
+        The query is executed before the response starts, so invalid parameters
+        still produce a 400. The stream has its own session (the request's is
+        closed when the view returns), which stays open until the response body
+        has been sent (or the client disconnects).
+
+        Raises:
+            ValidationError: If a field, filter or sort key is invalid
+        """
+        stack = ExitStack()
+        session = stack.enter_context(get_stream_session(read_only=True))
+        try:
+            service = self._get_service(session)
+            records = service.iter_all(
+                self.stream_batch_size, fields, filters, sort, include
+            )
+        except BaseException:
+            stack.close()
+            raise
+
+        response = ndjson_response(records)
+        response.call_on_close(stack.close)
+        return response
+
+    def _list_page(
+        self,
+        fields: Optional[list[str]],
+        filters: list[Filter],
+        sort: list[SortKey],
+        include: Optional[list[str]] = None,
+    ) -> Response:
+        """List one page of matching records using keyset pagination.
+
+        Query parameters:
+            limit: Page size (defaults to default_page_size, capped at
+                max_page_size)
+            after: Opaque cursor taken from the previous page's next_cursor;
+                it is only valid with the same sort
+
+        Raises:
+            ValidationError: If limit, after or any other parameter is invalid
+        """
+        limit, after = parse_page_args(
+            request.args, self.default_page_size, self.max_page_size
+        )
+
+        with get_session(read_only=True) as session:
+            service = self._get_service(session)
+            etag = self._list_etag(service, include)
+            cached = not_modified(etag)
+            if cached is not None:
+                return cached
+
+            records, next_after = service.get_page(
+                limit, after, fields, filters, sort, include
+            )
+            next_cursor = encode_cursor(next_after) if next_after is not None else None
+            return conditional_response(
+                page_json(records, limit, next_cursor), etag=etag
+            )
+
+    def get_by_id(self, **kwargs: Any) -> FlaskApiResponse | Response:
         """Get a single record by ID.
 
+        Accepts ``fields=a,b,c`` to return a sparse fieldset and
+        ``include=a,b.c`` to embed related records. The response carries a
+        strong ETag and honors ``If-None-Match``.
+
         Args:
             **kwargs: URL parameters including the ID
 
         Returns:
             200: The requested record
+            304: The client's cached copy (If-None-Match) is still current
+            400: Unknown field or include requested
             404: Record not found
             500: Server error
         """
         try:
             id_value = kwargs[self.id_param_name]
-            with get_session() as session:
+            fields = parse_fields(request.args)
+            include = parse_include(request.args)
+            with get_session(read_only=True) as session:
                 service = self._get_service(session)
-                record = service.get_by_id(id_value)
-                response: ApiResponse[RecordSchemaT] = ApiResponse(data=record)
-                return response.model_dump(), 200
-        except NotFoundException as e:
+                record = service.get_by_id(id_value, fields, include)
+                return conditional_response(record_json(record))
+        except ValidationError as e:
             error_response: ApiResponse[None] = ApiResponse(error=str(e))
+            return error_response.model_dump(), 400
+        except NotFoundException as e:
+            error_response = ApiResponse(error=str(e))
             return error_response.model_dump(), 404
         except Exception as e:
             error_response = ApiResponse(error=str(e))
             return error_response.model_dump(), 500
 
-    def create(self) -> FlaskApiResponse:
+    def create(self) -> FlaskApiResponse | Response:
         """Create a new record.
 
         Returns:
@@ -164,13 +331,74 @@ class CrudRoutes(Generic[CreateSchemaT, RecordSchemaT, K]):
                 service = self._get_service(session)
                 created_record = service.create(create_data)
                 session.commit()
-                response: ApiResponse[RecordSchemaT] = ApiResponse(data=created_record)
+                return json_response(record_json(created_record), 201)
+        except Exception as e:
+            error_response = ApiResponse(error=str(e))
+            return error_response.model_dump(), 500
+
+    def bulk_create(self) -> FlaskApiResponse:
+        """Create many records from a JSON array in one transaction.
+
+        The whole array is validated up front; nothing is written if any item is
+        invalid. Valid items are inserted with a single multi-row INSERT.
+
+        Returns:
+            201: Records created, with the number of rows inserted
+            400: Body is not a non-empty array, or an item is invalid
+            500: Server error
+        """
+        try:
+            items = parse_bulk(self._bulk_adapter, request.get_json())
+
+            with get_session() as session:
+                service = self._get_service(session)
+                count = service.bulk_create(items)
+                session.commit()
+                response: ApiResponse[BulkResponse] = ApiResponse(
+                    data=BulkResponse(count=count),
+                    message=f"Created {count} records",
+                )
                 return response.model_dump(), 201
+        except ValidationError as e:
+            error_response: ApiResponse[None] = ApiResponse(error=str(e))
+            return error_response.model_dump(), 400
         except Exception as e:
             error_response = ApiResponse(error=str(e))
             return error_response.model_dump(), 500
 
-    def update(self, **kwargs: Any) -> FlaskApiResponse:
+    def bulk_upsert(self) -> FlaskApiResponse:
+        """Insert or update many records from a JSON array in one transaction.
+
+        Each item is a full record including its primary key. Items whose key
+        already exists overwrite the stored row; the rest are inserted. The
+        whole array is validated up front and written with a single native
+        upsert statement.
+
+        Returns:
+            200: Records written, with the number of items processed
+            400: Body is not a non-empty array, or an item is invalid
+            500: Server error
+        """
+        try:
+            items = parse_bulk(self._bulk_record_adapter, request.get_json())
+
+            with get_session() as session:
+                service = self._get_service(session)
+                count = service.upsert(items)
+                session.commit()
+                response: ApiResponse[BulkResponse] = ApiResponse(
+                    data=BulkResponse(count=count),
+                    message=f"Upserted {count} records",
+                )
+                return response.model_dump(), 200
+        except ValidationError as e:
+            error_response: ApiResponse[None] = ApiResponse(error=str(e))
+            return error_response.model_dump(), 400
+        except Exception as e:
+            error_response = ApiResponse(error=str(e))
+            return error_response.model_dump(), 500
+
+    def update(self, **kwargs: Any) -> FlaskApiResponse | Response:
         """Update an existing record.
 
         Args:
@@ -209,8 +437,7 @@ class CrudRoutes(Generic[CreateSchemaT, RecordSchemaT, K]):
                 service = self._get_service(session)
                 updated_record = service.update(record_data)
                 session.commit()
-                response: ApiResponse[RecordSchemaT] = ApiResponse(data=updated_record)
-                return response.model_dump(), 200
+                return json_response(record_json(updated_record))
         except NotFoundException as e:
             error_response = ApiResponse(error=str(e))
             return error_response.model_dump(), 404
@@ -0,0 +1,53 @@
+"""Validation helpers for bulk (array) request bodies.
+
+Bulk endpoints accept a JSON array of payloads, validate the whole array in one
+pass and write it with a single multi-row statement inside one transaction.
+"""
+
+from typing import Any, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+
+from applepy.exceptions import ValidationError
+from applepy.serialization import list_adapter
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+# Largest number of items accepted in a single bulk request
+MAX_BULK_SIZE = 50_000
+
+
+def bulk_adapter(schema: Type[SchemaT]) -> TypeAdapter[list[SchemaT]]:
+    """Build a TypeAdapter that validates a list of ``schema`` in one call."""
+    return list_adapter(schema)
+
+
+def parse_bulk(
+    adapter: TypeAdapter[list[SchemaT]],
+    data: Any,
+    max_size: int = MAX_BULK_SIZE,
+) -> list[SchemaT]:
+    """Validate a bulk request body.
+
+    Args:
+        adapter: Adapter from bulk_adapter() for the item schema
+        data: Decoded JSON request body
+        max_size: Largest number of items accepted
+
+    Returns:
+        List of validated schema instances
+
+    Raises:
+        ValidationError: If the body is not a non-empty array of at most
+            max_size items, or any item fails validation
+    """
+    if not isinstance(data, list) or not data:
+        raise ValidationError("Expected a non-empty JSON array")
+    if len(data) > max_size:
+        raise ValidationError(f"At most {max_size} items can be sent at once")
+
+    try:
+        return adapter.validate_python(data)
+    except PydanticValidationError as e:
+        raise ValidationError(str(e)) from e
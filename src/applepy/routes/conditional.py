@@ -0,0 +1,77 @@
+"""Conditional GET support: strong ETags and ``304 Not Modified`` responses.
+
+Read endpoints serialize their payload once, derive a strong ETag from the
+serialized bytes and answer ``If-None-Match`` requests whose tag still matches
+with an empty ``304`` instead of resending the body. Endpoints that can derive
+the tag from data versions instead (see applepy.table_versions) check it with
+not_modified() before running their query at all.
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from flask import Response, current_app, request
+
+
+def payload_etag(body: bytes) -> str:
+    """Return a strong entity tag for a serialized response body."""
+    return hashlib.sha256(body).hexdigest()
+
+
+def version_etag(*parts: object) -> str:
+    """Return a strong entity tag for a representation identified by parts.
+
+    Args:
+        *parts: Everything the representation depends on, e.g. the table
+            version and the request's path and query string
+
+    Returns:
+        The entity tag
+    """
+    return payload_etag(":".join(str(part) for part in parts).encode())
+
+
+def not_modified(etag: str) -> Optional[Response]:
+    """Return an empty ``304`` if the request's If-None-Match matches etag.
+
+    Args:
+        etag: Current entity tag of the requested representation
+
+    Returns:
+        The ``304`` response, or None if the body must be sent
+    """
+    if not request.if_none_match.contains(etag):
+        return None
+    response: Response = current_app.response_class(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def conditional_response(
+    payload: dict[str, Any] | bytes, status: int = 200, etag: Optional[str] = None
+) -> Response:
+    """Serialize a JSON payload and apply conditional GET handling.
+
+    Args:
+        payload: JSON-serializable response body, or a body already encoded
+            to JSON bytes (see applepy.serialization)
+        status: Status code to use when the body is sent
+        etag: Entity tag to use; defaults to a hash of the serialized body
+
+    Returns:
+        The JSON response with an ``ETag`` header, or an empty ``304`` if the
+        request's ``If-None-Match`` matches that tag
+    """
+    body = (
+        payload
+        if isinstance(payload, bytes)
+        else current_app.json.dumps(payload).encode()
+    )
+    response: Response = current_app.response_class(
+        body + b"\n",
+        status=status,
+        mimetype="application/json",
+    )
+    response.set_etag(etag or payload_etag(response.get_data()))
+    response.make_conditional(request)
+    return response
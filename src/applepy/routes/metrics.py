@@ -0,0 +1,28 @@
+"""Metrics endpoints exposing the in-process metrics registry."""
+
+from flask import Blueprint, Response, jsonify
+
+from applepy.metrics import metrics
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.route("/_metrics", methods=["GET"])
+def metrics_snapshot() -> Response:
+    """Return every metric (pool usage, wait times, ...) as JSON.
+
+    Values are per process: with several workers, each reports its own.
+    """
+    return jsonify(metrics.snapshot())
+
+
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics_prometheus() -> Response:
+    """Return every metric in the Prometheus text exposition format."""
+    return Response(
+        metrics.render_prometheus(),
+        content_type=PROMETHEUS_CONTENT_TYPE,
+    )
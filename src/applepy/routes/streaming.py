@@ -0,0 +1,42 @@
+"""Streaming (NDJSON) responses for full-table listings.
+
+Clients that really need a whole table can ask for newline-delimited JSON with
+``Accept: application/x-ndjson``. Rows are read through a server-side cursor in
+batches and each record is serialized as soon as it arrives, so peak worker
+memory stays flat regardless of table size.
+"""
+
+from typing import Iterable, Iterator
+
+from flask import Response, request, stream_with_context
+from pydantic import BaseModel
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# Number of rows fetched from the server-side cursor per round trip
+STREAM_BATCH_SIZE = 1000
+
+
+def wants_ndjson() -> bool:
+    """Return True if the client prefers NDJSON over a regular JSON body."""
+    best = request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE])
+    return best == NDJSON_MIMETYPE
+
+
+def ndjson_lines(records: Iterable[BaseModel]) -> Iterator[str]:
+    """Serialize records one per line as they are produced."""
+    for record in records:
+        yield record.model_dump_json() + "\n"
+
+
+def ndjson_response(records: Iterable[BaseModel]) -> Response:
+    """Build a streaming NDJSON response from a lazy iterable of records.
+
+    The iterable should use its own database session (``get_stream_session()``
+    rather than the request-scoped ``get_session()``) since it is consumed
+    after the view returns and the request's sessions are closed.
+    """
+    return Response(
+        stream_with_context(ndjson_lines(records)),
+        mimetype=NDJSON_MIMETYPE,
+    )
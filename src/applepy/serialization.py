@@ -0,0 +1,99 @@
+"""Single-pass validation and JSON encoding of API records.
+
+Listing rows used to validate each entity on its own, dump every record to a
+dict and then have Flask's JSON encoder walk those dicts again. Lists are now
+validated with one TypeAdapter call, and response envelopes are encoded
+straight to JSON bytes by pydantic-core. Each envelope is parametrized with
+the concrete record schema, so no value's type has to be inferred while
+encoding.
+
+Dates are encoded as ISO 8601 (``2003-01-06``) and decimals as strings. These
+are the same formats NDJSON streaming produces and request bodies accept.
+Keys keep the schema's field order: JSON_SORT_KEYS only applies to bodies that
+Flask still encodes (errors and messages).
+"""
+
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Sequence, Type, TypeVar
+
+from flask import Response, current_app
+from pydantic import BaseModel, TypeAdapter
+
+from applepy.responses import ApiResponse, ListResponse, PaginatedResponse
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+@lru_cache(maxsize=256)
+def list_adapter(schema: Type[SchemaT]) -> TypeAdapter[list[SchemaT]]:
+    """Return a (cached) TypeAdapter for a list of ``schema``."""
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
+def validate_all(schema: Type[SchemaT], entities: Iterable[Any]) -> list[SchemaT]:
+    """Validate ORM entities (or any objects with attributes) in one call.
+
+    Args:
+        schema: Record schema to build
+        entities: Objects to read the schema's fields from
+
+    Returns:
+        One schema instance per entity
+    """
+    return list_adapter(schema).validate_python(entities, from_attributes=True)
+
+
+@lru_cache(maxsize=256)
+def _envelope(schema: Type[BaseModel], wrapper: Any = None) -> TypeAdapter[Any]:
+    data_type = schema if wrapper is None else wrapper[schema]
+    return TypeAdapter(ApiResponse[data_type])  # type: ignore[valid-type]
+
+
+def _schema_of(records: Sequence[BaseModel]) -> Type[BaseModel]:
+    # Partial (sparse fieldset) and full records each get their own envelope;
+    # an empty list needs no item schema at all
+    if not records:
+        return BaseModel
+    return type(records[0])
+
+
+def record_json(record: BaseModel) -> bytes:
+    """Encode ``{"data": record, "error": null, "message": null}``."""
+    envelope = _envelope(type(record))
+    return envelope.dump_json(ApiResponse.model_construct(data=record))
+
+
+def list_json(records: Sequence[BaseModel]) -> bytes:
+    """Encode an ApiResponse wrapping a ListResponse of records."""
+    envelope = _envelope(_schema_of(records), ListResponse)
+    data: ListResponse[BaseModel] = ListResponse.model_construct(
+        items=records, count=len(records)
+    )
+    return envelope.dump_json(ApiResponse.model_construct(data=data))
+
+
+def page_json(
+    records: Sequence[BaseModel], page_size: int, next_cursor: Optional[str]
+) -> bytes:
+    """Encode an ApiResponse wrapping a PaginatedResponse of records."""
+    envelope = _envelope(_schema_of(records), PaginatedResponse)
+    data: PaginatedResponse[BaseModel] = PaginatedResponse.model_construct(
+        items=records,
+        count=len(records),
+        page_size=page_size,
+        next_cursor=next_cursor,
+    )
+    return envelope.dump_json(ApiResponse.model_construct(data=data))
+
+
+def records_json(schema: Type[SchemaT], records: Sequence[SchemaT]) -> bytes:
+    """Encode a bare JSON array of records."""
+    return list_adapter(schema).dump_json(list(records))
+
+
+def json_response(body: bytes, status: int = 200) -> Response:
+    """Build an ``application/json`` response from an encoded body."""
+    response: Response = current_app.response_class(
+        body + b"\n", status=status, mimetype="application/json"
+    )
+    return response
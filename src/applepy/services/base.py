@@ -1,10 +1,24 @@
 """Generic base service for business logic operations."""
 
-from typing import Generic, Type, TypeVar
+from typing import (
+    Any,
+    ClassVar,
+    Generic,
+    Iterator,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from pydantic import BaseModel
 
+from applepy.fieldsets import partial_schema, with_key
+from applepy.filters import Filter, SortKey
+from applepy.includes import include_schema, included_tables, resolve_includes
 from applepy.repositories.base import BaseRepository
+from applepy.serialization import validate_all
 
 # Type variables (must match BaseRepository)
 T = TypeVar("T")  # Model class
@@ -26,8 +40,15 @@ class BaseService(Generic[T, K, CreateSchemaT, RecordSchemaT]):
         K: The ID field type (e.g., str for office_code, int for employee_number)
         CreateSchemaT: Pydantic schema for creation (e.g., OfficeCreate)
         RecordSchemaT: Pydantic schema for responses (e.g., OfficeRecord)
+
+    Subclasses may set includes to let clients embed related records with
+    ``?include=`` (see applepy.includes).
     """
 
+    # Relationship paths that may be included, mapped to the record schema each
+    # related object is embedded with (e.g., {"customer": CustomerRecord})
+    includes: ClassVar[dict[str, Type[BaseModel]]] = {}
+
     def __init__(
         self,
         repo: BaseRepository[T, K, CreateSchemaT, RecordSchemaT],
@@ -42,29 +63,170 @@ class BaseService(Generic[T, K, CreateSchemaT, RecordSchemaT]):
         self.repo = repo
         self.schema_class = schema_class
 
-    def get_all(self) -> list[RecordSchemaT]:
-        """Retrieve all records and transform to response schema.
+    def _fieldset(
+        self, fields: Optional[Sequence[str]]
+    ) -> tuple[Optional[tuple[str, ...]], Type[BaseModel]]:
+        """Resolve a sparse fieldset to the columns to load and the schema to use.
+
+        Args:
+            fields: Requested field names, or None for the full record
+
+        Returns:
+            Tuple of (column names including the primary key or None, schema
+            class to validate entities with)
+
+        Raises:
+            ValidationError: If a requested field is not part of the record schema
+        """
+        if not fields:
+            return None, self.schema_class
+
+        columns = with_key(fields, self.repo.id_field_name)
+        return columns, partial_schema(self.schema_class, columns)
+
+    def _with_includes(
+        self, schema: Type[BaseModel], include: Optional[Sequence[str]]
+    ) -> tuple[tuple[str, ...], Type[BaseModel]]:
+        """Resolve requested includes to the paths to load and the schema to use.
+
+        Args:
+            schema: Schema returned by _fieldset()
+            include: Requested relationship paths, or None
+
+        Returns:
+            Tuple of (every relationship path to eager load, schema embedding
+            the related records)
+
+        Raises:
+            ValidationError: If a path is not in includes
+        """
+        if not include:
+            return (), schema
+
+        paths = resolve_includes(include, self.includes)
+        embedded = tuple((path, self.includes[path]) for path in paths)
+        model_class = cast(type, self.repo.model_class)
+        return paths, include_schema(schema, model_class, embedded)
+
+    def table_names(self, include: Optional[Sequence[str]] = None) -> list[str]:
+        """Return the tables a listing with these includes reads.
+
+        Raises:
+            ValidationError: If an include is not in includes
+        """
+        table_name: str = self.repo.model_class.__tablename__  # type: ignore[attr-defined]
+        if not include:
+            return [table_name]
+        paths = resolve_includes(include, self.includes)
+        return [table_name, *included_tables(self.repo.model_class, paths)]
+
+    def get_all(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        filters: Sequence[Filter] = (),
+        sort: Sequence[SortKey] = (),
+        include: Optional[Sequence[str]] = None,
+    ) -> list[BaseModel]:
+        """Retrieve all matching records and transform to response schema.
+
+        Args:
+            fields: Optional sparse fieldset; only these fields (plus the
+                primary key) are selected and returned
+            filters: Optional filters applied in SQL
+            sort: Optional sort keys applied in SQL
+            include: Optional relationship paths to eager load and embed
 
         Returns:
             List of records transformed to Pydantic schema instances
         """
-        entities = self.repo.all()
-        return [self.schema_class.model_validate(entity) for entity in entities]
+        columns, schema = self._fieldset(fields)
+        paths, schema = self._with_includes(schema, include)
+        entities = self.repo.all(columns, filters, sort, paths)
+        return validate_all(schema, entities)
+
+    def iter_all(
+        self,
+        batch_size: int = 1000,
+        fields: Optional[Sequence[str]] = None,
+        filters: Sequence[Filter] = (),
+        sort: Sequence[SortKey] = (),
+        include: Optional[Sequence[str]] = None,
+    ) -> Iterator[BaseModel]:
+        """Stream all matching records, transforming each one as it is read.
+
+        The query is validated and executed immediately, so invalid fields or
+        filters raise here rather than part-way through a streamed response.
+
+        Args:
+            batch_size: Number of rows to fetch per round trip
+            fields: Optional sparse fieldset of fields to return
+            filters: Optional filters applied in SQL
+            sort: Optional sort keys applied in SQL
+            include: Optional relationship paths to eager load and embed
+
+        Returns:
+            Iterator over records transformed to Pydantic schema instances
+        """
+        columns, schema = self._fieldset(fields)
+        paths, schema = self._with_includes(schema, include)
+        entities = self.repo.iter_all(batch_size, columns, filters, sort, paths)
+        return (schema.model_validate(entity) for entity in entities)
+
+    def get_page(
+        self,
+        limit: int,
+        after: Optional[Sequence[Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        filters: Sequence[Filter] = (),
+        sort: Sequence[SortKey] = (),
+        include: Optional[Sequence[str]] = None,
+    ) -> tuple[list[BaseModel], Optional[list[Any]]]:
+        """Retrieve one page of matching records using keyset pagination.
 
-    def get_by_id(self, id_value: K) -> RecordSchemaT:
+        Args:
+            limit: Maximum number of records to return
+            after: Key values of the last record on the previous page, or None
+                for the first page
+            fields: Optional sparse fieldset of fields to return
+            filters: Optional filters applied in SQL
+            sort: Optional sort keys applied in SQL
+            include: Optional relationship paths to eager load and embed
+
+        Returns:
+            Tuple of (records on this page, key values to continue after or
+            None if this is the last page)
+        """
+        columns, schema = self._fieldset(fields)
+        paths, schema = self._with_includes(schema, include)
+        entities, next_after = self.repo.page(
+            limit, after, columns, filters, sort, paths
+        )
+        return validate_all(schema, entities), next_after
+
+    def get_by_id(
+        self,
+        id_value: K,
+        fields: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None,
+    ) -> BaseModel:
         """Retrieve a single record by ID and transform to response schema.
 
         Args:
             id_value: The value of the primary key field
+            fields: Optional sparse fieldset of fields to return
+            include: Optional relationship paths to eager load and embed
 
         Returns:
             Record transformed to Pydantic schema instance
 
         Raises:
             NotFoundException: If no record with the given ID exists
+            ValidationError: If a requested field or include is not allowed
         """
-        entity = self.repo.get(id_value)
-        return self.schema_class.model_validate(entity)
+        columns, schema = self._fieldset(fields)
+        paths, schema = self._with_includes(schema, include)
+        entity = self.repo.get(id_value, columns, paths)
+        return schema.model_validate(entity)
 
     def create(self, data: CreateSchemaT) -> RecordSchemaT:
         """Create a new record from validated schema and transform response.
@@ -82,9 +244,35 @@ class BaseService(Generic[T, K, CreateSchemaT, RecordSchemaT]):
         entity = self.repo.create(data)
         return self.schema_class.model_validate(entity)
 
+    def bulk_create(self, items: Sequence[CreateSchemaT]) -> int:
+        """Create many records in one multi-row INSERT.
+
+        Args:
+            items: Validated create schemas
+
+        Returns:
+            Number of records created
+        """
+        return self.repo.bulk_create(items)
+
+    def upsert(self, items: Sequence[RecordSchemaT]) -> int:
+        """Insert or update many records by primary key in one statement.
+
+        Args:
+            items: Validated record schemas including the primary key
+
+        Returns:
+            Number of records inserted or updated
+        """
+        return self.repo.upsert(items)
+
     def update(self, data: RecordSchemaT) -> RecordSchemaT:
         """Update an existing record from validated schema and transform response.
 
+        When every field of the record is set, the row is written with a single
+        UPDATE statement and the response is built from ``data``; partial
+        updates load the entity so the response reflects the stored values.
+
         Args:
             data: Pydantic record schema with updated field values
 
@@ -95,6 +283,10 @@ class BaseService(Generic[T, K, CreateSchemaT, RecordSchemaT]):
             NotFoundException: If no record with the given ID exists
             ValidationError: If schema validation fails (from caller)
         """
+        if data.model_fields_set.issuperset(self.schema_class.model_fields):
+            self.repo.update_in_place(data)
+            return data
+
         entity = self.repo.update(data)
         return self.schema_class.model_validate(entity)
 
@@ -0,0 +1,148 @@
+"""Read-through caching for services whose records are read far more than written."""
+
+from typing import Any, Optional, Sequence, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from applepy.cache import get_cache
+from applepy.filters import Filter, SortKey
+from applepy.services.base import BaseService
+from applepy.table_versions import versions
+
+T = TypeVar("T")  # Model class
+K = TypeVar("K")  # ID type
+CreateSchemaT = TypeVar("CreateSchemaT", bound=BaseModel)  # Create schema
+RecordSchemaT = TypeVar("RecordSchemaT", bound=BaseModel)  # Record/response schema
+
+
+class CachedService(BaseService[T, K, CreateSchemaT, RecordSchemaT]):
+    """BaseService that caches get_by_id() and get_all() results.
+
+    Records are cached as dumped field values in the backend returned by
+    applepy.cache.get_cache() and rebuilt without re-validation on a hit, so a
+    hit costs neither a query nor Pydantic validation.
+
+    Every key includes a per-model generation number. create, bulk_create,
+    upsert, update and delete_by_id increment it, which invalidates every
+    cached record and listing of that model at once. It is incremented again
+    after the session commits, so a read that raced the write cannot leave the
+    old value cached.
+
+    With an in-process backend the generation only counts this process's
+    writes, so keys also include the latest version of the model's table seen
+    by the process (applepy.table_versions). Listings read the committed
+    version for their ETag before get_all(), so a listing never serves an
+    entry older than the version its ETag was derived from.
+
+    Pages, streamed listings and reads with ``include`` are not cached; the
+    related records they embed belong to other models, whose writes do not
+    invalidate this model's entries.
+    """
+
+    def _cache_prefix(self) -> str:
+        return f"service:{self.repo.model_class.__name__}"
+
+    def _generation_key(self) -> str:
+        return f"{self._cache_prefix()}:generation"
+
+    def _cache_key(self, *parts: Any) -> str:
+        generation = get_cache().get(self._generation_key()) or 0
+        table_name: str = self.repo.model_class.__tablename__  # type: ignore[attr-defined]
+        version = versions.current(table_name)
+        return ":".join(
+            [
+                self._cache_prefix(),
+                f"{generation}.{version}",
+                *(repr(part) for part in parts),
+            ]
+        )
+
+    def invalidate_cache(self) -> None:
+        """Drop every cached record and listing of this service's model."""
+        get_cache().incr(self._generation_key())
+
+    def _invalidate_after_write(self) -> None:
+        self.invalidate_cache()
+
+        def _committed(session: Session) -> None:
+            self.invalidate_cache()
+
+        event.listen(self.repo.session, "after_commit", _committed, once=True)
+
+    def get_all(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        filters: Sequence[Filter] = (),
+        sort: Sequence[SortKey] = (),
+        include: Optional[Sequence[str]] = None,
+    ) -> list[BaseModel]:
+        """Retrieve all matching records, from the cache when possible.
+
+        See BaseService.get_all().
+        """
+        if include:
+            return super().get_all(fields, filters, sort, include)
+
+        columns, schema = self._fieldset(fields)
+        key = self._cache_key("all", columns, tuple(filters), tuple(sort))
+        cached = get_cache().get(key)
+        if cached is not None:
+            return [schema.model_construct(**values) for values in cached]
+
+        records = super().get_all(fields, filters, sort)
+        get_cache().set(key, [record.model_dump() for record in records])
+        return records
+
+    def get_by_id(
+        self,
+        id_value: K,
+        fields: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None,
+    ) -> BaseModel:
+        """Retrieve a single record by ID, from the cache when possible.
+
+        See BaseService.get_by_id(). Missing records are not cached.
+        """
+        if include:
+            return super().get_by_id(id_value, fields, include)
+
+        columns, schema = self._fieldset(fields)
+        key = self._cache_key("get", id_value, columns)
+        cached = get_cache().get(key)
+        if cached is not None:
+            return schema.model_construct(**cached)
+
+        record = super().get_by_id(id_value, fields)
+        get_cache().set(key, record.model_dump())
+        return record
+
+    def create(self, data: CreateSchemaT) -> RecordSchemaT:
+        """Create a record and invalidate the model's cache entries."""
+        record = super().create(data)
+        self._invalidate_after_write()
+        return record
+
+    def bulk_create(self, items: Sequence[CreateSchemaT]) -> int:
+        """Create many records and invalidate the model's cache entries."""
+        count = super().bulk_create(items)
+        self._invalidate_after_write()
+        return count
+
+    def upsert(self, items: Sequence[RecordSchemaT]) -> int:
+        """Upsert many records and invalidate the model's cache entries."""
+        count = super().upsert(items)
+        self._invalidate_after_write()
+        return count
+
+    def update(self, data: RecordSchemaT) -> RecordSchemaT:
+        """Update a record and invalidate the model's cache entries."""
+        record = super().update(data)
+        self._invalidate_after_write()
+        return record
+
+    def delete_by_id(self, id_value: K) -> None:
+        """Delete a record and invalidate the model's cache entries."""
+        super().delete_by_id(id_value)
+        self._invalidate_after_write()
@@ -1,26 +1,53 @@
 """Database session context manager for automatic resource cleanup."""
 
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Generator, Optional
 
+from flask import g, has_request_context
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
-from applepy.db import SessionLocal
+# applepy.table_versions is imported for its Session listeners, which bump
+# table versions on commit
+import applepy.table_versions  # noqa: F401
+from applepy.db import SessionLocal, engines
+from applepy.replicas import mark_wrote_primary, router, wrote_primary
+
+# Flask ``g`` attribute holding the request's sessions, keyed by "primary" and
+# "replica"
+_SESSIONS_ATTR = "_applepy_sessions"
 
 
 @contextmanager
-def get_session() -> Generator[Session, None, None]:
+def get_session(read_only: bool = False) -> Generator[Session, None, None]:
     """Context manager for database sessions with automatic cleanup.
 
     This context manager provides automatic resource management for database
     sessions. It ensures that sessions are properly closed and cleaned up
-    after use, preventing connection leaks.
+    after use, preventing connection leaks. Sessions are bound to the shared
+    default engine from applepy.db.engines.
+
+    Inside a Flask request the session is request-scoped: it is created on
+    first use, shared by every later get_session() call in the same request
+    and closed when the app context is torn down (see close_request_sessions).
+    A connection is only checked out from the pool once the session first
+    executes SQL, so requests that fail validation never touch the pool. If
+    the block raises, the shared session is rolled back so the rest of the
+    request starts from a clean transaction.
+
+    Read-only sessions are routed to a read replica when replicas are
+    configured (see applepy.replicas), unless the current request has already
+    committed a write, in which case they stay on the primary so the request
+    reads its own writes.
 
     Usage:
         with get_session() as session:
             result = service.get_all(session)
             # Session is automatically closed after this block
 
+    Args:
+        read_only: True if the session will only read
+
     Yields:
         SQLAlchemy Session instance for database operations
 
@@ -29,8 +56,85 @@ def get_session() -> Generator[Session, None, None]:
         session.rollback() as needed. This context manager only ensures
         the session is properly closed.
     """
-    session = SessionLocal()
+    if not has_request_context():
+        session = _new_session(read_only)
+        try:
+            yield session
+        finally:
+            session.close()
+        return
+
+    session = _request_session(read_only)
+    try:
+        yield session
+    except BaseException:
+        session.rollback()
+        raise
+
+
+@contextmanager
+def get_stream_session(read_only: bool = False) -> Generator[Session, None, None]:
+    """Context manager for a session that outlives the view function.
+
+    Streamed response bodies are read after the view returns and after
+    close_request_sessions() has run, so they must not use the request-scoped
+    session: a closed session silently begins a new transaction and its
+    connection would not go back to the pool. The session yielded here is
+    never shared and is always closed on exit, also inside a request; exit
+    the block from ``response.call_on_close`` or at the end of the generator
+    producing the body.
+
+    Args:
+        read_only: True if the session will only read
+
+    Yields:
+        SQLAlchemy Session instance owned by the caller
+    """
+    session = _new_session(read_only)
     try:
         yield session
     finally:
         session.close()
+
+
+def close_request_sessions(exc: Optional[BaseException] = None) -> None:
+    """Close the sessions opened during the current request.
+
+    Registered with ``app.teardown_appcontext`` by create_app().
+    """
+    sessions: dict[str, Session] = g.pop(_SESSIONS_ATTR, {})
+    for session in sessions.values():
+        session.close()
+
+
+def _new_session(read_only: bool) -> Session:
+    engine = router.choose() if read_only and not wrote_primary() else None
+    return SessionLocal(
+        bind=engine or engines.get(), info={"read_only": engine is not None}
+    )
+
+
+def _request_session(read_only: bool) -> Session:
+    sessions: dict[str, Session] = g.setdefault(_SESSIONS_ATTR, {})
+
+    if read_only and not wrote_primary():
+        replica_session = sessions.get("replica")
+        if replica_session is not None:
+            return replica_session
+        replica = router.choose()
+        if replica is not None:
+            replica_session = SessionLocal(bind=replica, info={"read_only": True})
+            sessions["replica"] = replica_session
+            return replica_session
+
+    primary_session = sessions.get("primary")
+    if primary_session is None:
+        primary_session = SessionLocal(bind=engines.get(), info={"read_only": False})
+        sessions["primary"] = primary_session
+    return primary_session
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _after_commit(session: Session, *args: Any) -> None:
+    if not session.info.get("read_only"):
+        mark_wrote_primary()
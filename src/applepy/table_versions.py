@@ -0,0 +1,169 @@
+"""Per-table change versions for cheap cache and ETag validation.
+
+Every session records which tables its flushes and DML statements write to.
+When it commits, the version of each of those tables is incremented in the
+``table_versions`` table, in the same transaction as the change, and the new
+values are remembered in process. A reader can then tell whether a table has
+changed since it last looked with one primary-key lookup instead of
+re-running the query that reads the table.
+
+Only writes made through a SQLAlchemy Session with ORM objects or
+insert()/update()/delete() constructs are tracked; raw ``text()`` SQL,
+migrations and other clients writing to the database do not bump versions.
+"""
+
+import threading
+from itertools import chain
+from typing import Any, Iterable, cast
+
+from sqlalchemy import BigInteger, String, Table, event, inspect, select, update
+from sqlalchemy.orm import Mapped, ORMExecuteState, Session, mapped_column
+
+from applepy.db import Base
+from applepy.repositories.upsert import increment_statement
+
+# Keys in Session.info holding the tables written in the current transaction
+# and the versions they were bumped to on commit
+_TOUCHED = "applepy_touched_tables"
+_BUMPED = "applepy_bumped_versions"
+
+
+class TableVersion(Base):
+    """Database model for the change version of one table"""
+
+    __tablename__ = "table_versions"
+
+    table_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class VersionTracker:
+    """Read table versions and remember the latest ones seen in process."""
+
+    def __init__(self) -> None:
+        """Initialize with no known versions."""
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def current(self, table_name: str) -> int:
+        """Return the latest version of a table seen by this process.
+
+        Versions committed by other processes are only seen after read().
+        """
+        return self._versions.get(table_name, 0)
+
+    def remember(self, versions: dict[str, int]) -> None:
+        """Record versions read from or written to the database."""
+        with self._lock:
+            for table_name, version in versions.items():
+                if version > self._versions.get(table_name, 0):
+                    self._versions[table_name] = version
+
+    def read(self, session: Session, table_names: Iterable[str]) -> dict[str, int]:
+        """Read the committed versions of tables from the database.
+
+        Args:
+            session: Session to query with
+            table_names: Tables to look up
+
+        Returns:
+            Version per table (0 for tables that have never been written)
+        """
+        names = sorted(set(table_names))
+        rows = session.execute(
+            select(TableVersion.table_name, TableVersion.version).where(
+                TableVersion.table_name.in_(names)
+            )
+        )
+        versions = {name: 0 for name in names}
+        versions.update({name: version for name, version in rows.tuples()})
+        self.remember(versions)
+        return versions
+
+    def bump(self, session: Session, table_names: Iterable[str]) -> dict[str, int]:
+        """Increment the versions of tables within the session's transaction.
+
+        Args:
+            session: Session whose transaction the increment joins
+            table_names: Tables that were written
+
+        Returns:
+            The new version per table
+        """
+        names = sorted(set(table_names))  # consistent lock order
+        table = cast(Table, TableVersion.__table__)
+        stmt = increment_statement(session.get_bind().dialect.name, table, ["version"])
+        if stmt is not None:
+            session.execute(
+                stmt, [{"table_name": name, "version": 1} for name in names]
+            )
+        else:
+            session.execute(
+                update(TableVersion)
+                .where(TableVersion.table_name.in_(names))
+                .values(version=TableVersion.version + 1)
+            )
+            existing = set(
+                session.scalars(
+                    select(TableVersion.table_name).where(
+                        TableVersion.table_name.in_(names)
+                    )
+                )
+            )
+            session.add_all(
+                TableVersion(table_name=name, version=1)
+                for name in names
+                if name not in existing
+            )
+            session.flush()
+        return self.read(session, names)
+
+
+versions = VersionTracker()
+
+
+def _touched(session: Session) -> set[str]:
+    tables: set[str] = session.info.setdefault(_TOUCHED, set())
+    return tables
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session: Session, flush_context: Any) -> None:
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if instance in session.dirty and not session.is_modified(instance):
+            continue
+        for table in inspect(instance).mapper.tables:
+            if table.name != TableVersion.__tablename__:
+                _touched(session).add(table.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _do_orm_execute(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        table = getattr(state.statement, "table", None)
+        name = getattr(table, "name", None)
+        if name is not None and name != TableVersion.__tablename__:
+            _touched(state.session).add(name)
+
+
+@event.listens_for(Session, "before_commit")
+def _before_commit(session: Session) -> None:
+    # The commit's own flush runs after this hook, so flush pending changes
+    # now to learn which tables they touch
+    session.flush()
+    tables = session.info.pop(_TOUCHED, None)
+    if tables:
+        session.info[_BUMPED] = versions.bump(session, tables)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    bumped = session.info.pop(_BUMPED, None)
+    if bumped:
+        versions.remember(bumped)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _after_rollback(session: Session, previous_transaction: Any) -> None:
+    session.info.pop(_TOUCHED, None)
+    session.info.pop(_BUMPED, None)
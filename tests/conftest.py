@@ -2,6 +2,7 @@
 
 from collections.abc import Generator, Iterator
 from contextlib import contextmanager
+from typing import Any
 
 import pytest
 from flask import Flask
@@ -10,7 +11,7 @@ from sqlalchemy.orm import Session
 from werkzeug.test import Client
 
 from applepy import db as db_module
-from applepy.db import engine
+from applepy.db import engines
 from applepy.flask import app as applepyflask
 
 
@@ -22,7 +23,7 @@ def db_connection() -> Generator[sa_engine.Connection, None, None]:
     session will use begin_nested() to create savepoints within this transaction,
     allowing all changes to be rolled back after each test.
     """
-    connection = engine.connect()
+    connection = engines.get().connect()
     transaction = connection.begin()
 
     yield connection
@@ -112,18 +113,41 @@ def app(db_session: Session) -> Generator[Flask, None, None]:
     original_session = db_module.db.session
     db_module.db.session = SessionProxy(db_session)  # type: ignore[assignment]
 
-    # Patch get_session in the routes module where it's imported and used
+    # Patch get_session in the routes modules where it's imported and used
     # This must be patched where get_session is USED, not where it's defined
+    import applepy.domains.customers.routes as customers_routes
+    import applepy.domains.order_details.routes as order_details_routes
+    import applepy.domains.orders.routes as orders_routes
+    import applepy.domains.payments.routes as payments_routes
+    import applepy.domains.product_lines.routes as product_lines_routes
+    import applepy.domains.sales_rollups.routes as sales_rollups_routes
     import applepy.routes.base as routes_module
 
-    original_get_session = routes_module.get_session
-    routes_module.get_session = lambda: get_test_session(db_session)  # type: ignore[assignment]
+    patched_modules: list[Any] = [
+        routes_module,
+        customers_routes,
+        order_details_routes,
+        orders_routes,
+        payments_routes,
+        product_lines_routes,
+        sales_rollups_routes,
+    ]
+    # Streams use get_stream_session() in the same modules
+    originals = {
+        (module, name): getattr(module, name)
+        for module in patched_modules
+        for name in ("get_session", "get_stream_session")
+        if hasattr(module, name)
+    }
+    for module, name in originals:
+        setattr(module, name, lambda *args, **kwargs: get_test_session(db_session))
 
     yield app
 
     # Restore original functions
     db_module.db.session = original_session
-    routes_module.get_session = original_get_session
+    for (module, name), original in originals.items():
+        setattr(module, name, original)
 
 
 @pytest.fixture()
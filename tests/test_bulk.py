@@ -0,0 +1,168 @@
+"""Tests for bulk create endpoints."""
+
+import uuid
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from werkzeug.test import Client
+
+
+def _office(office_code: str) -> dict:  # type: ignore[type-arg]
+    return {
+        "office_code": office_code,
+        "city": "Bulk City",
+        "state": "MA",
+        "country": "USA",
+        "phone": "(617) 555-0100",
+        "address_line_1": "100 Bulk Street",
+        "address_line_2": None,
+        "postal_code": "02108",
+        "territory": "1",
+    }
+
+
+def test_bulk_create_offices(client: Client, db_session: Session) -> None:
+    """Test that many offices are inserted with a single INSERT statement."""
+    codes = [f"BK{uuid.uuid4().hex[:6]}" for _ in range(3)]
+
+    inserts: list[str] = []
+
+    def capture(*args: object) -> None:
+        if str(args[2]).startswith("INSERT INTO offices"):
+            inserts.append(str(args[2]))
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        response = client.post("/offices/bulk", json=[_office(c) for c in codes])
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    assert response.status_code == 201
+    assert response.json["data"]["count"] == 3  # type: ignore[index]
+    assert len(inserts) == 1
+
+    for code in codes:
+        assert client.get(f"/offices/{code}").status_code == 200
+
+
+def test_bulk_create_rejects_invalid_item(client: Client) -> None:
+    """Test that one invalid item rejects the whole batch."""
+    code = f"BK{uuid.uuid4().hex[:6]}"
+    invalid = {"office_code": "BKBAD"}
+    response = client.post("/offices/bulk", json=[_office(code), invalid])
+    assert response.status_code == 400
+    assert "error" in response.json  # type: ignore[operator]
+    assert client.get(f"/offices/{code}").status_code == 404
+
+
+def test_bulk_create_requires_array(client: Client) -> None:
+    """Test that a non-array or empty body returns 400."""
+    assert client.post("/offices/bulk", json=_office("BKOBJ")).status_code == 400
+    assert client.post("/offices/bulk", json=[]).status_code == 400
+
+
+def test_bulk_create_payments(client: Client) -> None:
+    """Test bulk creation on the composite-key payments routes."""
+    customer_response = client.post(
+        "/customers",
+        json={
+            "customer_name": "Bulk Co",
+            "contact_last_name": "Doe",
+            "contact_first_name": "Jane",
+            "phone": "+1-555-0100",
+            "address_line_1": "1 Bulk St",
+            "city": "Boston",
+            "country": "USA",
+        },
+    )
+    customer_number = customer_response.json["data"]["customer_number"]  # type: ignore[index]
+
+    payments = [
+        {
+            "customer_number": customer_number,
+            "check_number": f"BK{i}{uuid.uuid4().hex[:6]}",
+            "payment_date": "2024-02-01",
+            "amount": "10.00",
+        }
+        for i in range(5)
+    ]
+    response = client.post("/payments/bulk", json=payments)
+    assert response.status_code == 201
+    assert response.json == {"count": 5}
+
+    listed = client.get(f"/customers/{customer_number}/payments")
+    assert len(listed.json) == 5  # type: ignore[arg-type]
+
+
+def test_bulk_create_payments_invalid(client: Client) -> None:
+    """Test that invalid composite-key payloads return 400."""
+    response = client.post("/payments/bulk", json=[{"check_number": "X"}])
+    assert response.status_code == 400
+    assert "error" in response.json  # type: ignore[operator]
+
+
+def _product(product_code: str, product_line: str, stock: int) -> dict:  # type: ignore[type-arg]
+    return {
+        "product_code": product_code,
+        "product_name": f"Model {product_code}",
+        "product_line": product_line,
+        "product_scale": "1:18",
+        "product_vendor": "Bulk Vendor",
+        "product_description": "Die-cast model",
+        "quantity_in_stock": stock,
+        "buy_price": "10.00",
+        "msrp": "20.00",
+    }
+
+
+def test_bulk_upsert_products(client: Client, db_session: Session) -> None:
+    """Test that existing products are updated and new ones inserted."""
+    product_line = f"Bulk {uuid.uuid4().hex[:6]}"
+    client.post("/product-lines", json={"product_line": product_line})
+    existing, new = (f"S{uuid.uuid4().hex[:8]}" for _ in range(2))
+
+    response = client.put("/products/bulk", json=[_product(existing, product_line, 1)])
+    assert response.status_code == 200
+
+    statements: list[str] = []
+
+    def capture(*args: object) -> None:
+        # The table version bump on commit is not part of the upsert
+        if "table_versions" not in str(args[2]):
+            statements.append(str(args[2]))
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        response = client.put(
+            "/products/bulk",
+            json=[
+                _product(existing, product_line, 500),
+                _product(new, product_line, 7),
+            ],
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    assert response.status_code == 200
+    assert response.json["data"]["count"] == 2  # type: ignore[index]
+    assert not any(s.startswith("SELECT") for s in statements)
+    assert len([s for s in statements if s.startswith("INSERT")]) == 1
+
+    updated = client.get(f"/products/{existing}").json["data"]  # type: ignore[index]
+    assert updated["quantity_in_stock"] == 500
+    inserted = client.get(f"/products/{new}").json["data"]  # type: ignore[index]
+    assert inserted["quantity_in_stock"] == 7
+
+
+def test_bulk_upsert_invalid(client: Client) -> None:
+    """Test that items missing the primary key are rejected."""
+    item = _product("S1", "Classic Cars", 1)
+    del item["product_code"]
+    assert client.put("/products/bulk", json=[item]).status_code == 400
+
+
+def test_bulk_upsert_not_exposed_by_default(client: Client) -> None:
+    """Test that routes without allow_bulk_upsert have no PUT /bulk."""
+    assert client.put("/offices/bulk", json=[_office("BKPUT")]).status_code != 200
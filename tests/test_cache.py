@@ -0,0 +1,111 @@
+"""Tests for cache backends and read-through service caching."""
+
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from werkzeug.test import Client
+
+from applepy.cache import LRUCache, get_cache, set_cache
+from applepy.query_stats import QUERIES_HEADER
+from applepy.table_versions import TableVersion, versions
+
+
+@pytest.fixture()
+def lru_cache() -> Iterator[LRUCache]:
+    """Enable an in-process cache for the duration of a test."""
+    previous = get_cache()
+    cache = LRUCache(max_entries=100)
+    set_cache(cache)
+    yield cache
+    set_cache(previous)
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    """Test that the oldest unused entry is evicted when full."""
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert len(cache) == 2
+
+
+def test_lru_expires_entries() -> None:
+    """Test per-entry TTLs and never-evicted counters."""
+    cache = LRUCache(max_entries=1, ttl=60)
+    cache.set("gone", "x", ttl=0)
+    assert cache.get("gone") is None
+
+    assert cache.incr("generation") == 1
+    assert cache.incr("generation") == 2
+    cache.set("a", 1)
+    assert cache.get("generation") == 2
+
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.get("generation") is None
+
+
+def test_get_by_id_is_cached(
+    client: Client,
+    test_office: dict,  # type: ignore[type-arg]
+    lru_cache: LRUCache,
+) -> None:
+    """Test that a repeated read is served without a query."""
+    url = f"/offices/{test_office['office_code']}"
+    first = client.get(url)
+    second = client.get(url)
+    assert first.headers[QUERIES_HEADER] == "1"
+    assert second.headers[QUERIES_HEADER] == "0"
+    assert second.json == first.json
+
+
+def test_writes_invalidate_cache(
+    client: Client,
+    test_office: dict,  # type: ignore[type-arg]
+    lru_cache: LRUCache,
+) -> None:
+    """Test that update and delete drop cached records and listings."""
+    url = f"/offices/{test_office['office_code']}"
+    client.get(url)
+    client.get("/offices")
+
+    client.put(url, json={**test_office, "city": "Changed City"})
+    assert client.get(url).json["data"]["city"] == "Changed City"  # type: ignore[index]
+    listing = client.get("/offices").json["data"]["items"]  # type: ignore[index]
+    assert "Changed City" in [office["city"] for office in listing]
+
+    client.delete(url)
+    assert client.get(url).status_code == 404
+    listing = client.get("/offices").json["data"]["items"]  # type: ignore[index]
+    assert test_office["office_code"] not in [o["office_code"] for o in listing]
+
+
+def test_listing_follows_version_from_other_process(
+    client: Client,
+    db_session: Session,
+    test_office: dict,  # type: ignore[type-arg]
+    lru_cache: LRUCache,
+) -> None:
+    """Test that a write committed elsewhere is not served from the cache.
+
+    The write bypasses this process's generation counter and version tracker,
+    as one handled by another worker would.
+    """
+    first = client.get("/offices")
+    db_session.execute(
+        text("UPDATE offices SET city = 'Elsewhere' WHERE office_code = :code"),
+        {"code": test_office["office_code"]},
+    )
+    newer = TableVersion(table_name="offices", version=versions.current("offices") + 1)
+    db_session.merge(newer)
+    db_session.flush()
+
+    second = client.get("/offices", headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 200
+    listing = second.json["data"]["items"]  # type: ignore[index]
+    assert "Elsewhere" in [office["city"] for office in listing]
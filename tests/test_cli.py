@@ -10,6 +10,31 @@ def test_flask_command_exists() -> None:
     assert args.command == "flask"
 
 
+def test_flask_command_config_option() -> None:
+    """Test that the flask command accepts a configuration profile."""
+    parser = make_parser()
+    args = parser.parse_args(["flask", "--config", "production"])
+    assert args.config == "production"
+    assert parser.parse_args(["flask"]).config is None
+
+
+def test_run_command_flask_with_config() -> None:
+    """Test that --config is exported before the app is created."""
+    import os
+    from unittest.mock import patch
+
+    from applepy.cli import run_command
+
+    with (
+        patch.dict(os.environ),
+        patch("applepy.flask.app") as mock_flask_app,
+    ):
+        args = make_parser().parse_args(["flask", "--config", "production"])
+        assert run_command(args) == 0
+        assert os.environ["APPLEPY_CONFIG"] == "production"
+        mock_flask_app.run.assert_called_once()
+
+
 def test_db_migrate_command_exists() -> None:
     """Test that the db:migrate command is registered."""
     parser = make_parser()
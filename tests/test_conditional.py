@@ -0,0 +1,48 @@
+"""Tests for ETags and conditional GET (304 Not Modified)."""
+
+from werkzeug.test import Client
+
+
+def test_get_office_not_modified(client: Client, test_office: dict) -> None:  # type: ignore[type-arg]
+    """Test that a matching If-None-Match returns an empty 304."""
+    url = f"/offices/{test_office['office_code']}"
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert etag.startswith('"')  # strong, not W/"..."
+
+    cached = client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+
+
+def test_get_office_etag_changes_on_update(client: Client, test_office: dict) -> None:  # type: ignore[type-arg]
+    """Test that an update invalidates the previous ETag."""
+    url = f"/offices/{test_office['office_code']}"
+    etag = client.get(url).headers["ETag"]
+
+    client.put(url, json={**test_office, "city": "Changed City"})
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json["data"]["city"] == "Changed City"  # type: ignore[index]
+    assert response.headers["ETag"] != etag
+
+
+def test_list_not_modified(client: Client, test_office: dict) -> None:  # type: ignore[type-arg]
+    """Test conditional GET on full and paginated listings."""
+    for url in ("/offices", "/offices?limit=2"):
+        etag = client.get(url).headers["ETag"]
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    etag = client.get("/offices").headers["ETag"]
+    client.delete(f"/offices/{test_office['office_code']}")
+    assert client.get("/offices", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_errors_have_no_etag(client: Client) -> None:
+    """Test that error responses are not tagged."""
+    response = client.get("/offices/NOPE")
+    assert response.status_code == 404
+    assert "ETag" not in response.headers
@@ -0,0 +1,105 @@
+"""Tests for configuration profiles and the shared engine registry."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from applepy.cache import LRUCache, NullCache, get_cache, set_cache
+from applepy.config import (
+    CONFIG_ENV_VAR,
+    DevelopmentConfig,
+    ProductionConfig,
+    TestingConfig,
+    get_config,
+)
+from applepy.db import DEFAULT_ENGINE, EngineRegistry, db, engines
+from applepy.factory import create_app
+
+
+@pytest.fixture(autouse=True)
+def restore_engine() -> Iterator[None]:
+    """Restore the default engine and cache backend after apps are created."""
+    options = engines.options(DEFAULT_ENGINE)
+    backend = get_cache()
+    yield
+    engines.configure(DEFAULT_ENGINE, **options)
+    set_cache(backend)
+
+
+def test_get_config_by_name() -> None:
+    """Test that profiles resolve by (case-insensitive) name."""
+    assert get_config("production") is ProductionConfig
+    assert get_config("Development") is DevelopmentConfig
+
+
+def test_get_config_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that APPLEPY_CONFIG selects the profile, then TESTING."""
+    monkeypatch.setenv(CONFIG_ENV_VAR, "production")
+    assert get_config() is ProductionConfig
+
+    monkeypatch.delenv(CONFIG_ENV_VAR)
+    monkeypatch.setenv("TESTING", "true")
+    assert get_config() is TestingConfig
+
+    monkeypatch.setenv("TESTING", "false")
+    assert get_config() is DevelopmentConfig
+
+
+def test_get_config_unknown() -> None:
+    """Test that an unknown profile raises ValueError."""
+    with pytest.raises(ValueError, match="staging"):
+        get_config("staging")
+
+
+def test_production_profile() -> None:
+    """Test that production disables debug, SQL echo and JSON key sorting."""
+    app = create_app("production")
+    assert app.debug is False
+    assert app.config["SQLALCHEMY_ECHO"] is False
+    assert app.config["SQLALCHEMY_ENGINE_OPTIONS"]["pool_size"] == 10
+    assert app.config["CACHE_TTL"] == 5.0
+    assert app.json.sort_keys is False  # type: ignore[attr-defined]
+    assert app.json.dumps({"b": 1, "a": 2}) == '{"b": 1, "a": 2}'
+
+
+def test_development_profile() -> None:
+    """Test that development enables debug and SQL echo."""
+    app = create_app("development")
+    assert app.debug is True
+    assert app.config["SQLALCHEMY_ECHO"] is True
+    assert app.json.sort_keys is True  # type: ignore[attr-defined]
+
+
+def test_cache_backend_per_profile() -> None:
+    """Test that caching is on by default and off when testing."""
+    create_app("production")
+    assert isinstance(get_cache(), LRUCache)
+    create_app("testing")
+    assert isinstance(get_cache(), NullCache)
+
+
+def test_app_shares_registry_engine() -> None:
+    """Test that Flask-SQLAlchemy uses the registry engine, not its own pool."""
+    app = create_app("production")
+    with app.app_context():
+        assert db.engine is engines.get()
+    assert engines.get().pool.size() == 10  # type: ignore[attr-defined]
+
+
+def test_registry_reuses_and_replaces_engines(tmp_path: object) -> None:
+    """Test that engines are shared until their options change."""
+    registry = EngineRegistry()
+    url = f"sqlite:///{tmp_path}/registry.db"
+    registry.configure("replica", url=url)
+    engine = registry.get("replica")
+    assert registry.get("replica") is engine
+
+    registry.configure("replica", url=url)
+    assert registry.get("replica") is engine
+
+    registry.configure("replica", url=url, pool_pre_ping=True)
+    assert registry.get("replica") is not engine
+    assert registry.names() == ["replica"]
+
+    with pytest.raises(KeyError):
+        registry.get("missing")
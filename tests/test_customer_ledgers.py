@@ -0,0 +1,225 @@
+"""Tests for the incrementally maintained customer ledgers."""
+
+import uuid
+from contextlib import contextmanager
+from typing import Iterator
+from unittest.mock import patch
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from werkzeug.test import Client
+
+from applepy.cli import make_parser, run_command
+from applepy.domains.customer_ledgers.models import CustomerLedger
+
+
+def _customer(client: Client, credit_limit: str | None = "100.00") -> int:
+    response = client.post(
+        "/customers",
+        json={
+            "customer_name": "Ledger Co",
+            "contact_last_name": "Doe",
+            "contact_first_name": "Jane",
+            "phone": "+1-555-0100",
+            "address_line_1": "1 Ledger St",
+            "city": "Boston",
+            "country": "USA",
+            "credit_limit": credit_limit,
+        },
+    )
+    customer = response.json["data"]  # type: ignore[index]
+    return customer["customer_number"]  # type: ignore[no-any-return]
+
+
+def _order(client: Client, customer_number: int) -> tuple[int, str]:
+    product_line = f"Ledger {uuid.uuid4().hex[:6]}"
+    client.post("/product-lines", json={"product_line": product_line})
+    code = f"L{uuid.uuid4().hex[:8]}"
+    client.post(
+        "/products",
+        json={
+            "product_code": code,
+            "product_name": f"Model {code}",
+            "product_line": product_line,
+            "product_scale": "1:18",
+            "product_vendor": "Ledger Vendor",
+            "product_description": "A model",
+            "quantity_in_stock": 10,
+            "buy_price": "10.00",
+            "msrp": "20.00",
+        },
+    )
+    response = client.post(
+        "/orders",
+        json={
+            "order_date": "2004-01-02",
+            "required_date": "2004-01-09",
+            "status": "In Process",
+            "customer_number": customer_number,
+            "details": [
+                {"product_code": code, "quantity_ordered": 10, "price_each": "4.00"}
+            ],
+        },
+    )
+    order = response.json["data"]  # type: ignore[index]
+    return order["order_number"], code
+
+
+def _payment(customer_number: int, amount: str) -> dict:  # type: ignore[type-arg]
+    return {
+        "customer_number": customer_number,
+        "check_number": f"CHK{uuid.uuid4().hex[:8]}",
+        "payment_date": "2004-01-10",
+        "amount": amount,
+    }
+
+
+def _balance(client: Client, customer_number: int) -> dict:  # type: ignore[type-arg]
+    response = client.get(f"/customers/{customer_number}/balance")
+    assert response.status_code == 200
+    return response.json["data"]  # type: ignore[index,no-any-return]
+
+
+def _amounts(balance: dict) -> tuple[str, ...]:  # type: ignore[type-arg]
+    return (
+        balance["total_ordered"],
+        balance["total_paid"],
+        balance["outstanding"],
+        balance["headroom"],
+    )
+
+
+def test_balance_of_new_customer(client: Client) -> None:
+    """Test zeros for a customer without orders or payments."""
+    customer_number = _customer(client)
+
+    assert _balance(client, customer_number) == {
+        "customer_number": customer_number,
+        "credit_limit": "100.00",
+        "total_ordered": "0.00",
+        "total_paid": "0.00",
+        "outstanding": "0.00",
+        "headroom": "100.00",
+    }
+
+
+def test_order_and_payment_changes_update_balance(client: Client) -> None:
+    """Test that order lines and payments adjust the customer's ledger."""
+    customer_number = _customer(client)
+    order_number, code = _order(client, customer_number)
+    assert _amounts(_balance(client, customer_number)) == (
+        "40.00",
+        "0.00",
+        "40.00",
+        "60.00",
+    )
+
+    payment = _payment(customer_number, "15.00")
+    client.post("/payments", json=payment)
+    assert _amounts(_balance(client, customer_number)) == (
+        "40.00",
+        "15.00",
+        "25.00",
+        "75.00",
+    )
+
+    url = f"/payments/{customer_number}/{payment['check_number']}"
+    client.put(url, json={**payment, "amount": "30.00"})
+    client.put(
+        f"/order-details/{order_number}/{code}",
+        json={
+            "order_number": order_number,
+            "product_code": code,
+            "quantity_ordered": 20,
+            "price_each": "4.00",
+            "order_line_number": 1,
+        },
+    )
+    assert _amounts(_balance(client, customer_number)) == (
+        "80.00",
+        "30.00",
+        "50.00",
+        "50.00",
+    )
+
+    client.delete(url)
+    client.delete(f"/order-details/{order_number}/{code}")
+    assert _amounts(_balance(client, customer_number)) == (
+        "0.00",
+        "0.00",
+        "0.00",
+        "100.00",
+    )
+
+
+def test_moving_order_moves_amount(client: Client) -> None:
+    """Test that changing an order's customer moves its total between ledgers."""
+    first = _customer(client)
+    second = _customer(client)
+    order_number, _ = _order(client, first)
+
+    order = client.get(f"/orders/{order_number}").json["data"]  # type: ignore[index]
+    response = client.put(
+        f"/orders/{order_number}", json={**order, "customer_number": second}
+    )
+    assert response.status_code == 200
+
+    assert _balance(client, first)["total_ordered"] == "0.00"
+    assert _balance(client, second)["total_ordered"] == "40.00"
+
+
+def test_balance_without_credit_limit_and_missing_customer(client: Client) -> None:
+    """Test null headroom without a credit limit and 404 for a missing customer."""
+    customer_number = _customer(client, credit_limit=None)
+    _order(client, customer_number)
+
+    balance = _balance(client, customer_number)
+    assert balance["outstanding"] == "40.00"
+    assert balance["headroom"] is None
+
+    response = client.get("/customers/999999/balance")
+    assert response.status_code == 404
+    assert response.json["error"] == "Customer not found"  # type: ignore[index]
+
+
+def test_balances_listing(client: Client) -> None:
+    """Test that every customer's balance is listed with a version ETag."""
+    customer_number = _customer(client)
+    _order(client, customer_number)
+
+    response = client.get("/customers/balances")
+    assert response.status_code == 200
+    balances = {b["customer_number"]: b for b in response.json["data"]["items"]}  # type: ignore[index]
+    assert balances[customer_number]["outstanding"] == "40.00"
+
+    etag = response.headers["ETag"]
+    cached = client.get("/customers/balances", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+
+def test_rebuild_command(client: Client, db_session: Session) -> None:
+    """Test that the CLI command recomputes ledgers from orders and payments."""
+    customer_number = _customer(client)
+    _order(client, customer_number)
+    client.post("/payments", json=_payment(customer_number, "15.00"))
+    db_session.execute(
+        update(CustomerLedger)
+        .where(CustomerLedger.customer_number == customer_number)
+        .values(total_ordered=0, total_paid=999)
+    )
+
+    args = make_parser().parse_args(["db:rebuild-customer-ledgers"])
+
+    @contextmanager
+    def test_session() -> Iterator[Session]:
+        yield db_session
+
+    with patch("applepy.session.get_session", test_session):
+        assert run_command(args) == 0
+
+    assert _amounts(_balance(client, customer_number)) == (
+        "40.00",
+        "15.00",
+        "25.00",
+        "75.00",
+    )
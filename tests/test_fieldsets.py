@@ -0,0 +1,80 @@
+"""Tests for sparse fieldsets (``?fields=``)."""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from werkzeug.test import Client
+
+from applepy.domains.customers.schemas import CustomerRecord
+from applepy.domains.product_lines.service import ProductLineService
+from applepy.exceptions import ValidationError
+from applepy.fieldsets import parse_fields, partial_schema
+
+
+def test_parse_fields() -> None:
+    """Test that fields are split, stripped and de-duplicated."""
+    assert parse_fields({"fields": "city, phone,city,"}) == ["city", "phone"]
+    assert parse_fields({"fields": ""}) is None
+    assert parse_fields({}) is None
+
+
+def test_partial_schema_unknown_field() -> None:
+    """Test that requesting a field outside the schema raises ValidationError."""
+    with pytest.raises(ValidationError):
+        partial_schema(CustomerRecord, ("customer_number", "password"))
+
+
+def test_partial_schema_is_cached() -> None:
+    """Test that the same fieldset reuses the same generated schema."""
+    fields = ("customer_number", "city")
+    assert partial_schema(CustomerRecord, fields) is partial_schema(
+        CustomerRecord, fields
+    )
+
+
+def test_get_office_with_fields(client: Client, test_office: dict) -> None:  # type: ignore[type-arg]
+    """Test that a single record only returns the requested fields and key."""
+    office_code = test_office["office_code"]
+    response = client.get(f"/offices/{office_code}?fields=city,phone")
+    assert response.status_code == 200
+    assert response.json["data"] == {  # type: ignore[index]
+        "office_code": office_code,
+        "city": test_office["city"],
+        "phone": test_office["phone"],
+    }
+
+
+def test_list_offices_with_fields(client: Client, test_office: dict) -> None:  # type: ignore[type-arg]
+    """Test that every listed record is restricted to the fieldset."""
+    response = client.get("/offices?fields=city")
+    assert response.status_code == 200
+    items = response.json["data"]["items"]  # type: ignore[index]
+    assert items
+    assert all(set(item) == {"office_code", "city"} for item in items)
+
+
+def test_list_unknown_field(client: Client) -> None:
+    """Test that an unknown field returns 400."""
+    response = client.get("/offices?fields=city,bogus")
+    assert response.status_code == 400
+    assert "bogus" in response.json["error"]  # type: ignore[index, operator]
+
+
+def test_fields_are_pushed_into_select(db_session: Session) -> None:
+    """Test that unrequested columns (e.g. the image BLOB) are not selected."""
+    statements: list[str] = []
+
+    def capture(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        ProductLineService(db_session).get_all(["text_description"])
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    select = next(s for s in statements if "FROM product_lines" in s)
+    assert "text_description" in select
+    assert "html_description" not in select
+    assert "image" not in select
@@ -0,0 +1,136 @@
+"""Tests for the list filter and sort grammar."""
+
+import uuid
+
+import pytest
+from werkzeug.test import Client
+
+from applepy.exceptions import ValidationError
+from applepy.filters import Filter, SortKey, parse_filters, parse_sort
+
+
+def _create_office(
+    client: Client, office_code: str, city: str, state: str | None
+) -> None:
+    office_data = {
+        "office_code": office_code,
+        "city": city,
+        "state": state,
+        "country": "USA",
+        "phone": "(617) 555-0100",
+        "address_line_1": "100 Filter Street",
+        "address_line_2": None,
+        "postal_code": "02108",
+        "territory": "1",
+    }
+    response = client.post(
+        "/offices", json=office_data, content_type="application/json"
+    )
+    assert response.status_code == 201
+
+
+@pytest.fixture()
+def offices(client: Client) -> list[str]:
+    """Create offices sharing a unique city so filters can isolate them."""
+    city = f"Filterville{uuid.uuid4().hex[:6]}"
+    codes = []
+    for i, state in enumerate(["MA", None, "NY", "CA", None]):
+        code = f"FL{uuid.uuid4().hex[:4]}{i}"
+        _create_office(client, code, city, state)
+        codes.append(code)
+    return [city, *codes]
+
+
+def test_parse_filters() -> None:
+    """Test parsing of plain and operator filters, skipping reserved params."""
+    items = [
+        ("status", "Shipped"),
+        ("order_date[gte]", "2024-01-01"),
+        ("limit", "10"),
+        ("sort", "-order_date"),
+    ]
+    assert parse_filters(items) == [
+        Filter("status", "eq", "Shipped"),
+        Filter("order_date", "gte", "2024-01-01"),
+    ]
+
+
+def test_parse_filters_unknown_operator() -> None:
+    """Test that an unsupported operator raises ValidationError."""
+    with pytest.raises(ValidationError):
+        parse_filters([("status[regex]", ".*")])
+
+
+def test_parse_sort() -> None:
+    """Test that a leading dash means descending."""
+    assert parse_sort("-order_date, order_number") == [
+        SortKey("order_date", True),
+        SortKey("order_number", False),
+    ]
+    assert parse_sort(None) == []
+
+
+def test_filter_offices_by_city(client: Client, offices: list[str]) -> None:
+    """Test equality filtering is applied in SQL."""
+    city, *codes = offices
+    response = client.get(f"/offices?city={city}")
+    assert response.status_code == 200
+    items = response.json["data"]["items"]  # type: ignore[index]
+    assert sorted(item["office_code"] for item in items) == sorted(codes)
+
+
+def test_filter_operators(client: Client, offices: list[str]) -> None:
+    """Test the in and null operators."""
+    city, *_ = offices
+    response = client.get(f"/offices?city={city}&state[in]=MA,NY")
+    assert {i["state"] for i in response.json["data"]["items"]} == {"MA", "NY"}  # type: ignore[index]
+
+    response = client.get(f"/offices?city={city}&state[null]=true")
+    assert len(response.json["data"]["items"]) == 2  # type: ignore[index]
+
+
+def test_sort_offices_descending(client: Client, offices: list[str]) -> None:
+    """Test that sort=-field orders results descending."""
+    city, *codes = offices
+    response = client.get(f"/offices?city={city}&sort=-office_code")
+    items = response.json["data"]["items"]  # type: ignore[index]
+    assert [item["office_code"] for item in items] == sorted(codes, reverse=True)
+
+
+@pytest.mark.parametrize("sort", ["state", "-state"])
+def test_paginate_with_nullable_sort(
+    client: Client, offices: list[str], sort: str
+) -> None:
+    """Test keyset pagination over a nullable sort key visits every row once."""
+    city, *codes = offices
+    seen: list[str] = []
+    cursor = None
+    while True:
+        url = f"/offices?city={city}&sort={sort}&limit=2"
+        response = client.get(url + (f"&after={cursor}" if cursor else ""))
+        assert response.status_code == 200
+        data = response.json["data"]  # type: ignore[index]
+        seen.extend(item["office_code"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(codes)
+
+
+def test_filter_unknown_field(client: Client) -> None:
+    """Test that filtering on a column that does not exist returns 400."""
+    response = client.get("/offices?password=secret")
+    assert response.status_code == 400
+
+
+def test_filter_not_whitelisted(client: Client) -> None:
+    """Test that columns outside filterable_fields cannot be filtered."""
+    response = client.get("/product-lines?html_description[contains]=x")
+    assert response.status_code == 400
+
+
+def test_filter_invalid_value(client: Client) -> None:
+    """Test that a value that does not fit the column type returns 400."""
+    response = client.get("/customers?credit_limit[gte]=lots")
+    assert response.status_code == 400
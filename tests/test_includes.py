@@ -0,0 +1,199 @@
+"""Tests for embedding related records with ``?include=``."""
+
+import uuid
+
+import pytest
+from sqlalchemy.orm import Session
+from werkzeug.test import Client
+
+from applepy.domains.orders.models import Order
+from applepy.exceptions import ValidationError
+from applepy.includes import loader_options, parse_include, resolve_includes
+from applepy.query_stats import QUERIES_HEADER
+from applepy.repositories.base import has_dependent_rows
+
+
+def _customer(client: Client, sales_rep: int | None = None) -> int:
+    response = client.post(
+        "/customers",
+        json={
+            "customer_name": "Include Co",
+            "contact_last_name": "Doe",
+            "contact_first_name": "Jane",
+            "phone": "+1-555-0100",
+            "address_line_1": "1 Include St",
+            "city": "Boston",
+            "country": "USA",
+            "sales_rep_employee_number": sales_rep,
+        },
+    )
+    return response.json["data"]["customer_number"]  # type: ignore[index, no-any-return]
+
+
+def _products(client: Client, count: int) -> list[str]:
+    product_line = f"Include {uuid.uuid4().hex[:6]}"
+    client.post("/product-lines", json={"product_line": product_line})
+    codes = [f"S{uuid.uuid4().hex[:8]}" for _ in range(count)]
+    for code in codes:
+        client.post(
+            "/products",
+            json={
+                "product_code": code,
+                "product_name": f"Model {code}",
+                "product_line": product_line,
+                "product_scale": "1:18",
+                "product_vendor": "Include Vendor",
+                "product_description": "A model",
+                "quantity_in_stock": 10,
+                "buy_price": "10.00",
+                "msrp": "20.00",
+            },
+        )
+    return codes
+
+
+def _order(client: Client, customer_number: int, products: list[str]) -> int:
+    response = client.post(
+        "/orders",
+        json={
+            "order_date": "2004-01-02",
+            "required_date": "2004-01-09",
+            "status": "In Process",
+            "customer_number": customer_number,
+        },
+    )
+    order_number: int = response.json["data"]["order_number"]  # type: ignore[index]
+    for line, code in enumerate(products, start=1):
+        client.post(
+            "/order-details",
+            json={
+                "order_number": order_number,
+                "product_code": code,
+                "quantity_ordered": line,
+                "price_each": "15.50",
+                "order_line_number": line,
+            },
+        )
+    return order_number
+
+
+def test_parse_and_resolve_includes() -> None:
+    """Test that include paths are parsed and their parents added."""
+    assert parse_include({"include": "details.product, customer,customer"}) == [
+        "details.product",
+        "customer",
+    ]
+    assert parse_include({}) is None
+    allowed = {"customer": object, "details": object, "details.product": object}
+    assert resolve_includes(["details.product"], allowed) == (  # type: ignore[arg-type]
+        "details",
+        "details.product",
+    )
+    with pytest.raises(ValidationError):
+        resolve_includes(["password"], allowed)  # type: ignore[arg-type]
+
+
+def test_loader_options_use_one_chain_per_leaf() -> None:
+    """Test that nested paths share one loader chain."""
+    options = loader_options(Order, ("customer", "details", "details.product"))
+    assert len(options) == 2
+
+
+def test_view_only_relationships_allow_plain_delete() -> None:
+    """Test that Order.details does not force deletes through the session."""
+    assert not has_dependent_rows(Order)
+
+
+def test_get_order_with_includes(
+    client: Client,
+    db_session: Session,
+    test_office: dict,  # type: ignore[type-arg]
+) -> None:
+    """Test that the customer, sales rep, lines and products are embedded."""
+    response = client.post(
+        "/employees",
+        json={
+            "first_name": "Ann",
+            "last_name": "Rep",
+            "email": "ann@example.com",
+            "job_title": "Sales Rep",
+            "office_code": test_office["office_code"],
+        },
+    )
+    employee = response.json["data"]  # type: ignore[index]
+    customer_number = _customer(client, employee["employee_number"])
+    products = _products(client, 2)
+    order_number = _order(client, customer_number, products)
+    db_session.expire_all()
+
+    response = client.get(
+        f"/orders/{order_number}?include=customer.sales_rep,details.product"
+    )
+    assert response.status_code == 200
+    order = response.json["data"]  # type: ignore[index]
+    assert order["customer"]["customer_number"] == customer_number
+    sales_rep = order["customer"]["sales_rep"]
+    assert sales_rep["employee_number"] == employee["employee_number"]
+    assert [d["product_code"] for d in order["details"]] == products
+    assert order["details"][0]["product"]["product_code"] == products[0]
+    assert order["details"][0]["price_each"] == "15.50"
+
+    plain = client.get(f"/orders/{order_number}").json["data"]  # type: ignore[index]
+    assert "customer" not in plain
+    assert "details" not in plain
+
+
+def test_list_includes_do_not_scale_with_rows(
+    client: Client, db_session: Session
+) -> None:
+    """Test that a listing with includes runs the same queries for 1 or 3 orders."""
+    customer_number = _customer(client)
+    products = _products(client, 2)
+    url = f"/orders?customer_number={customer_number}&include=customer,details.product"
+
+    _order(client, customer_number, products)
+    db_session.expire_all()
+    one = client.get(url)
+    assert len(one.json["data"]["items"]) == 1  # type: ignore[index]
+
+    _order(client, customer_number, products)
+    _order(client, customer_number, products)
+    db_session.expire_all()
+    three = client.get(url)
+    items = three.json["data"]["items"]  # type: ignore[index]
+    assert len(items) == 3
+    assert all(len(item["details"]) == 2 for item in items)
+    assert three.headers[QUERIES_HEADER] == one.headers[QUERIES_HEADER]
+
+
+def test_include_with_fields_and_pages(client: Client) -> None:
+    """Test that includes combine with sparse fieldsets and pagination."""
+    customer_number = _customer(client)
+    _order(client, customer_number, [])
+    response = client.get(
+        f"/orders?customer_number={customer_number}"
+        "&fields=status&include=customer&limit=10"
+    )
+    assert response.status_code == 200
+    item = response.json["data"]["items"][0]  # type: ignore[index]
+    assert set(item) == {"order_number", "status", "customer"}
+    assert item["customer"]["customer_number"] == customer_number
+
+
+def test_unknown_include(client: Client) -> None:
+    """Test that an include outside the whitelist returns 400."""
+    assert client.get("/orders?include=payments").status_code == 400
+    assert client.get("/offices?include=employees").status_code == 400
+
+
+def test_list_etag_changes_with_included_table(client: Client) -> None:
+    """Test that writing an included table changes the listing's ETag."""
+    customer_number = _customer(client)
+    _order(client, customer_number, [])
+    url = f"/orders?customer_number={customer_number}&include=customer"
+    etag = client.get(url).headers["ETag"]
+    assert client.get(url).headers["ETag"] == etag
+
+    customer = client.get(f"/customers/{customer_number}").json["data"]  # type: ignore[index]
+    client.put(f"/customers/{customer_number}", json={**customer, "city": "Lyon"})
+    assert client.get(url).headers["ETag"] != etag
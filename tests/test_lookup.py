@@ -0,0 +1,68 @@
+"""Tests for primary-key lookups and the pre-built statement cache."""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from applepy.domains.employees.repository import EmployeeRepository
+from applepy.domains.offices.repository import OfficeRepository
+from applepy.domains.offices.schemas import OfficeCreate
+from applepy.exceptions import NotFoundException
+
+
+def _create_office(session: Session, office_code: str) -> None:
+    OfficeRepository(session).create(
+        OfficeCreate(
+            office_code=office_code,
+            city="Lookup City",
+            state=None,
+            country="USA",
+            phone="(617) 555-0100",
+            address_line_1="1 Lookup Street",
+            address_line_2=None,
+            postal_code="02108",
+            territory="NA",
+        )
+    )
+
+
+def test_repeated_get_uses_identity_map(db_session: Session) -> None:
+    """Test that a second lookup of the same key issues no SQL."""
+    _create_office(db_session, "LK1")
+    db_session.expunge_all()
+    repo = OfficeRepository(db_session)
+
+    statements: list[str] = []
+
+    def capture(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        first = repo.get("LK1")
+        second = repo.get("LK1")
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    assert first is second
+    assert len(statements) == 1
+
+
+def test_get_statement_is_cached(db_session: Session) -> None:
+    """Test that the same fieldset reuses one pre-built statement."""
+    repo = OfficeRepository(db_session)
+    other = OfficeRepository(db_session)
+
+    assert repo._get_statement(None) is other._get_statement(None)
+    assert repo._get_statement(["city"]) is other._get_statement(["city"])
+    assert repo._get_statement(["city"]) is not repo._get_statement(None)
+
+
+def test_get_coerces_key(db_session: Session) -> None:
+    """Test that string IDs from the URL match integer keys."""
+    repo = EmployeeRepository(db_session)
+    with pytest.raises(NotFoundException):
+        repo.get("not-a-number")  # type: ignore[arg-type]
+    with pytest.raises(NotFoundException):
+        repo.get("999999")  # type: ignore[arg-type]
@@ -0,0 +1,241 @@
+"""Tests for the metrics registry and connection pool instrumentation."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from flask import Flask
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from werkzeug.test import Client
+
+from applepy.db import (
+    POOL_CHECKOUT_TIMEOUTS,
+    POOL_CHECKOUT_WAIT,
+    POOL_CONNECTION_HELD,
+    POOL_CONNECTION_LIFETIME,
+    POOL_CONNECTIONS_OPENED,
+    POOL_IN_USE,
+    POOL_IN_USE_PEAK,
+    POOL_INVALIDATIONS,
+    POOL_OVERFLOW,
+    POOL_PRE_PING_FAILURES,
+    EngineRegistry,
+    InstrumentedQueuePool,
+)
+from applepy.http_metrics import (
+    REQUEST_LATENCY,
+    REQUESTS,
+    RESPONSE_SIZE,
+    UNMATCHED_ENDPOINT,
+)
+from applepy.metrics import MetricsRegistry
+from applepy.routes.metrics import PROMETHEUS_CONTENT_TYPE
+
+
+def test_counter_gauge_and_histogram() -> None:
+    """Test recording values per label set."""
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests", ["method"])
+    counter.inc(method="GET")
+    counter.inc(2, method="GET")
+    assert counter.value(method="GET") == 3
+    assert counter.value(method="POST") == 0
+
+    gauge = registry.gauge("in_flight", "In flight")
+    gauge.inc()
+    gauge.set_max(5)
+    gauge.set_max(2)
+    assert gauge.value() == 5
+    gauge.set_function(lambda: 7.0)
+    assert gauge.value() == 7
+
+    histogram = registry.histogram("latency", "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value)
+    observed = histogram.value()
+    assert observed is not None
+    assert observed.count == 3
+    assert observed.sum == pytest.approx(5.55)
+    assert observed.cumulative()[:2] == [(0.1, 1), (1.0, 2)]
+
+
+def test_registry_validation() -> None:
+    """Test that labels must match and names keep their type."""
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "Hits", ["route"])
+    assert registry.counter("hits_total", "Hits", ["route"]) is counter
+
+    with pytest.raises(ValueError):
+        counter.inc(path="/")
+    with pytest.raises(ValueError):
+        registry.gauge("hits_total", "Hits")
+
+
+def test_snapshot() -> None:
+    """Test the JSON form of the registry."""
+    registry = MetricsRegistry()
+    registry.counter("hits_total", "Hits", ["route"]).inc(route="/")
+    registry.histogram("wait", "Wait", buckets=(1.0,)).observe(0.5)
+
+    snapshot = registry.snapshot()
+    assert snapshot["hits_total"] == {
+        "type": "counter",
+        "help": "Hits",
+        "values": [{"labels": {"route": "/"}, "value": 1.0}],
+    }
+    assert snapshot["wait"]["values"] == [
+        {"labels": {}, "count": 1, "sum": 0.5, "buckets": {"1.0": 1, "+Inf": 1}}
+    ]
+
+
+def test_render_prometheus() -> None:
+    """Test the Prometheus text exposition format."""
+    registry = MetricsRegistry()
+    registry.counter("hits_total", "Hits", ["route"]).inc(route='/a"b')
+    registry.histogram("wait_seconds", "Wait", buckets=(1.0,)).observe(0.5)
+
+    assert registry.render_prometheus() == (
+        "# HELP hits_total Hits\n"
+        "# TYPE hits_total counter\n"
+        'hits_total{route="/a\\"b"} 1.0\n'
+        "# HELP wait_seconds Wait\n"
+        "# TYPE wait_seconds histogram\n"
+        'wait_seconds_bucket{le="1.0"} 1\n'
+        'wait_seconds_bucket{le="+Inf"} 1\n'
+        "wait_seconds_sum 0.5\n"
+        "wait_seconds_count 1\n"
+    )
+
+
+def _histogram_count(histogram: Any, **labels: str) -> int:
+    value = histogram.value(**labels)
+    return value.count if value else 0
+
+
+def test_pool_metrics(tmp_path: Path) -> None:
+    """Test checkout, wait, timeout, hold and lifetime metrics for a pool."""
+    name = "metrics-pool"
+    registry = EngineRegistry()
+    registry.configure(
+        name,
+        url=f"sqlite:///{tmp_path}/pool.db",
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    engine = registry.get(name)
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+
+    opened = POOL_CONNECTIONS_OPENED.value(engine=name)
+    waits = _histogram_count(POOL_CHECKOUT_WAIT, engine=name)
+    held = _histogram_count(POOL_CONNECTION_HELD, engine=name)
+    lifetimes = _histogram_count(POOL_CONNECTION_LIFETIME, engine=name)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert POOL_IN_USE.value(engine=name) == 1
+        assert POOL_IN_USE_PEAK.value(engine=name) == 1
+        assert POOL_OVERFLOW.value(engine=name) == 0
+
+        # The only connection is checked out, so a second checkout times out
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+        assert POOL_CHECKOUT_TIMEOUTS.value(engine=name) == 1
+
+    assert POOL_IN_USE.value(engine=name) == 0
+    assert POOL_CONNECTIONS_OPENED.value(engine=name) == opened + 1
+    assert _histogram_count(POOL_CHECKOUT_WAIT, engine=name) == waits + 2
+    assert _histogram_count(POOL_CONNECTION_HELD, engine=name) == held + 1
+
+    # Disposing closes the pooled connection, ending its lifetime; the
+    # recreated pool keeps reporting under the same name
+    engine.dispose()
+    assert _histogram_count(POOL_CONNECTION_LIFETIME, engine=name) == lifetimes + 1
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    assert engine.pool.metrics_name == name
+
+
+def test_pool_metrics_count_pre_ping_failures(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a failed pre-ping counts as an invalidation and a failure."""
+    name = "metrics-ping"
+    registry = EngineRegistry()
+    registry.configure(name, url=f"sqlite:///{tmp_path}/ping.db", pre_ping_interval=0.0)
+    engine = registry.get(name)
+    with engine.connect():
+        pass
+
+    def fail_ping(dbapi_connection: Any) -> bool:
+        raise RuntimeError("server has gone away")
+
+    monkeypatch.setattr(engine.dialect, "do_ping", fail_ping)
+    failures = POOL_PRE_PING_FAILURES.value(engine=name)
+    invalidations = POOL_INVALIDATIONS.value(engine=name)
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT 1")).scalar() == 1
+
+    assert POOL_PRE_PING_FAILURES.value(engine=name) == failures + 1
+    assert POOL_INVALIDATIONS.value(engine=name) == invalidations + 1
+
+
+def test_metrics_endpoint(app: Flask) -> None:
+    """Test that /_metrics returns the registry as JSON."""
+    response = app.test_client().get("/_metrics")
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["db_pool_checkout_wait_seconds"]["type"] == "histogram"
+    assert body["db_pool_in_use"]["type"] == "gauge"
+
+
+def test_http_metrics(client: Client, test_office: dict) -> None:  # type: ignore[type-arg]
+    """Test latency, size and status metrics keyed by endpoint."""
+    labels = {"endpoint": "office.get", "method": "GET"}
+    latencies = _histogram_count(REQUEST_LATENCY, **labels)
+    sizes = _histogram_count(RESPONSE_SIZE, **labels)
+    ok = REQUESTS.value(**labels, status="200")
+    not_found = REQUESTS.value(**labels, status="404")
+    unmatched = REQUESTS.value(endpoint=UNMATCHED_ENDPOINT, method="GET", status="404")
+
+    client.get(f"/offices/{test_office['office_code']}")
+    client.get("/offices/missing")
+    client.get("/no-such-route")
+
+    assert _histogram_count(REQUEST_LATENCY, **labels) == latencies + 2
+    assert _histogram_count(RESPONSE_SIZE, **labels) == sizes + 2
+    assert REQUESTS.value(**labels, status="200") == ok + 1
+    assert REQUESTS.value(**labels, status="404") == not_found + 1
+    assert (
+        REQUESTS.value(endpoint=UNMATCHED_ENDPOINT, method="GET", status="404")
+        == unmatched + 1
+    )
+
+
+def test_http_metrics_count_streamed_requests_once(client: Client) -> None:
+    """Test that an NDJSON response is recorded once, like a JSON one."""
+    labels = {"endpoint": "office.list", "method": "GET"}
+    latencies = _histogram_count(REQUEST_LATENCY, **labels)
+    ok = REQUESTS.value(**labels, status="200")
+
+    streamed = client.get("/offices", headers={"Accept": "application/x-ndjson"})
+    streamed.get_data()
+    streamed.close()
+    client.get("/offices")
+
+    assert _histogram_count(REQUEST_LATENCY, **labels) == latencies + 2
+    assert REQUESTS.value(**labels, status="200") == ok + 2
+
+
+def test_prometheus_endpoint(client: Client) -> None:
+    """Test that /metrics serves the registry as Prometheus text."""
+    client.get("/")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == PROMETHEUS_CONTENT_TYPE
+    body = response.get_data(as_text=True)
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert (
+        'http_requests_total{endpoint="hello_world",method="GET",status="200"}' in body
+    )
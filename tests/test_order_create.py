@@ -0,0 +1,118 @@
+"""Tests for creating an order together with its lines."""
+
+import uuid
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from werkzeug.test import Client
+
+
+def _setup(client: Client, product_count: int) -> tuple[int, list[str]]:
+    response = client.post(
+        "/customers",
+        json={
+            "customer_name": "Nested Co",
+            "contact_last_name": "Doe",
+            "contact_first_name": "Jane",
+            "phone": "+1-555-0100",
+            "address_line_1": "1 Nested St",
+            "city": "Boston",
+            "country": "USA",
+        },
+    )
+    customer = response.json["data"]  # type: ignore[index]
+    product_line = f"Nested {uuid.uuid4().hex[:6]}"
+    client.post("/product-lines", json={"product_line": product_line})
+    codes = [f"N{uuid.uuid4().hex[:8]}" for _ in range(product_count)]
+    for code in codes:
+        client.post(
+            "/products",
+            json={
+                "product_code": code,
+                "product_name": f"Model {code}",
+                "product_line": product_line,
+                "product_scale": "1:18",
+                "product_vendor": "Nested Vendor",
+                "product_description": "A model",
+                "quantity_in_stock": 10,
+                "buy_price": "10.00",
+                "msrp": "20.00",
+            },
+        )
+    return customer["customer_number"], codes
+
+
+def _order(customer_number: int, codes: list[str]) -> dict:  # type: ignore[type-arg]
+    return {
+        "order_date": "2004-01-02",
+        "required_date": "2004-01-09",
+        "status": "In Process",
+        "customer_number": customer_number,
+        "details": [
+            {"product_code": code, "quantity_ordered": 10 + i, "price_each": "19.99"}
+            for i, code in enumerate(codes)
+        ],
+    }
+
+
+def test_create_order_with_details(client: Client, db_session: Session) -> None:
+    """Test that the order, its lines and its totals take one INSERT each."""
+    customer_number, codes = _setup(client, 3)
+
+    inserts: list[str] = []
+
+    def capture(*args: object) -> None:
+        if str(args[2]).startswith("INSERT INTO order"):
+            inserts.append(str(args[2]))
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        response = client.post("/orders", json=_order(customer_number, codes))
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    assert response.status_code == 201
+    order = response.json["data"]  # type: ignore[index]
+    assert [line["order_line_number"] for line in order["details"]] == [1, 2, 3]
+    assert all(
+        line["order_number"] == order["order_number"] for line in order["details"]
+    )
+    assert [s.split("(")[0].strip() for s in inserts] == [
+        "INSERT INTO orders",
+        "INSERT INTO order_details",
+        "INSERT INTO order_totals",
+    ]
+
+    response = client.get(f"/orders/{order['order_number']}/details")
+    stored = sorted(response.json, key=lambda line: line["order_line_number"])  # type: ignore[arg-type]
+    assert [line["product_code"] for line in stored] == codes
+    assert stored[2]["quantity_ordered"] == 12
+
+
+def test_create_order_without_details(client: Client) -> None:
+    """Test that orders without lines are created as before."""
+    customer_number, _ = _setup(client, 0)
+    payload = _order(customer_number, [])
+    del payload["details"]
+    response = client.post("/orders", json=payload)
+    assert response.status_code == 201
+    assert "details" not in response.json["data"]  # type: ignore[index]
+
+
+def test_create_order_with_duplicate_product_writes_nothing(client: Client) -> None:
+    """Test that two lines for one product are rejected before any write."""
+    customer_number, codes = _setup(client, 1)
+    payload = _order(customer_number, [*codes, codes[0]])
+    response = client.post("/orders", json=payload)
+    assert response.status_code != 201
+
+    listed = client.get(f"/orders?customer_number={customer_number}").json
+    assert listed["data"]["items"] == []  # type: ignore[index]
+
+
+def test_bulk_create_rejects_details(client: Client) -> None:
+    """Test that nested lines are refused by the bulk endpoint."""
+    customer_number, codes = _setup(client, 1)
+    response = client.post("/orders/bulk", json=[_order(customer_number, codes)])
+    assert response.status_code == 400
@@ -0,0 +1,197 @@
+"""Tests for the incrementally maintained order totals."""
+
+import uuid
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from werkzeug.test import Client
+
+from applepy.cli import make_parser, run_command
+from applepy.domains.order_details.schemas import OrderDetailRecord
+from applepy.domains.order_details.service import OrderDetailService
+from applepy.domains.order_totals.models import OrderTotal
+from applepy.exceptions import NotFoundException
+
+
+def _order_with_lines(client: Client, product_count: int) -> tuple[int, list[str]]:
+    response = client.post(
+        "/customers",
+        json={
+            "customer_name": "Totals Co",
+            "contact_last_name": "Doe",
+            "contact_first_name": "Jane",
+            "phone": "+1-555-0100",
+            "address_line_1": "1 Totals St",
+            "city": "Boston",
+            "country": "USA",
+        },
+    )
+    customer = response.json["data"]  # type: ignore[index]
+    product_line = f"Totals {uuid.uuid4().hex[:6]}"
+    client.post("/product-lines", json={"product_line": product_line})
+    codes = [f"T{uuid.uuid4().hex[:8]}" for _ in range(product_count)]
+    for code in codes:
+        client.post(
+            "/products",
+            json={
+                "product_code": code,
+                "product_name": f"Model {code}",
+                "product_line": product_line,
+                "product_scale": "1:18",
+                "product_vendor": "Totals Vendor",
+                "product_description": "A model",
+                "quantity_in_stock": 10,
+                "buy_price": "10.00",
+                "msrp": "20.00",
+            },
+        )
+    response = client.post(
+        "/orders",
+        json={
+            "order_date": "2004-01-02",
+            "required_date": "2004-01-09",
+            "status": "In Process",
+            "customer_number": customer["customer_number"],
+            "details": [
+                {"product_code": code, "quantity_ordered": 10, "price_each": "2.50"}
+                for code in codes[:-1]
+            ],
+        },
+    )
+    order = response.json["data"]  # type: ignore[index]
+    return order["order_number"], codes
+
+
+def _summary(client: Client, order_number: int) -> dict:  # type: ignore[type-arg]
+    response = client.get(f"/orders/{order_number}/summary")
+    assert response.status_code == 200
+    return response.json["data"]  # type: ignore[index,no-any-return]
+
+
+def test_summary_of_created_order(client: Client) -> None:
+    """Test that lines created with the order are counted."""
+    order_number, _ = _order_with_lines(client, 3)
+
+    assert _summary(client, order_number) == {
+        "line_count": 2,
+        "item_count": 20,
+        "total_amount": "50.00",
+        "order_number": order_number,
+    }
+
+
+def test_line_changes_update_summary(client: Client, db_session: Session) -> None:
+    """Test that creating, updating and deleting lines adjusts the totals."""
+    order_number, codes = _order_with_lines(client, 3)
+    line = {
+        "order_number": order_number,
+        "product_code": codes[-1],
+        "quantity_ordered": 4,
+        "price_each": "10.00",
+        "order_line_number": 3,
+    }
+
+    client.post("/order-details", json=line)
+    summary = _summary(client, order_number)
+    assert (summary["line_count"], summary["item_count"]) == (3, 24)
+    assert summary["total_amount"] == "90.00"
+
+    url = f"/order-details/{order_number}/{codes[-1]}"
+    client.put(url, json={**line, "quantity_ordered": 6, "price_each": "5.00"})
+    summary = _summary(client, order_number)
+    assert (summary["line_count"], summary["item_count"]) == (3, 26)
+    assert summary["total_amount"] == "80.00"
+
+    # A partial update (as made by OrderDetailService callers) takes the
+    # stored price
+    OrderDetailService(db_session).update(
+        OrderDetailRecord.model_construct(
+            order_number=order_number, product_code=codes[-1], quantity_ordered=2
+        )
+    )
+    summary = _summary(client, order_number)
+    assert (summary["item_count"], summary["total_amount"]) == (22, "60.00")
+
+    client.delete(url)
+    summary = _summary(client, order_number)
+    assert (summary["line_count"], summary["item_count"]) == (2, 20)
+    assert summary["total_amount"] == "50.00"
+
+
+def test_failed_line_change_keeps_totals(client: Client, db_session: Session) -> None:
+    """Test that writes to a missing line raise and leave the totals alone."""
+    order_number, codes = _order_with_lines(client, 3)
+    service = OrderDetailService(db_session)
+
+    with pytest.raises(NotFoundException):
+        service.delete(order_number, codes[-1])
+    with pytest.raises(NotFoundException):
+        service.update(
+            OrderDetailRecord(
+                order_number=order_number,
+                product_code=codes[-1],
+                quantity_ordered=1,
+                price_each=Decimal("1.00"),
+                order_line_number=3,
+            )
+        )
+    assert _summary(client, order_number)["item_count"] == 20
+
+
+def test_summary_without_lines_and_missing_order(client: Client) -> None:
+    """Test zeros for an order without lines and 404 for a missing order."""
+    order_number, _ = _order_with_lines(client, 1)
+
+    summary = _summary(client, order_number)
+    assert (summary["line_count"], summary["item_count"]) == (0, 0)
+    assert summary["total_amount"] == "0.00"
+
+    response = client.get("/orders/999999/summary")
+    assert response.status_code == 404
+    assert response.json["error"] == "Order not found"  # type: ignore[index]
+
+
+def test_include_totals(client: Client, db_session: Session) -> None:
+    """Test that an order can embed its totals."""
+    order_number, _ = _order_with_lines(client, 3)
+    db_session.expire_all()
+
+    response = client.get(f"/orders/{order_number}?include=totals")
+
+    assert response.status_code == 200
+    assert response.json["data"]["totals"] == {  # type: ignore[index]
+        "line_count": 2,
+        "item_count": 20,
+        "total_amount": "50.00",
+    }
+
+
+def test_rebuild_command(client: Client, db_session: Session) -> None:
+    """Test that the CLI command recomputes totals from the lines."""
+    order_number, _ = _order_with_lines(client, 3)
+    db_session.execute(
+        update(OrderTotal)
+        .where(OrderTotal.order_number == order_number)
+        .values(line_count=99, item_count=0, total_amount=0)
+    )
+
+    args = make_parser().parse_args(["db:rebuild-order-totals"])
+
+    @contextmanager
+    def test_session() -> Iterator[Session]:
+        yield db_session
+
+    with patch("applepy.session.get_session", test_session):
+        assert run_command(args) == 0
+
+    assert _summary(client, order_number) == {
+        "line_count": 2,
+        "item_count": 20,
+        "total_amount": "50.00",
+        "order_number": order_number,
+    }
@@ -0,0 +1,86 @@
+"""Tests for keyset pagination of list endpoints."""
+
+import uuid
+
+import pytest
+from werkzeug.test import Client
+
+from applepy.exceptions import ValidationError
+from applepy.pagination import decode_cursor, encode_cursor, parse_page_args
+
+
+def _create_office(client: Client, office_code: str) -> None:
+    office_data = {
+        "office_code": office_code,
+        "city": "Page City",
+        "state": "MA",
+        "country": "USA",
+        "phone": "(617) 555-0100",
+        "address_line_1": "100 Page Street",
+        "address_line_2": None,
+        "postal_code": "02108",
+        "territory": "1",
+    }
+    response = client.post(
+        "/offices", json=office_data, content_type="application/json"
+    )
+    assert response.status_code == 201
+
+
+def test_cursor_round_trip() -> None:
+    """Test that cursors decode back to the position they were built from."""
+    assert decode_cursor(encode_cursor(["NYC"])) == ["NYC"]
+    assert decode_cursor(encode_cursor(["2024-01-15", 103])) == ["2024-01-15", 103]
+
+
+def test_decode_invalid_cursor() -> None:
+    """Test that a malformed cursor raises ValidationError."""
+    with pytest.raises(ValidationError):
+        decode_cursor("not-a-cursor!")
+
+
+def test_parse_page_args_defaults() -> None:
+    """Test that limit falls back to the default and after to None."""
+    assert parse_page_args({}, default_limit=25) == (25, None)
+
+
+def test_paginate_offices(client: Client) -> None:
+    """Test walking every page of offices with a small page size."""
+    prefix = f"PG{uuid.uuid4().hex[:4]}"
+    created = [f"{prefix}{i}" for i in range(3)]
+    for office_code in created:
+        _create_office(client, office_code)
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        url = "/offices?limit=2" + (f"&after={cursor}" if cursor else "")
+        response = client.get(url)
+        assert response.status_code == 200
+        data = response.json["data"]  # type: ignore[index]
+        assert data["page_size"] == 2
+        assert data["count"] == len(data["items"]) <= 2
+        seen.extend(item["office_code"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen))
+    assert set(created) <= set(seen)
+
+
+def test_paginate_invalid_limit(client: Client) -> None:
+    """Test that an out-of-range limit returns 400."""
+    response = client.get("/offices?limit=0")
+    assert response.status_code == 400
+    assert "error" in response.json  # type: ignore[operator]
+
+    response = client.get("/offices?limit=abc")
+    assert response.status_code == 400
+
+
+def test_paginate_invalid_cursor(client: Client) -> None:
+    """Test that a malformed cursor returns 400."""
+    response = client.get("/offices?after=%%%")
+    assert response.status_code == 400
+    assert "cursor" in response.json["error"]  # type: ignore[index, operator]
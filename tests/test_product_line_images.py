@@ -0,0 +1,190 @@
+"""Tests for the product line image endpoints."""
+
+import hashlib
+import uuid
+
+from sqlalchemy import delete, event, update
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+from werkzeug.test import Client
+
+from applepy.db import engines
+from applepy.domains.product_lines.models import ProductLine
+from applepy.domains.product_lines.service import ProductLineService
+from applepy.flask import app
+from applepy.session import get_session
+
+IMAGE = bytes(range(256)) * 4
+
+
+def _product_line(client: Client) -> str:
+    product_line = f"Images {uuid.uuid4().hex[:6]}"
+    client.post("/product-lines", json={"product_line": product_line})
+    return product_line
+
+
+def _upload(client: Client, product_line: str) -> str:
+    response = client.put(
+        f"/product-lines/{product_line}/image",
+        data=IMAGE,
+        content_type="image/png",
+    )
+    assert response.status_code == 200
+    return response.headers["ETag"]
+
+
+def test_upload_and_download_image(client: Client) -> None:
+    """Test that an uploaded image is returned with its type and hash ETag."""
+    product_line = _product_line(client)
+    etag = _upload(client, product_line)
+    assert etag == f'"{hashlib.sha256(IMAGE).hexdigest()}"'
+
+    response = client.get(f"/product-lines/{product_line}/image")
+    assert response.status_code == 200
+    assert response.data == IMAGE
+    assert response.mimetype == "image/png"
+    assert response.headers["ETag"] == etag
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert response.content_length == len(IMAGE)
+
+
+def test_image_range_request(client: Client) -> None:
+    """Test that a single byte range is served as partial content."""
+    product_line = _product_line(client)
+    _upload(client, product_line)
+
+    response = client.get(
+        f"/product-lines/{product_line}/image", headers={"Range": "bytes=10-19"}
+    )
+    assert response.status_code == 206
+    assert response.data == IMAGE[10:20]
+    assert response.headers["Content-Range"] == f"bytes 10-19/{len(IMAGE)}"
+
+    response = client.get(
+        f"/product-lines/{product_line}/image", headers={"Range": "bytes=-5"}
+    )
+    assert response.status_code == 206
+    assert response.data == IMAGE[-5:]
+
+
+def test_image_range_not_satisfiable(client: Client) -> None:
+    """Test that a range beyond the image returns 416."""
+    product_line = _product_line(client)
+    _upload(client, product_line)
+
+    response = client.get(
+        f"/product-lines/{product_line}/image",
+        headers={"Range": f"bytes={len(IMAGE)}-"},
+    )
+    assert response.status_code == 416
+    assert response.headers["Content-Range"] == f"bytes */{len(IMAGE)}"
+
+
+def test_image_stale_if_range_returns_full_image(client: Client) -> None:
+    """Test that a range is ignored when If-Range names another version."""
+    product_line = _product_line(client)
+    _upload(client, product_line)
+
+    response = client.get(
+        f"/product-lines/{product_line}/image",
+        headers={"Range": "bytes=0-9", "If-Range": '"stale"'},
+    )
+    assert response.status_code == 200
+    assert response.data == IMAGE
+
+
+def test_image_not_modified(client: Client) -> None:
+    """Test that a matching If-None-Match returns 304."""
+    product_line = _product_line(client)
+    etag = _upload(client, product_line)
+
+    response = client.get(
+        f"/product-lines/{product_line}/image", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.data == b""
+
+
+def test_image_without_stored_hash(client: Client, db_session: Session) -> None:
+    """Test that an image stored without its hash still gets a hash ETag."""
+    product_line = _product_line(client)
+    etag = _upload(client, product_line)
+    db_session.execute(
+        update(ProductLine)
+        .where(ProductLine.product_line == product_line)
+        .values(image_hash=None)
+    )
+
+    response = client.get(f"/product-lines/{product_line}/image")
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag
+
+
+def test_image_stream_returns_connection_to_pool() -> None:
+    """Test that a streamed image checks its connection back in.
+
+    Uses the real sessions rather than the patched ones of the client fixture,
+    so the product line is committed and deleted afterwards.
+    """
+    pool = engines.get().pool
+    assert isinstance(pool, QueuePool)
+    product_line = f"Images {uuid.uuid4().hex[:6]}"
+    with get_session() as session:
+        session.add(ProductLine(product_line=product_line))
+        session.flush()
+        ProductLineService(session).set_image(product_line, IMAGE, "image/png")
+        session.commit()
+    try:
+        response = app.test_client().get(f"/product-lines/{product_line}/image")
+        assert response.status_code == 200
+        assert response.get_data() == IMAGE
+        response.close()
+
+        assert pool.checkedout() == 0
+    finally:
+        with get_session() as session:
+            session.execute(
+                delete(ProductLine).where(ProductLine.product_line == product_line)
+            )
+            session.commit()
+
+
+def test_image_not_found(client: Client) -> None:
+    """Test 404 for a missing product line or a product line without image."""
+    assert client.get("/product-lines/Nonexistent/image").status_code == 404
+    product_line = _product_line(client)
+    assert client.get(f"/product-lines/{product_line}/image").status_code == 404
+    response = client.put("/product-lines/Nonexistent/image", data=b"x")
+    assert response.status_code == 404
+
+
+def test_upload_requires_body(client: Client) -> None:
+    """Test that an empty upload returns 400."""
+    product_line = _product_line(client)
+    response = client.put(f"/product-lines/{product_line}/image", data=b"")
+    assert response.status_code == 400
+
+
+def test_listing_does_not_load_images(client: Client, db_session: Session) -> None:
+    """Test that loading product lines leaves the image column unread."""
+    product_line = _product_line(client)
+    _upload(client, product_line)
+
+    statements: list[str] = []
+
+    def capture(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        ProductLineService(db_session).get_all()
+        db_session.get(ProductLine, product_line, populate_existing=True)
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    selects = [s for s in statements if "FROM product_lines" in s]
+    assert selects
+    assert not any(
+        "product_lines.image," in s or "product_lines.image " in s for s in selects
+    )
@@ -0,0 +1,84 @@
+"""Tests for per-request query statistics, slow queries and N+1 detection."""
+
+import logging
+
+import pytest
+from flask import Flask, Response
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from werkzeug.test import Client
+
+from applepy.query_stats import (
+    QUERIES_HEADER,
+    TIME_HEADER,
+    current_stats,
+    monitor,
+    redact_parameters,
+)
+
+
+def test_query_headers(client: Client, test_office: dict) -> None:  # type: ignore[type-arg]
+    """Test that responses report the request's statement count and time."""
+    response = client.get(f"/offices/{test_office['office_code']}")
+    assert int(response.headers[QUERIES_HEADER]) == 1
+    assert float(response.headers[TIME_HEADER]) >= 0
+
+    response = client.get("/")
+    assert response.headers[QUERIES_HEADER] == "0"
+
+
+def test_redact_parameters() -> None:
+    """Test that values are replaced by their types, keeping the shape."""
+    assert redact_parameters({"code": "7", "limit": 10}) == {
+        "code": "<str>",
+        "limit": "<int>",
+    }
+    assert redact_parameters([("a", 1), ("b", None)]) == [
+        ["<str>", "<int>"],
+        ["<str>", "<NoneType>"],
+    ]
+
+
+def test_slow_query_log(
+    client: Client,
+    test_office: dict,  # type: ignore[type-arg]
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that slow statements are logged without their parameter values."""
+    monkeypatch.setattr(monitor, "slow_query_ms", 0.0)
+    with caplog.at_level(logging.WARNING, logger="applepy.query_stats"):
+        client.get(f"/offices/{test_office['office_code']}")
+
+    slow = [r for r in caplog.records if r.getMessage().startswith("Slow query")]
+    assert len(slow) == 1
+    parameters = str(slow[0].__dict__["db_parameters"])
+    assert slow[0].__dict__["endpoint"] == "office.get"
+    assert "<str>" in parameters
+    assert test_office["office_code"] not in parameters
+
+
+def test_n_plus_one_warning(
+    app: Flask,
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that a statement repeated within a request is flagged."""
+    monkeypatch.setattr(monitor, "n_plus_one_threshold", 3)
+    statement = text("SELECT city FROM offices WHERE office_code = :code")
+
+    with app.test_request_context("/offices"):
+        monitor.start_request()
+        for code in ("1", "2", "3"):
+            db_session.execute(statement, {"code": code})
+        stats = current_stats()
+        assert stats is not None
+        assert stats.repeated(3) == [(str(statement).replace(":code", "?"), 3)]
+
+        with caplog.at_level(logging.WARNING, logger="applepy.query_stats"):
+            monitor.finish_request(Response())
+
+    warnings = [r for r in caplog.records if "N+1" in r.getMessage()]
+    assert len(warnings) == 1
+    assert warnings[0].__dict__["db_repeats"] == 3
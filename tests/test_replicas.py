@@ -0,0 +1,115 @@
+"""Tests for read/write splitting, using two SQLite files as primary and replica."""
+
+from pathlib import Path
+
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import applepy.session as session_module
+from applepy.db import Base, EngineRegistry
+from applepy.domains.offices.models import Office
+from applepy.replicas import ReplicaRouter
+from applepy.session import get_session
+from applepy.table_versions import TableVersion
+
+
+def _database(path: Path, office_code: str) -> str:
+    url = f"sqlite:///{path}"
+    engine = create_engine(url)
+    Base.metadata.create_all(
+        engine,
+        tables=[Office.__table__, TableVersion.__table__],  # type: ignore[list-item]
+    )
+    with Session(engine) as session:
+        session.add(Office(office_code=office_code, city="Replica Test"))
+        session.commit()
+    engine.dispose()
+    return url
+
+
+@pytest.fixture()
+def registry(tmp_path: Path) -> EngineRegistry:
+    """Registry with a primary and two replicas that each hold one office."""
+    registry = EngineRegistry()
+    registry.configure(url=_database(tmp_path / "primary.db", "PRIMARY"))
+    registry.configure("replica-a", url=_database(tmp_path / "a.db", "REPLICA"))
+    registry.configure("replica-b", url=_database(tmp_path / "b.db", "REPLICA"))
+    return registry
+
+
+def _codes(session: Session) -> set[str]:
+    return {office.office_code for office in session.query(Office)}
+
+
+def test_read_your_writes(
+    app: Flask,
+    registry: EngineRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that reads use the replica until the request commits a write."""
+    router = ReplicaRouter(registry)
+    router.configure([registry.options("replica-a")["url"]])
+    monkeypatch.setattr(session_module, "engines", registry)
+    monkeypatch.setattr(session_module, "router", router)
+
+    with app.test_request_context():
+        with get_session(read_only=True) as session:
+            assert _codes(session) == {"REPLICA"}
+
+        with get_session() as session:
+            session.add(Office(office_code="NEW", city="Replica Test"))
+            session.commit()
+
+        with get_session(read_only=True) as session:
+            assert _codes(session) == {"PRIMARY", "NEW"}
+
+    with app.test_request_context():
+        with get_session(read_only=True) as session:
+            assert _codes(session) == {"REPLICA"}
+
+
+def test_no_replicas_reads_primary(
+    registry: EngineRegistry, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that read-only sessions use the primary without replicas."""
+    monkeypatch.setattr(session_module, "engines", registry)
+    monkeypatch.setattr(session_module, "router", ReplicaRouter(registry))
+
+    with get_session(read_only=True) as session:
+        assert _codes(session) == {"PRIMARY"}
+
+
+def test_round_robin(registry: EngineRegistry) -> None:
+    """Test that round robin alternates between replicas."""
+    router = ReplicaRouter(registry)
+    router.configure(
+        [registry.options(name)["url"] for name in ("replica-a", "replica-b")]
+    )
+
+    chosen = [router.choose() for _ in range(4)]
+    assert chosen[0] is chosen[2]
+    assert chosen[1] is chosen[3]
+    assert chosen[0] is not chosen[1]
+
+
+def test_least_connections(registry: EngineRegistry) -> None:
+    """Test that least connections avoids the busier replica."""
+    router = ReplicaRouter(registry)
+    router.configure(
+        [registry.options(name)["url"] for name in ("replica-a", "replica-b")],
+        "least_connections",
+    )
+    busy, idle = (registry.get(name) for name in router.replica_names)
+
+    with busy.connect():
+        assert router.choose() is idle
+    with idle.connect():
+        assert router.choose() is busy
+
+
+def test_unknown_strategy(registry: EngineRegistry) -> None:
+    """Test that an unknown routing strategy is rejected."""
+    with pytest.raises(ValueError):
+        ReplicaRouter(registry).configure([], "random")  # type: ignore[arg-type]
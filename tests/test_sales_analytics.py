@@ -0,0 +1,205 @@
+"""Tests for sales analytics served from incrementally refreshed rollups."""
+
+import uuid
+from contextlib import contextmanager
+from typing import Any, Iterator
+from unittest.mock import patch
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from werkzeug.test import Client
+
+from applepy.cli import make_parser, run_command
+from applepy.domains.sales_rollups.models import StaleSalesMonth
+from applepy.domains.sales_rollups.service import SalesRollupService
+
+# Orders are dated in 2099 so no other sales fall in the queried months
+PERIOD = "from=2099-01&to=2099-12"
+
+
+def _sales(client: Client) -> tuple[int, str, list[str]]:
+    """Create two orders in January and February 2099.
+
+    Returns:
+        The January order's number, the product line and the product codes
+    """
+    response = client.post(
+        "/customers",
+        json={
+            "customer_name": "Analytics Co",
+            "contact_last_name": "Doe",
+            "contact_first_name": "Jane",
+            "phone": "+1-555-0100",
+            "address_line_1": "1 Analytics St",
+            "city": "Boston",
+            "country": "USA",
+        },
+    )
+    customer = response.json["data"]  # type: ignore[index]
+    product_line = f"Analytics {uuid.uuid4().hex[:6]}"
+    client.post("/product-lines", json={"product_line": product_line})
+    codes = [f"A{uuid.uuid4().hex[:8]}" for _ in range(2)]
+    for vendor, code in zip(["Vendor A", "Vendor B"], codes, strict=True):
+        client.post(
+            "/products",
+            json={
+                "product_code": code,
+                "product_name": f"Model {code}",
+                "product_line": product_line,
+                "product_scale": "1:18",
+                "product_vendor": vendor,
+                "product_description": "A model",
+                "quantity_in_stock": 10,
+                "buy_price": "10.00",
+                "msrp": "20.00",
+            },
+        )
+
+    numbers = []
+    for order_date, lines in [
+        ("2099-01-15", [(codes[0], 10, "2.00"), (codes[1], 5, "4.00")]),
+        ("2099-02-15", [(codes[0], 1, "3.00")]),
+    ]:
+        response = client.post(
+            "/orders",
+            json={
+                "order_date": order_date,
+                "required_date": order_date,
+                "status": "In Process",
+                "customer_number": customer["customer_number"],
+                "details": [
+                    {"product_code": code, "quantity_ordered": qty, "price_each": price}
+                    for code, qty, price in lines
+                ],
+            },
+        )
+        order = response.json["data"]  # type: ignore[index]
+        numbers.append(order["order_number"])
+    return numbers[0], product_line, codes
+
+
+def _get(client: Client, query: str) -> tuple[list[dict[str, Any]], str]:
+    response = client.get(f"/analytics/sales?{query}&{PERIOD}")
+    assert response.status_code == 200
+    items = response.json["data"]["items"]  # type: ignore[index]
+    return items, response.headers["X-Sales-Source"]
+
+
+def test_fresh_sales_by_month(client: Client) -> None:
+    """Test that fresh=true groups the order lines directly."""
+    _sales(client)
+
+    items, source = _get(client, "group_by=month&fresh=true")
+
+    assert source == "orders"
+    assert items == [
+        {"month": "2099-01", "revenue": "40.00", "units": 15, "order_count": 1},
+        {"month": "2099-02", "revenue": "3.00", "units": 1, "order_count": 1},
+    ]
+
+
+def test_rollups_follow_refresh(client: Client, db_session: Session) -> None:
+    """Test that rollups only include changes once their month is refreshed."""
+    _sales(client)
+    query = "group_by=month,product_vendor&measures=revenue,units"
+
+    items, source = _get(client, query)
+    assert (items, source) == ([], "rollups")
+
+    SalesRollupService(db_session).refresh()
+
+    items, source = _get(client, query)
+    assert source == "rollups"
+    assert items == _get(client, f"{query}&fresh=true")[0]
+    assert items == [
+        {
+            "month": "2099-01",
+            "product_vendor": "Vendor A",
+            "revenue": "20.00",
+            "units": 10,
+        },
+        {
+            "month": "2099-01",
+            "product_vendor": "Vendor B",
+            "revenue": "20.00",
+            "units": 5,
+        },
+        {
+            "month": "2099-02",
+            "product_vendor": "Vendor A",
+            "revenue": "3.00",
+            "units": 1,
+        },
+    ]
+    assert db_session.scalars(select(StaleSalesMonth)).all() == []
+
+
+def test_order_count_across_products_is_computed(
+    client: Client, db_session: Session
+) -> None:
+    """Test that order counts not split by product come from the orders."""
+    _sales(client)
+    SalesRollupService(db_session).refresh()
+
+    items, source = _get(client, "measures=order_count")
+    assert (items, source) == ([{"order_count": 2}], "orders")
+
+    items, source = _get(client, "group_by=product_line,product_vendor")
+    assert source == "rollups"
+    assert [item["order_count"] for item in items] == [2, 1]
+
+
+def test_moving_order_refreshes_both_months(
+    client: Client, db_session: Session
+) -> None:
+    """Test that changing an order's date marks its old and new months."""
+    order_number, _, _ = _sales(client)
+    SalesRollupService(db_session).refresh()
+
+    order = client.get(f"/orders/{order_number}").json["data"]  # type: ignore[index]
+    client.put(f"/orders/{order_number}", json={**order, "order_date": "2099-03-01"})
+
+    stale = db_session.execute(
+        select(StaleSalesMonth.year, StaleSalesMonth.month).order_by(
+            StaleSalesMonth.month
+        )
+    ).all()
+    assert [tuple(row) for row in stale] == [(2099, 1), (2099, 3)]
+
+    SalesRollupService(db_session).refresh()
+    items, _ = _get(client, "group_by=month&measures=revenue")
+    assert items == [
+        {"month": "2099-02", "revenue": "3.00"},
+        {"month": "2099-03", "revenue": "40.00"},
+    ]
+
+
+def test_invalid_parameters(client: Client) -> None:
+    """Test 400 for unknown names and malformed months."""
+    response = client.get("/analytics/sales?group_by=colour")
+    assert response.status_code == 400
+    assert "colour" in response.json["error"]  # type: ignore[index]
+
+    response = client.get("/analytics/sales?measures=profit")
+    assert response.status_code == 400
+
+    response = client.get("/analytics/sales?from=2099-13")
+    assert response.status_code == 400
+
+
+def test_refresh_command_full(client: Client, db_session: Session) -> None:
+    """Test that the CLI command recomputes every month."""
+    _sales(client)
+
+    args = make_parser().parse_args(["db:refresh-sales-rollups", "--full"])
+
+    @contextmanager
+    def test_session() -> Iterator[Session]:
+        yield db_session
+
+    with patch("applepy.session.get_session", test_session):
+        assert run_command(args) == 0
+
+    items, source = _get(client, "group_by=product_line,product_vendor")
+    assert source == "rollups"
+    assert [item["revenue"] for item in items] == ["23.00", "20.00"]
@@ -0,0 +1,107 @@
+"""Tests for single-pass record serialization."""
+
+import json
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from werkzeug.test import Client
+
+from applepy.domains.orders.schemas import OrderRecord
+from applepy.domains.payments.schemas import PaymentRecord
+from applepy.fieldsets import partial_schema
+from applepy.serialization import (
+    list_adapter,
+    list_json,
+    page_json,
+    record_json,
+    records_json,
+    validate_all,
+)
+
+
+class _Row:
+    """Stand-in for an ORM entity."""
+
+    def __init__(self, **values: object) -> None:
+        self.__dict__.update(values)
+
+
+ORDER: dict[str, Any] = {
+    "order_number": 10100,
+    "order_date": date(2003, 1, 6),
+    "required_date": date(2003, 1, 13),
+    "shipped_date": None,
+    "status": "Shipped",
+    "comments": None,
+    "customer_number": 363,
+}
+
+
+def test_validate_all_reads_attributes() -> None:
+    """Test that a list of entities is validated in one adapter call."""
+    records = validate_all(OrderRecord, [_Row(**ORDER), _Row(**ORDER)])
+    assert records == [OrderRecord(**ORDER), OrderRecord(**ORDER)]
+    assert list_adapter(OrderRecord) is list_adapter(OrderRecord)
+
+
+def test_list_json_matches_model_dump() -> None:
+    """Test that the encoded envelope matches the dumped pydantic models."""
+    record = OrderRecord(**ORDER)
+    body = json.loads(list_json([record]))
+    assert body == {
+        "data": {"items": [record.model_dump(mode="json")], "count": 1},
+        "error": None,
+        "message": None,
+    }
+    assert body["data"]["items"][0]["order_date"] == "2003-01-06"
+    assert json.loads(list_json([])) == {
+        "data": {"items": [], "count": 0},
+        "error": None,
+        "message": None,
+    }
+
+
+def test_page_and_record_json() -> None:
+    """Test the paginated and single-record envelopes."""
+    schema = partial_schema(OrderRecord, ("order_number", "status"))
+    record = schema(order_number=10100, status="Shipped")
+    assert json.loads(page_json([record], 10, "abc"))["data"] == {
+        "items": [{"order_number": 10100, "status": "Shipped"}],
+        "count": 1,
+        "page_size": 10,
+        "next_cursor": "abc",
+    }
+    assert json.loads(record_json(record))["data"] == {
+        "order_number": 10100,
+        "status": "Shipped",
+    }
+
+
+def test_records_json_encodes_decimals_as_strings() -> None:
+    """Test that bare arrays keep decimal precision."""
+    payment = PaymentRecord(
+        customer_number=103,
+        check_number="HQ336336",
+        payment_date=date(2004, 10, 19),
+        amount=Decimal("6066.78"),
+    )
+    assert json.loads(records_json(PaymentRecord, [payment])) == [
+        {
+            "customer_number": 103,
+            "check_number": "HQ336336",
+            "payment_date": "2004-10-19",
+            "amount": "6066.78",
+        }
+    ]
+
+
+def test_list_response_body(client: Client, test_office: dict) -> None:  # type: ignore[type-arg]
+    """Test that the list endpoint serves the encoded envelope."""
+    response = client.get("/offices")
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    body = response.json
+    assert body["error"] is None  # type: ignore[index]
+    assert test_office in body["data"]["items"]  # type: ignore[index]
+    assert body["data"]["count"] == len(body["data"]["items"])  # type: ignore[index]
@@ -1,5 +1,12 @@
 """Tests for database session management."""
 
+from pathlib import Path
+
+import pytest
+from flask import Flask
+from sqlalchemy import Engine, create_engine, text
+
+from applepy.db import install_pre_ping
 from applepy.session import get_session
 
 
@@ -52,3 +59,89 @@ def test_get_session_multiple_contexts() -> None:
             # Both should have query capability inside context
             assert hasattr(session1, "query")
             assert hasattr(session2, "query")
+
+
+def test_get_session_is_request_scoped(app: Flask) -> None:
+    """Test that a request shares one lazily created session until teardown."""
+    with app.app_context(), app.test_request_context():
+        with get_session() as first:
+            pass
+        with get_session(read_only=True) as second:
+            pass
+        # Creating the session does not check out a connection
+        assert first is second
+        assert not first.in_transaction()
+
+    with app.test_request_context():
+        with get_session() as other:
+            assert other is not first
+
+
+def test_request_session_closed_at_teardown(app: Flask) -> None:
+    """Test that teardown closes the request's sessions."""
+    with app.test_request_context():
+        with get_session() as session:
+            session.execute(text("SELECT 1"))
+            assert session.in_transaction()
+    assert not session.in_transaction()
+
+
+def test_request_session_rolls_back_on_error(app: Flask) -> None:
+    """Test that an exception rolls back the shared session."""
+    with app.test_request_context():
+        with pytest.raises(ValueError):
+            with get_session() as session:
+                session.execute(text("SELECT 1"))
+                raise ValueError("boom")
+        assert not session.in_transaction()
+
+
+def _pinging_engine(
+    tmp_path: Path, interval: float, monkeypatch: pytest.MonkeyPatch
+) -> tuple[Engine, list[object]]:
+    engine = create_engine(f"sqlite:///{tmp_path}/ping.db")
+    install_pre_ping(engine, interval)
+    pings: list[object] = []
+    monkeypatch.setattr(engine.dialect, "do_ping", pings.append)
+    return engine, pings
+
+
+def test_pre_ping_skipped_for_recent_connections(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that connections used within the interval are not pinged."""
+    engine, pings = _pinging_engine(tmp_path, 60.0, monkeypatch)
+    for _ in range(3):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    assert pings == []
+
+
+def test_pre_ping_after_idle_interval(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that connections idle longer than the interval are pinged."""
+    engine, pings = _pinging_engine(tmp_path, 0.0, monkeypatch)
+    with engine.connect():
+        pass
+    with engine.connect():
+        pass
+    assert len(pings) == 1
+
+
+def test_pre_ping_failure_reconnects(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a failed ping replaces the connection with a new one."""
+    engine = create_engine(f"sqlite:///{tmp_path}/ping.db")
+    install_pre_ping(engine, 0.0)
+    with engine.connect():
+        pass
+
+    def fail_once(dbapi_connection: object) -> bool:
+        monkeypatch.undo()
+        raise ConnectionError("server has gone away")
+
+    monkeypatch.setattr(engine.dialect, "do_ping", fail_once)
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT 1")).scalar() == 1
@@ -0,0 +1,87 @@
+"""Tests for NDJSON streaming of list endpoints."""
+
+import json
+import uuid
+
+import pytest
+from sqlalchemy.pool import QueuePool
+from werkzeug.test import Client
+
+from applepy.db import engines
+from applepy.flask import app
+
+NDJSON = {"Accept": "application/x-ndjson"}
+
+
+def test_stream_offices(client: Client, test_office: dict) -> None:  # type: ignore[type-arg]
+    """Test that offices stream as one JSON object per line."""
+    response = client.get("/offices", headers=NDJSON)
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+
+    lines = response.get_data(as_text=True).splitlines()
+    records = [json.loads(line) for line in lines]
+    assert test_office["office_code"] in {r["office_code"] for r in records}
+
+
+def test_list_offices_defaults_to_json(client: Client) -> None:
+    """Test that a wildcard Accept header keeps the regular JSON body."""
+    response = client.get("/offices", headers={"Accept": "*/*"})
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/json"
+    assert "items" in response.json["data"]  # type: ignore[index, operator]
+
+
+def test_stream_payments(client: Client) -> None:
+    """Test that composite-key payments stream as NDJSON."""
+    customer_response = client.post(
+        "/customers",
+        json={
+            "customer_name": "Stream Co",
+            "contact_last_name": "Doe",
+            "contact_first_name": "Jane",
+            "phone": "+1-555-0100",
+            "address_line_1": "1 Stream St",
+            "city": "Boston",
+            "country": "USA",
+        },
+    )
+    assert customer_response.status_code == 201
+    customer_number = customer_response.json["data"]["customer_number"]  # type: ignore[index]
+
+    check_number = f"CHK{uuid.uuid4().hex[:8]}"
+    payment_response = client.post(
+        "/payments",
+        json={
+            "customer_number": customer_number,
+            "check_number": check_number,
+            "payment_date": "2024-01-15",
+            "amount": "125.50",
+        },
+    )
+    assert payment_response.status_code == 201
+
+    response = client.get("/payments", headers=NDJSON)
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+
+    records = [json.loads(line) for line in response.get_data(as_text=True).split()]
+    assert check_number in {r["check_number"] for r in records}
+
+
+@pytest.mark.parametrize("path", ["/offices", "/payments", "/order-details"])
+def test_stream_returns_connection_to_pool(path: str) -> None:
+    """Test that a consumed stream checks its connection back in.
+
+    Uses the real get_session() and get_stream_session() rather than the
+    patched ones of the client fixture.
+    """
+    pool = engines.get().pool
+    assert isinstance(pool, QueuePool)
+
+    response = app.test_client().get(path, headers=NDJSON)
+    assert response.status_code == 200
+    response.get_data()
+    response.close()
+
+    assert pool.checkedout() == 0
@@ -0,0 +1,74 @@
+"""Tests for per-table change versions and version-based list ETags."""
+
+import uuid
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+from werkzeug.test import Client
+
+from applepy.domains.offices.models import Office
+from applepy.table_versions import versions
+
+
+def _office(code: str) -> Office:
+    return Office(office_code=code, city="Version City", country="USA")
+
+
+def test_commit_bumps_version(db_session: Session) -> None:
+    """Test that ORM and Core writes bump the table version once per commit."""
+    before = versions.read(db_session, ["offices"])["offices"]
+
+    db_session.add(_office(f"V{uuid.uuid4().hex[:6]}"))
+    db_session.add(_office(f"V{uuid.uuid4().hex[:6]}"))
+    db_session.commit()
+    assert versions.read(db_session, ["offices"])["offices"] == before + 1
+    assert versions.current("offices") == before + 1
+
+    db_session.execute(
+        insert(Office), [{"office_code": f"V{uuid.uuid4().hex[:6]}", "city": "X"}]
+    )
+    db_session.commit()
+    assert versions.read(db_session, ["offices"])["offices"] == before + 2
+
+
+def test_rollback_and_reads_do_not_bump(db_session: Session) -> None:
+    """Test that rolled-back writes and read-only commits leave versions alone."""
+    before = versions.read(db_session, ["offices", "customers"])
+
+    nested = db_session.begin_nested()
+    db_session.add(_office(f"V{uuid.uuid4().hex[:6]}"))
+    db_session.flush()
+    nested.rollback()
+    db_session.query(Office).first()
+    db_session.commit()
+
+    assert versions.read(db_session, ["offices", "customers"]) == before
+
+
+def test_list_etag_checked_without_list_query(
+    client: Client,
+    test_office: dict,  # type: ignore[type-arg]
+    db_session: Session,
+) -> None:
+    """Test that a matching list ETag costs one version lookup."""
+    etag = client.get("/offices?sort=city").headers["ETag"]
+
+    statements: list[str] = []
+
+    def capture(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        response = client.get("/offices?sort=city", headers={"If-None-Match": etag})
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    assert response.status_code == 304
+    assert len(statements) == 1
+    assert "table_versions" in statements[0]
+
+    # A different query string is a different representation
+    other = client.get("/offices?sort=-city", headers={"If-None-Match": etag})
+    assert other.status_code == 200
@@ -0,0 +1,128 @@
+"""Tests for the single-statement UPDATE and DELETE paths."""
+
+import uuid
+from typing import Iterator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from werkzeug.test import Client
+
+from applepy.domains.employees.models import Employee
+from applepy.domains.offices.models import Office
+from applepy.domains.payments.schemas import PaymentRecord
+from applepy.domains.payments.service import PaymentService
+from applepy.exceptions import NotFoundException
+from applepy.repositories.base import has_dependent_rows
+
+
+@pytest.fixture()
+def statements(db_session: Session) -> Iterator[list[str]]:
+    """Capture the SQL statements executed during a test.
+
+    The table version bump on commit (applepy.table_versions) is left out.
+    """
+    captured: list[str] = []
+
+    def capture(*args: object) -> None:
+        if "table_versions" not in str(args[2]):
+            captured.append(str(args[2]))
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    yield captured
+    event.remove(bind, "before_cursor_execute", capture)
+
+
+def test_has_dependent_rows() -> None:
+    """Test that only models with one-to-many relationships need the ORM path."""
+    assert has_dependent_rows(Employee)
+    assert not has_dependent_rows(Office)
+
+
+def test_full_update_is_one_statement(
+    client: Client,
+    test_office: dict,  # type: ignore[type-arg]
+    statements: list[str],
+) -> None:
+    """Test that a full PUT issues a single UPDATE and no SELECT."""
+    office_code = test_office["office_code"]
+    updated = {**test_office, "city": "Updated City"}
+
+    response = client.put(f"/offices/{office_code}", json=updated)
+
+    assert response.status_code == 200
+    assert response.json["data"]["city"] == "Updated City"  # type: ignore[index]
+    assert [s.split()[0] for s in statements] == ["UPDATE"]
+    assert client.get(f"/offices/{office_code}").json["data"] == updated  # type: ignore[index]
+
+
+def test_partial_update_returns_stored_values(client: Client) -> None:
+    """Test that a PUT omitting optional fields reports the stored values."""
+    name = f"Partial {uuid.uuid4().hex[:6]}"
+    product_line = {
+        "product_line": name,
+        "text_description": "Text",
+        "html_description": "<p>Html</p>",
+    }
+    client.post("/product-lines", json=product_line)
+
+    response = client.put(
+        f"/product-lines/{name}",
+        json={"product_line": name, "text_description": "New"},
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {**product_line, "text_description": "New"}  # type: ignore[index]
+
+
+def test_delete_is_one_statement(
+    client: Client,
+    test_office: dict,  # type: ignore[type-arg]
+    statements: list[str],
+) -> None:
+    """Test that DELETE issues a single DELETE and no SELECT."""
+    office_code = test_office["office_code"]
+
+    response = client.delete(f"/offices/{office_code}")
+
+    assert response.status_code == 204
+    assert [s.split()[0] for s in statements] == ["DELETE"]
+    assert client.get(f"/offices/{office_code}").status_code == 404
+
+
+def test_payment_writes(client: Client, db_session: Session) -> None:
+    """Test single-statement update and delete on composite keys."""
+    response = client.post(
+        "/customers",
+        json={
+            "customer_name": "Writes Co",
+            "contact_last_name": "Doe",
+            "contact_first_name": "Jane",
+            "phone": "+1-555-0100",
+            "address_line_1": "1 Main St",
+            "city": "Boston",
+            "country": "USA",
+        },
+    )
+    customer = response.json["data"]  # type: ignore[index]
+    payment = {
+        "customer_number": customer["customer_number"],
+        "check_number": "WR0001",
+        "payment_date": "2024-03-01",
+        "amount": "25.00",
+    }
+    client.post("/payments", json=payment)
+    url = f"/payments/{customer['customer_number']}/WR0001"
+
+    response = client.put(url, json={**payment, "amount": "30.00"})
+    assert response.status_code == 200
+    assert response.json["amount"] == "30.00"  # type: ignore[index]
+
+    assert client.delete(url).status_code == 200
+
+    service = PaymentService(db_session)
+    with pytest.raises(NotFoundException):
+        service.delete(customer["customer_number"], "WR0001")
+    with pytest.raises(NotFoundException):
+        service.update(PaymentRecord(**payment))